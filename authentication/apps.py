@@ -1,6 +1,14 @@
+import atexit
+
 from django.apps import AppConfig
 
 
 class AuthenticationConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "authentication"
+
+    def ready(self):
+        from authentication import signals  # noqa: F401
+        from authentication.login_history import writer
+
+        atexit.register(writer.drain)
@@ -0,0 +1,124 @@
+import hashlib
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken as BaseRefreshToken
+
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate):
+        capacity = max(capacity, 1)
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value):
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+
+class BlacklistFilter:
+    """
+    In-memory membership filter over the jtis of blacklisted tokens.
+
+    A negative answer is definitive for every row synced so far, so most
+    refreshes skip the blacklist query. Rows blacklisted by other processes
+    are pulled in incrementally at most every ``SYNC_INTERVAL`` seconds.
+
+    Syncing follows the highest id seen. A row whose transaction commits
+    after a higher id was synced lands in a gap below that mark, so gaps are
+    re-checked for ``SYNC_OVERLAP`` seconds, which must exceed the longest
+    transaction that blacklists a token.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    @property
+    def options(self):
+        return settings.TOKEN_BLACKLIST_FILTER
+
+    def reset(self):
+        with self._lock:
+            self._bloom = None
+            self._last_id = 0
+            self._gaps = []
+            self._synced_at = 0.0
+
+    def add(self, jti):
+        with self._lock:
+            if self._bloom is not None:
+                self._bloom.add(jti)
+
+    def might_contain(self, jti):
+        with self._lock:
+            if self._bloom is None:
+                self._rebuild()
+            elif time.monotonic() - self._synced_at >= self.options["SYNC_INTERVAL"]:
+                self._sync()
+            return jti in self._bloom
+
+    def _rebuild(self):
+        capacity = max(self.options["CAPACITY"], 2 * BlacklistedToken.objects.count())
+        self._bloom = BloomFilter(capacity, self.options["ERROR_RATE"])
+        self._capacity = capacity
+        self._last_id = 0
+        self._gaps = []
+        self._sync()
+
+    def _sync(self):
+        now = time.monotonic()
+        self._gaps = [
+            gap for gap in self._gaps if now - gap[2] < self.options["SYNC_OVERLAP"]
+        ]
+        condition = Q(id__gt=self._last_id)
+        for first, last, _ in self._gaps:
+            condition |= Q(id__range=(first, last))
+        rows = (
+            BlacklistedToken.objects.filter(condition)
+            .order_by("id")
+            .values_list("id", "token__jti")
+        )
+        for pk, jti in rows.iterator():
+            if pk > self._last_id:
+                if pk > self._last_id + 1:
+                    self._gaps.append((self._last_id + 1, pk - 1, now))
+                self._last_id = pk
+            # Gap rows may be seen again until the gap expires.
+            if jti not in self._bloom:
+                self._bloom.add(jti)
+        self._synced_at = now
+        if self._bloom.count > self._capacity:
+            self._rebuild()
+
+
+blacklist_filter = BlacklistFilter()
+
+
+class RefreshToken(BaseRefreshToken):
+    def check_blacklist(self):
+        if blacklist_filter.might_contain(self.payload[api_settings.JTI_CLAIM]):
+            super().check_blacklist()
@@ -0,0 +1,207 @@
+import logging
+import queue
+import threading
+import time
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from authentication.models import LoginDailyRollup, LoginHistory, UserAgent
+from authentication.signals import login_history_written
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class LoginHistoryWriter:
+    """
+    Buffer login events in memory and persist them with ``bulk_create``.
+
+    A daemon thread flushes whenever ``BATCH_SIZE`` events are queued or
+    ``FLUSH_INTERVAL`` seconds have passed. With ``ASYNC`` disabled (as in
+    tests) or when the queue is full, events are written synchronously.
+    """
+
+    def __init__(self):
+        self._queue = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def options(self):
+        return settings.LOGIN_HISTORY_WRITER
+
+    def record(self, user, ip_address=None, user_agent=None):
+        event = (
+            LoginHistory(
+                user=user, login_datetime=timezone.now(), ip_address=ip_address
+            ),
+            user_agent[:255] if user_agent else user_agent,
+        )
+        if not self.options["ASYNC"]:
+            self.write([event])
+            return
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.write([event])
+
+    def write(self, events):
+        with transaction.atomic():
+            agents = UserAgent.objects.intern(
+                user_agent for _, user_agent in events if user_agent is not None
+            )
+            for event, user_agent in events:
+                event.user_agent_id = agents.get(user_agent)
+            LoginHistory.objects.bulk_create([event for event, _ in events])
+            refresh_rollups(
+                {(event.user_id, utc_date(event.login_datetime)) for event, _ in events}
+            )
+        login_history_written.send(
+            sender=LoginHistory, user_ids={event.user_id for event, _ in events}
+        )
+
+    def drain(self, timeout=10):
+        """Stop the background thread and persist every queued event."""
+        with self._lock:
+            thread, events = self._thread, self._queue
+            self._thread = None
+        if thread is None:
+            return
+        events.put(_STOP)
+        thread.join(timeout)
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._queue = queue.Queue(maxsize=self.options["MAX_QUEUE_SIZE"])
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(self._queue,),
+                    name="login-history-writer",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self, events):
+        stopping = False
+        while not stopping:
+            batch, stopping = self._collect(events)
+            if batch:
+                try:
+                    self.write(batch)
+                except Exception:
+                    logger.exception("Dropped %d login history events", len(batch))
+                finally:
+                    connection.close()
+
+    def _collect(self, events):
+        batch = []
+        try:
+            item = events.get()
+            deadline = time.monotonic() + self.options["FLUSH_INTERVAL"]
+            while item is not _STOP:
+                batch.append(item)
+                if len(batch) >= self.options["BATCH_SIZE"]:
+                    break
+                timeout = deadline - time.monotonic()
+                item = events.get(timeout=max(timeout, 0))
+        except queue.Empty:
+            return batch, False
+        return batch, item is _STOP
+
+
+def utc_date(value):
+    return value.astimezone(dt_timezone.utc).date()
+
+
+def utc_day_start(date):
+    return datetime.combine(date, datetime.min.time(), tzinfo=dt_timezone.utc)
+
+
+def daily_aggregates(queryset):
+    return (
+        queryset.annotate(date=TruncDate("login_datetime", tzinfo=dt_timezone.utc))
+        .values("user_id", "date")
+        .annotate(
+            login_count=Count("id"),
+            distinct_ips=Count("ip_address", distinct=True),
+            distinct_user_agents=Count("user_agent", distinct=True),
+        )
+        .order_by("user_id", "date")
+    )
+
+
+def save_rollups(rows):
+    LoginDailyRollup.objects.bulk_create(
+        [LoginDailyRollup(**row) for row in rows],
+        update_conflicts=True,
+        unique_fields=["user", "date"],
+        update_fields=["login_count", "distinct_ips", "distinct_user_agents"],
+    )
+
+
+def refresh_rollups(user_days):
+    """Recompute the rollups of the given ``(user_id, date)`` pairs."""
+    if not user_days:
+        return
+    ranges = {}
+    for user_id, date in user_days:
+        start, end = ranges.get(user_id, (date, date))
+        ranges[user_id] = (min(start, date), max(end, date))
+    condition = Q()
+    for user_id, (start, end) in ranges.items():
+        condition |= Q(
+            user_id=user_id,
+            login_datetime__gte=utc_day_start(start),
+            login_datetime__lt=utc_day_start(end + timedelta(days=1)),
+        )
+    save_rollups(list(daily_aggregates(LoginHistory.objects.filter(condition))))
+
+
+def compact(before, batch_size=1000):
+    """
+    Fold raw rows older than the UTC day of ``before`` into the rollups and
+    delete them. Returns ``(rollups_written, rows_deleted)``.
+
+    Work proceeds ``batch_size`` users at a time, and each batch writes its
+    rollups and deletes its raw rows in one transaction. An interrupted run
+    therefore never leaves a day whose rollup a later run would recompute
+    from only part of its rows.
+    """
+    cutoff = utc_day_start(utc_date(before))
+    expired = LoginHistory.objects.filter(login_datetime__lt=cutoff)
+    rolled_up = deleted = 0
+    last_user_id = 0
+    while True:
+        user_ids = list(
+            expired.filter(user_id__gt=last_user_id)
+            .order_by("user_id")
+            .values_list("user_id", flat=True)
+            .distinct()[:batch_size]
+        )
+        if not user_ids:
+            return rolled_up, deleted
+        last_user_id = user_ids[-1]
+        batch = expired.filter(user_id__in=user_ids)
+        with transaction.atomic():
+            rows = list(daily_aggregates(batch))
+            save_rollups(rows)
+            rolled_up += len(rows)
+            deleted += batch.delete()[0]
+
+
+writer = LoginHistoryWriter()
+
+
+def record_login(user, ip_address=None, user_agent=None):
+    writer.record(user, ip_address=ip_address, user_agent=user_agent)
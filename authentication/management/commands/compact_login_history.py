@@ -0,0 +1,31 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from authentication.login_history import compact
+
+
+class Command(BaseCommand):
+    help = "Roll up and delete raw login history older than the retention window."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, default=settings.LOGIN_HISTORY_RETENTION_DAYS
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Users compacted per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        before = timezone.now() - timedelta(days=options["days"])
+        rolled_up, deleted = compact(before, batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Wrote {rolled_up} daily rollups and deleted {deleted} rows."
+            )
+        )
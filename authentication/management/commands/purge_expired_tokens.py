@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from authentication.blacklist import blacklist_filter
+
+
+class Command(BaseCommand):
+    help = "Delete expired outstanding and blacklisted tokens in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        expired = OutstandingToken.objects.filter(expires_at__lt=timezone.now())
+        deleted = 0
+        while ids := list(
+            expired.order_by("id").values_list("id", flat=True)[: options["batch_size"]]
+        ):
+            deleted += OutstandingToken.objects.filter(id__in=ids).delete()[0]
+        blacklist_filter.reset()
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} expired token rows."))
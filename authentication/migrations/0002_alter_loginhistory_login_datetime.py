@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-18 20:42
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="loginhistory",
+            name="login_datetime",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2 on 2026-10-18 20:44
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0002_alter_loginhistory_login_datetime"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LoginDailyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("login_count", models.PositiveIntegerField(default=0)),
+                ("distinct_ips", models.PositiveIntegerField(default=0)),
+                ("distinct_user_agents", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "ordering": ["-date"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="loginhistory",
+            index=models.Index(
+                fields=["user", "-login_datetime"], name="login_history_user_time_idx"
+            ),
+        ),
+        migrations.AddField(
+            model_name="logindailyrollup",
+            name="user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="login_rollups",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="logindailyrollup",
+            constraint=models.UniqueConstraint(
+                fields=("user", "date"), name="unique_login_rollup_per_user_day"
+            ),
+        ),
+    ]
@@ -0,0 +1,99 @@
+# Generated by Django 5.2 on 2026-10-18 21:30
+
+import hashlib
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+CHUNK_SIZE = 5000
+
+
+def intern_user_agents(apps, schema_editor):
+    LoginHistory = apps.get_model("authentication", "LoginHistory")
+    UserAgent = apps.get_model("authentication", "UserAgent")
+    agent_ids = {}
+    last_id = 0
+    while rows := list(
+        LoginHistory.objects.filter(id__gt=last_id, user_agent__isnull=False)
+        .order_by("id")
+        .values_list("id", "user_agent")[:CHUNK_SIZE]
+    ):
+        last_id = rows[-1][0]
+        missing = {
+            hashlib.sha256(value.encode()).hexdigest(): value
+            for _, value in rows
+            if value not in agent_ids
+        }
+        if missing:
+            UserAgent.objects.bulk_create(
+                [
+                    UserAgent(value_hash=value_hash, value=value)
+                    for value_hash, value in missing.items()
+                ],
+                ignore_conflicts=True,
+            )
+            agent_ids.update(
+                (missing[value_hash], pk)
+                for value_hash, pk in UserAgent.objects.filter(
+                    value_hash__in=missing
+                ).values_list("value_hash", "id")
+            )
+        ids_by_agent = {}
+        for pk, value in rows:
+            ids_by_agent.setdefault(agent_ids[value], []).append(pk)
+        for agent_id, ids in ids_by_agent.items():
+            LoginHistory.objects.filter(id__in=ids).update(user_agent_ref=agent_id)
+
+
+def restore_user_agents(apps, schema_editor):
+    LoginHistory = apps.get_model("authentication", "LoginHistory")
+    UserAgent = apps.get_model("authentication", "UserAgent")
+    for agent_id, value in UserAgent.objects.values_list("id", "value").iterator():
+        LoginHistory.objects.filter(user_agent_ref=agent_id).update(user_agent=value)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0003_loginhistory_rollups_and_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserAgent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("value_hash", models.CharField(max_length=64, unique=True)),
+                ("value", models.CharField(max_length=255)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="loginhistory",
+            name="user_agent_ref",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="authentication.useragent",
+            ),
+        ),
+        migrations.RunPython(intern_user_agents, restore_user_agents),
+        migrations.RemoveField(
+            model_name="loginhistory",
+            name="user_agent",
+        ),
+        migrations.RenameField(
+            model_name="loginhistory",
+            old_name="user_agent_ref",
+            new_name="user_agent",
+        ),
+    ]
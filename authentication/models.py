@@ -1,17 +1,84 @@
+import hashlib
+
 from django.contrib.auth.models import User
 from django.db import models
+from django.utils import timezone
+
+
+class UserAgentManager(models.Manager):
+    def intern(self, values):
+        """Return ``{value: id}`` for ``values``, creating missing rows."""
+        hashes = {UserAgent.hash_value(value): value for value in set(values)}
+        if not hashes:
+            return {}
+        found = dict(self.filter(value_hash__in=hashes).values_list("value_hash", "id"))
+        missing = [
+            UserAgent(value_hash=value_hash, value=value)
+            for value_hash, value in hashes.items()
+            if value_hash not in found
+        ]
+        if missing:
+            self.bulk_create(missing, ignore_conflicts=True)
+            found.update(
+                self.filter(
+                    value_hash__in=[agent.value_hash for agent in missing]
+                ).values_list("value_hash", "id")
+            )
+        return {hashes[value_hash]: pk for value_hash, pk in found.items()}
+
+
+class UserAgent(models.Model):
+    value_hash = models.CharField(max_length=64, unique=True)
+    value = models.CharField(max_length=255)
+
+    objects = UserAgentManager()
+
+    @staticmethod
+    def hash_value(value):
+        return hashlib.sha256(value.encode()).hexdigest()
+
+    def __str__(self):
+        return self.value
 
 
 class LoginHistory(models.Model):
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="login_history"
     )
-    login_datetime = models.DateTimeField(auto_now_add=True)
+    login_datetime = models.DateTimeField(default=timezone.now)
     ip_address = models.GenericIPAddressField(null=True, blank=True)
-    user_agent = models.CharField(max_length=255, null=True, blank=True)
+    user_agent = models.ForeignKey(
+        UserAgent, on_delete=models.PROTECT, related_name="+", null=True, blank=True
+    )
 
     class Meta:
         ordering = ["-login_datetime"]
+        indexes = [
+            models.Index(
+                fields=["user", "-login_datetime"], name="login_history_user_time_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.login_datetime}"
+
+
+class LoginDailyRollup(models.Model):
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="login_rollups"
+    )
+    date = models.DateField()
+    login_count = models.PositiveIntegerField(default=0)
+    distinct_ips = models.PositiveIntegerField(default=0)
+    distinct_user_agents = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["-date"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "date"], name="unique_login_rollup_per_user_day"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} - {self.date}"
@@ -0,0 +1,72 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+
+
+class PoolSaturated(Exception):
+    pass
+
+
+class HashingPool:
+    """
+    Bounded pool for the password hashing done by register and login.
+
+    PBKDF2 releases the GIL, so worker threads hash in parallel while the
+    event loop keeps serving. At most ``MAX_PENDING`` calls may be queued or
+    running; beyond that :class:`PoolSaturated` is raised so the caller can
+    shed load. With ``MAX_WORKERS`` set to 0 calls run through the shared
+    sync thread instead.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._slots = None
+
+    @property
+    def options(self):
+        return settings.AUTH_HASHING_POOL
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.options["MAX_WORKERS"],
+                    thread_name_prefix="auth-hashing",
+                )
+                self._slots = threading.BoundedSemaphore(self.options["MAX_PENDING"])
+
+    async def run(self, func, *args, **kwargs):
+        if self.options["MAX_WORKERS"] <= 0:
+            if self.options["MAX_PENDING"] <= 0:
+                raise PoolSaturated
+            return await sync_to_async(func)(*args, **kwargs)
+        self._ensure_started()
+        if not self._slots.acquire(blocking=False):
+            raise PoolSaturated
+        try:
+            return await sync_to_async(
+                self._call, thread_sensitive=False, executor=self._executor
+            )(func, *args, **kwargs)
+        finally:
+            self._slots.release()
+
+    @staticmethod
+    def _call(func, *args, **kwargs):
+        close_old_connections()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+pool = HashingPool()
@@ -1,7 +1,10 @@
 from django.contrib.auth.models import User
 from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
+from rest_framework_simplejwt.serializers import \
+    TokenRefreshSerializer as BaseTokenRefreshSerializer
 
+from .blacklist import RefreshToken
 from .models import LoginHistory
 
 
@@ -48,7 +51,13 @@ class UserSerializer(serializers.ModelSerializer):
 
 
 class LoginHistorySerializer(serializers.ModelSerializer):
+    user_agent = serializers.StringRelatedField()
+
     class Meta:
         model = LoginHistory
         fields = ["id", "login_datetime", "ip_address", "user_agent"]
         read_only_fields = fields
+
+
+class TokenRefreshSerializer(BaseTokenRefreshSerializer):
+    token_class = RefreshToken
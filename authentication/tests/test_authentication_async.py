@@ -0,0 +1,104 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from authentication.models import LoginHistory
+from authentication.offload import pool
+from core.tests import AuthenticationTestCase
+
+REGISTRATION = {
+    "username": "newuser",
+    "email": "new@example.com",
+    "password": "NewPass123!",
+    "password2": "NewPass123!",
+    "first_name": "New",
+    "last_name": "User",
+}
+
+
+def pool_settings(**options):
+    return override_settings(
+        AUTH_HASHING_POOL={**settings.AUTH_HASHING_POOL, **options}
+    )
+
+
+@pool_settings(MAX_WORKERS=0)
+class AsyncAuthenticationViewsTest(AuthenticationTestCase):
+    def test_async_registration(self):
+        url = reverse("authentication:auth_register_async")
+        response = self.client.post(url, REGISTRATION, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(
+            User.objects.get(username="newuser").check_password("NewPass123!")
+        )
+
+    def test_async_registration_validation_errors(self):
+        url = reverse("authentication:auth_register_async")
+        response = self.client.post(
+            url, {**REGISTRATION, "password2": "x!"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("password", response.json())
+        self.assertFalse(User.objects.filter(username="newuser").exists())
+
+    def test_async_token_obtain(self):
+        url = reverse("authentication:token_obtain_pair_async")
+        data = {
+            "username": self.test_user.username,
+            "password": self.test_user_password,
+        }
+        response = self.client.post(url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.json()), {"access", "refresh"})
+        self.assertEqual(LoginHistory.objects.get().user, self.test_user)
+
+    def test_async_token_obtain_rejects_bad_password(self):
+        url = reverse("authentication:token_obtain_pair_async")
+        data = {"username": self.test_user.username, "password": "wrong"}
+        response = self.client.post(url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @pool_settings(MAX_WORKERS=0, MAX_PENDING=0)
+    def test_saturated_pool_sheds_load(self):
+        url = reverse("authentication:token_obtain_pair_async")
+        response = self.client.post(url, {}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response["Retry-After"], "1")
+
+
+@override_settings(
+    LOGIN_HISTORY_WRITER={**settings.LOGIN_HISTORY_WRITER, "ASYNC": False}
+)
+@pool_settings(MAX_WORKERS=2)
+class HashingPoolTest(TransactionTestCase):
+    def setUp(self):
+        self.addCleanup(pool.shutdown)
+
+    def test_registration_and_login_on_worker_threads(self):
+        client = APIClient()
+        response = client.post(
+            reverse("authentication:auth_register_async"), REGISTRATION, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response = client.post(
+            reverse("authentication:token_obtain_pair_async"),
+            {"username": "newuser", "password": "NewPass123!"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(LoginHistory.objects.count(), 1)
+
+    def test_offloaded_queries_are_recorded(self):
+        User.objects.create_user(username="newuser", password="NewPass123!")
+        response = APIClient().post(
+            reverse("authentication:token_obtain_pair_async"),
+            {"username": "newuser", "password": "NewPass123!"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        db = response["Server-Timing"].split(", ")[0]
+        queries = int(db.split('desc="')[1].split()[0])
+        self.assertGreater(queries, 0)
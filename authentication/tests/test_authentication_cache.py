@@ -0,0 +1,53 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from authentication.authentication import user_cache
+from blog.tests.test_blog_views import AuthenticatedUserTestCase
+
+
+class CachedJWTAuthenticationTest(AuthenticatedUserTestCase):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse("authentication:login_history")
+
+    def test_user_lookup_is_cached(self):
+        user_cache.clear()
+        self.client.get(self.url)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        snapshot = user_cache.snapshot()
+        self.assertEqual((snapshot["hits"], snapshot["misses"]), (1, 1))
+        self.assertEqual(snapshot["hit_rate"], 0.5)
+
+    def test_user_save_invalidates_cache(self):
+        self.client.get(self.url)
+        self.test_user.is_active = False
+        self.test_user.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_user_delete_invalidates_cache(self):
+        self.client.get(self.url)
+        self.test_user.delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_cached_user_is_not_shared(self):
+        self.client.get(self.url)
+        user = user_cache.get(self.test_user.id)
+        user.first_name = "Changed"
+        self.assertNotEqual(user_cache.get(self.test_user.id).first_name, "Changed")
+
+    @override_settings(AUTH_USER_CACHE={"MAX_SIZE": 1, "TIMEOUT": 60})
+    def test_cache_is_bounded(self):
+        user_cache.set(1, self.test_user)
+        user_cache.set(2, self.test_user)
+        self.assertIsNone(user_cache.get(1))
+        self.assertEqual(user_cache.snapshot()["evictions"], 1)
+
+    @override_settings(AUTH_USER_CACHE={"MAX_SIZE": 10, "TIMEOUT": 0})
+    def test_entries_expire(self):
+        user_cache.set(self.test_user.id, self.test_user)
+        self.assertIsNone(user_cache.get(self.test_user.id))
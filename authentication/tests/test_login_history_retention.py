@@ -0,0 +1,127 @@
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from authentication import login_history
+from authentication.login_history import compact, writer
+from authentication.models import LoginDailyRollup, LoginHistory, UserAgent
+from core.tests import AuthenticationTestCase
+
+
+def at(day, hour=12):
+    return datetime(2024, 1, day, hour, tzinfo=dt_timezone.utc)
+
+
+class LoginHistoryRollupTest(AuthenticationTestCase):
+    def add_logins(self, *rows):
+        agents = UserAgent.objects.intern(agent for _, _, agent in rows)
+        return LoginHistory.objects.bulk_create(
+            [
+                LoginHistory(
+                    user=self.test_user,
+                    login_datetime=when,
+                    ip_address=ip,
+                    user_agent_id=agents[agent],
+                )
+                for when, ip, agent in rows
+            ]
+        )
+
+    def test_writer_maintains_daily_rollup(self):
+        writer.record(self.test_user, "10.0.0.1", "a")
+        writer.record(self.test_user, "10.0.0.1", "b")
+        writer.record(self.test_user, "10.0.0.2", "b")
+        rollup = LoginDailyRollup.objects.get(user=self.test_user)
+        self.assertEqual(rollup.date, timezone.now().astimezone(dt_timezone.utc).date())
+        self.assertEqual(rollup.login_count, 3)
+        self.assertEqual(rollup.distinct_ips, 2)
+        self.assertEqual(rollup.distinct_user_agents, 2)
+
+    def test_compact_rolls_up_and_deletes_old_rows(self):
+        self.add_logins(
+            (at(1, 1), "10.0.0.1", "a"),
+            (at(1, 23), "10.0.0.2", "a"),
+            (at(2), "10.0.0.1", "a"),
+            (at(3), "10.0.0.1", "a"),
+        )
+        rolled_up, deleted = compact(at(3, 18), batch_size=1)
+        self.assertEqual((rolled_up, deleted), (2, 3))
+        self.assertEqual(
+            list(LoginHistory.objects.values_list("login_datetime", flat=True)),
+            [at(3)],
+        )
+        rollups = {
+            rollup.date.day: (rollup.login_count, rollup.distinct_ips)
+            for rollup in LoginDailyRollup.objects.all()
+        }
+        self.assertEqual(rollups, {1: (2, 2), 2: (1, 1)})
+
+    def test_interrupted_compaction_keeps_complete_rollups(self):
+        other = User.objects.create_user(username="other", password="x")
+        self.add_logins((at(1, 1), "10.0.0.1", "a"), (at(1, 2), "10.0.0.2", "a"))
+        LoginHistory.objects.create(
+            user=other, login_datetime=at(1), ip_address="1.1.1.1"
+        )
+        save_rollups = login_history.save_rollups
+        calls = []
+
+        def fail_second_batch(rows):
+            calls.append(rows)
+            if len(calls) == 2:
+                raise RuntimeError("interrupted")
+            save_rollups(rows)
+
+        with mock.patch.object(login_history, "save_rollups", fail_second_batch):
+            with self.assertRaises(RuntimeError):
+                compact(at(2), batch_size=1)
+        self.assertEqual(LoginHistory.objects.filter(user=self.test_user).count(), 0)
+        self.assertEqual(LoginHistory.objects.filter(user=other).count(), 1)
+
+        self.assertEqual(compact(at(2), batch_size=1), (1, 1))
+        rollups = dict(LoginDailyRollup.objects.values_list("user_id", "login_count"))
+        self.assertEqual(rollups, {self.test_user.pk: 2, other.pk: 1})
+
+    def test_compact_command(self):
+        self.add_logins((timezone.now() - timedelta(days=100), "10.0.0.1", "a"))
+        out = StringIO()
+        call_command("compact_login_history", "--days=90", stdout=out)
+        self.assertIn("deleted 1 rows", out.getvalue())
+        self.assertFalse(LoginHistory.objects.exists())
+        self.assertEqual(LoginDailyRollup.objects.get().login_count, 1)
+
+
+class LoginHistoryPaginationTest(AuthenticationTestCase):
+    def test_login_history_cursor_pagination(self):
+        LoginHistory.objects.bulk_create(
+            [
+                LoginHistory(
+                    user=self.test_user,
+                    login_datetime=at(1 + i % 3),
+                    ip_address="10.0.0.1",
+                )
+                for i in range(5)
+            ]
+        )
+        self.client.force_authenticate(self.test_user)
+        url = reverse("authentication:login_history")
+        expected = list(
+            LoginHistory.objects.order_by("-login_datetime", "-id").values_list(
+                "id", flat=True
+            )
+        )
+        ids = []
+        response = self.client.get(url, {"page_size": 2})
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids += [row["id"] for row in response.json()["results"]]
+            if not response.json()["next"]:
+                break
+            response = self.client.get(response.json()["next"])
+        self.assertEqual(ids, expected)
@@ -2,7 +2,7 @@ from django.contrib.auth.models import User
 from django.urls import reverse
 from rest_framework import status
 
-from authentication.models import LoginHistory
+from authentication.models import LoginHistory, UserAgent
 from core.tests import AuthenticationTestCase
 
 
@@ -41,3 +41,43 @@ class LoginHistoryViewsTest(AuthenticationTestCase):
             }
         ]
         self.assertEqual(response.json(), expected)
+
+    def test_login_history_not_created_for_failed_login(self):
+        token_url = reverse("authentication:token_obtain_pair")
+        token_data = {
+            "username": f"{self.test_user.username}",
+            "password": "wrong",
+        }
+        token_response = self.client.post(token_url, token_data, format="json")
+        self.assertEqual(token_response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(LoginHistory.objects.count(), 0)
+
+    def test_user_agents_are_interned(self):
+        token_url = reverse("authentication:token_obtain_pair")
+        token_data = {
+            "username": f"{self.test_user.username}",
+            "password": f"{self.test_user_password}",
+        }
+        for user_agent in ("agent/1.0", "agent/1.0", "agent/2.0"):
+            self.client.post(
+                token_url, token_data, format="json", HTTP_USER_AGENT=user_agent
+            )
+        self.assertEqual(LoginHistory.objects.count(), 3)
+        self.assertEqual(
+            sorted(UserAgent.objects.values_list("value", flat=True)),
+            ["agent/1.0", "agent/2.0"],
+        )
+        self.client.force_authenticate(self.test_user)
+        url = reverse("authentication:login_history")
+        with self.assertNumQueries(1):
+            response = self.client.get(url, format="json")
+        self.assertEqual(
+            [row["user_agent"] for row in response.json()],
+            ["agent/2.0", "agent/1.0", "agent/1.0"],
+        )
+
+    def test_missing_user_agent_is_null(self):
+        LoginHistory.objects.create(user=self.test_user)
+        self.client.force_authenticate(self.test_user)
+        response = self.client.get(reverse("authentication:login_history"))
+        self.assertIsNone(response.json()[0]["user_agent"])
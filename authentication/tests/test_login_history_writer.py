@@ -0,0 +1,65 @@
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.test import TransactionTestCase, override_settings
+
+from authentication.login_history import LoginHistoryWriter
+from authentication.models import LoginHistory
+from authentication.signals import login_history_written
+
+
+def writer_settings(**options):
+    return override_settings(
+        LOGIN_HISTORY_WRITER={**settings.LOGIN_HISTORY_WRITER, **options}
+    )
+
+
+class LoginHistoryWriterTest(TransactionTestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="writer", password="x")
+        self.writer = LoginHistoryWriter()
+        self.addCleanup(self.writer.drain)
+        # Wait for the writer's signal rather than polling: the shared
+        # in-memory test database raises instead of waiting on table locks.
+        self.written = threading.Event()
+        login_history_written.connect(self.on_written)
+        self.addCleanup(login_history_written.disconnect, self.on_written)
+
+    def on_written(self, **kwargs):
+        self.written.set()
+
+    def wait_for(self, count, timeout=5):
+        self.assertTrue(self.written.wait(timeout))
+        return LoginHistory.objects.count()
+
+    @writer_settings(ASYNC=False)
+    def test_sync_mode_writes_immediately(self):
+        self.writer.record(self.user, "127.0.0.1", "agent")
+        login_history = LoginHistory.objects.get()
+        self.assertEqual(login_history.user, self.user)
+        self.assertEqual(login_history.user_agent.value, "agent")
+
+    @writer_settings(ASYNC=True, BATCH_SIZE=3, FLUSH_INTERVAL=60)
+    def test_flushes_when_batch_is_full(self):
+        for _ in range(3):
+            self.writer.record(self.user, "127.0.0.1", "agent")
+        self.assertEqual(self.wait_for(3), 3)
+
+    @writer_settings(ASYNC=True, BATCH_SIZE=100, FLUSH_INTERVAL=0.05)
+    def test_flushes_after_interval(self):
+        self.writer.record(self.user, "127.0.0.1", "agent")
+        self.assertEqual(self.wait_for(1), 1)
+
+    @writer_settings(ASYNC=True, BATCH_SIZE=100, FLUSH_INTERVAL=60)
+    def test_drain_persists_queued_events(self):
+        before = time.time()
+        for _ in range(5):
+            self.writer.record(self.user, "10.0.0.1", "x" * 300)
+        self.assertEqual(LoginHistory.objects.count(), 0)
+        self.writer.drain()
+        self.assertEqual(LoginHistory.objects.count(), 5)
+        login_history = LoginHistory.objects.first()
+        self.assertEqual(len(login_history.user_agent.value), 255)
+        self.assertGreaterEqual(login_history.login_datetime.timestamp(), before)
@@ -0,0 +1,93 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework_simplejwt.token_blacklist.models import (BlacklistedToken,
+                                                             OutstandingToken)
+
+from authentication.blacklist import BloomFilter, RefreshToken
+from core.tests import AuthenticationTestCase
+
+
+class BloomFilterTest(AuthenticationTestCase):
+    def test_membership(self):
+        bloom = BloomFilter(1000, 0.001)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+        self.assertTrue(all(f"jti-{i}" in bloom for i in range(1000)))
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+        self.assertLess(false_positives, 50)
+
+
+class TokenBlacklistFilterTest(AuthenticationTestCase):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse("authentication:token_refresh")
+
+    def refresh(self, token):
+        return self.client.post(self.url, {"refresh": str(token)}, format="json")
+
+    def test_refresh_skips_blacklist_query_for_unknown_token(self):
+        token = RefreshToken.for_user(self.test_user)
+        self.refresh(RefreshToken.for_user(self.test_user))
+        with CaptureQueriesContext(connection) as context:
+            response = self.refresh(token)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(any("blacklistedtoken" in query["sql"] for query in context))
+        self.assertIn("refresh", response.json())
+
+    def test_blacklisted_token_is_rejected(self):
+        token = RefreshToken.for_user(self.test_user)
+        self.refresh(RefreshToken.for_user(self.test_user))
+        token.blacklist()
+        response = self.refresh(token)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(
+        TOKEN_BLACKLIST_FILTER={**settings.TOKEN_BLACKLIST_FILTER, "SYNC_INTERVAL": 0}
+    )
+    def test_tokens_blacklisted_elsewhere_are_synced(self):
+        token = RefreshToken.for_user(self.test_user)
+        self.refresh(RefreshToken.for_user(self.test_user))
+        outstanding = OutstandingToken.objects.get(jti=token["jti"])
+        BlacklistedToken.objects.bulk_create([BlacklistedToken(token=outstanding)])
+        response = self.refresh(token)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(
+        TOKEN_BLACKLIST_FILTER={**settings.TOKEN_BLACKLIST_FILTER, "SYNC_INTERVAL": 0}
+    )
+    def test_rows_committed_below_the_synced_id_are_found(self):
+        early, late = (RefreshToken.for_user(self.test_user) for _ in range(2))
+        outstanding = OutstandingToken.objects.in_bulk(
+            [early["jti"], late["jti"]], field_name="jti"
+        )
+        BlacklistedToken.objects.bulk_create(
+            [BlacklistedToken(id=1000, token=outstanding[early["jti"]])]
+        )
+        self.assertEqual(self.refresh(early).status_code, status.HTTP_401_UNAUTHORIZED)
+        BlacklistedToken.objects.bulk_create(
+            [BlacklistedToken(id=500, token=outstanding[late["jti"]])]
+        )
+        response = self.refresh(late)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_purge_expired_tokens(self):
+        token = RefreshToken.for_user(self.test_user)
+        token.blacklist()
+        RefreshToken.for_user(self.test_user)
+        OutstandingToken.objects.filter(jti=token["jti"]).update(
+            expires_at=timezone.now() - timedelta(seconds=1)
+        )
+        out = StringIO()
+        call_command("purge_expired_tokens", "--batch-size=1", stdout=out)
+        self.assertIn("Deleted 2 expired token rows.", out.getvalue())
+        self.assertEqual(OutstandingToken.objects.count(), 1)
+        self.assertFalse(BlacklistedToken.objects.exists())
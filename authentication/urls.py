@@ -2,13 +2,20 @@ from django.urls import path
 from rest_framework_simplejwt.views import (TokenObtainPairView,
                                             TokenRefreshView)
 
-from .views import (CustomTokenObtainPairView, LoginHistoryView, RegisterView,
+from .views import (AsyncRegisterView, AsyncTokenObtainPairView,
+                    CustomTokenObtainPairView, LoginHistoryView, RegisterView,
                     UserProfileView)
 
 urlpatterns = [
     path("token/", CustomTokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    path(
+        "token/async/",
+        AsyncTokenObtainPairView.as_view(),
+        name="token_obtain_pair_async",
+    ),
     path("register/", RegisterView.as_view(), name="auth_register"),
+    path("register/async/", AsyncRegisterView.as_view(), name="auth_register_async"),
     path("profile/", UserProfileView.as_view(), name="auth_profile"),
     path("login-history/", LoginHistoryView.as_view(), name="login_history"),
 ]
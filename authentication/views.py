@@ -1,33 +1,45 @@
 from django.contrib.auth.models import User
+from django.http import JsonResponse
+from django.utils.decorators import classonlymethod
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework import generics, permissions, status
+from rest_framework.exceptions import APIException
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.tokens import AccessToken
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework_simplejwt.views import TokenObtainPairView
 
+from core import metrics
+from core.middleware import record_request_queries
+from core.pagination import KeysetPagination
+
+from .login_history import record_login
 from .models import LoginHistory
+from .offload import PoolSaturated, pool
 from .serializers import LoginHistorySerializer, UserSerializer
 
 
 class CustomTokenObtainPairView(TokenObtainPairView):
     def post(self, request, *args, **kwargs):
-        response = super().post(request, *args, **kwargs)
-        token_str = response.data.get("access")
-        if response.status_code == status.HTTP_200_OK and token_str:
-            if token_str:
-                try:
-                    token = AccessToken(token_str)
-                    user = User.objects.get(id=token["user_id"])
-                    LoginHistory.objects.create(
-                        user=user,
-                        ip_address=self.get_client_ip(request),
-                        user_agent=request.META.get("HTTP_USER_AGENT", ""),
-                    )
-                except Exception as e:
-                    raise Exception(
-                        f"Error decoding token or creating login history: {e}"
-                    )
-        return response
+        serializer = self.get_serializer(data=request.data)
+        try:
+            serializer.is_valid(raise_exception=True)
+        except TokenError as e:
+            metrics.logins.inc(result="failure")
+            raise InvalidToken(e.args[0])
+        except APIException:
+            metrics.logins.inc(result="failure")
+            raise
+        metrics.logins.inc(result="success")
+        # The serializer already authenticated the user; no need to decode
+        # the issued token or fetch the user again.
+        record_login(
+            serializer.user,
+            ip_address=self.get_client_ip(request),
+            user_agent=request.META.get("HTTP_USER_AGENT", ""),
+        )
+        return Response(serializer.validated_data, status=status.HTTP_200_OK)
 
     def get_client_ip(self, request):
         x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
@@ -44,6 +56,50 @@ class RegisterView(generics.CreateAPIView):
     serializer_class = UserSerializer
 
 
+class OffloadedView(View):
+    """
+    Async front for a DRF view whose work is dominated by password hashing.
+
+    The wrapped view runs, and its response is rendered, on the hashing pool
+    so the event loop is never blocked. When the pool is saturated the
+    request is rejected with 503 instead of queueing without bound.
+    """
+
+    view_class = None
+    saturated_message = "Server is busy, please retry."
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    def setup(self, request, *args, **kwargs):
+        super().setup(request, *args, **kwargs)
+        self.wrapped_view = self.view_class.as_view()
+
+    async def post(self, request, *args, **kwargs):
+        try:
+            return await pool.run(self.handle, request, *args, **kwargs)
+        except PoolSaturated:
+            return JsonResponse(
+                {"detail": self.saturated_message},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": "1"},
+            )
+
+    def handle(self, request, *args, **kwargs):
+        record_request_queries()
+        response = self.wrapped_view(request, *args, **kwargs)
+        return response.render()
+
+
+class AsyncTokenObtainPairView(OffloadedView):
+    view_class = CustomTokenObtainPairView
+
+
+class AsyncRegisterView(OffloadedView):
+    view_class = RegisterView
+
+
 class UserProfileView(generics.RetrieveUpdateAPIView):
     permission_classes = (permissions.IsAuthenticated,)
     serializer_class = UserSerializer
@@ -52,9 +108,18 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
         return self.request.user
 
 
+class LoginHistoryPagination(KeysetPagination):
+    position_field = "login_datetime"
+
+
 class LoginHistoryView(generics.ListAPIView):
     serializer_class = LoginHistorySerializer
     permission_classes = (permissions.IsAuthenticated,)
+    pagination_class = LoginHistoryPagination
 
     def get_queryset(self):
-        return LoginHistory.objects.filter(user=self.request.user)
+        return (
+            LoginHistory.objects.filter(user=self.request.user)
+            .select_related("user_agent")
+            .order_by("-login_datetime", "-id")
+        )
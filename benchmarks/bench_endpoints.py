@@ -0,0 +1,308 @@
+"""
+Seed a realistic dataset and drive the blog, auth and dashboard endpoints
+in-process, reporting throughput, latency percentiles and query counts.
+
+    python -m benchmarks.bench_endpoints --posts 100000 --output report.json
+    python -m benchmarks.bench_endpoints --baseline report.json
+
+Pass ``--database`` to keep the seeded SQLite file; an already seeded file
+is reused as is, so reports taken on it are directly comparable.
+"""
+
+import argparse
+import json
+import logging
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from benchmarks.common import setup_django
+from benchmarks.seed import PASSWORD, dataset_counts, seed
+
+
+def no_arguments(context, rng):
+    return {}
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    label: str
+    name: str
+    params: Callable = no_arguments
+    kwargs: Callable = no_arguments
+    method: str = "get"
+    authenticated: bool = True
+    max_requests: int | None = None
+
+
+ENDPOINTS = (
+    Endpoint(
+        "blog:list_blog_posts",
+        "blog:list_blog_posts",
+        lambda context, rng: {"page_size": 50},
+    ),
+    Endpoint(
+        "blog:list_blog_posts?tags",
+        "blog:list_blog_posts",
+        lambda context, rng: {"tags": rng.choice(context["tags"]), "page_size": 50},
+    ),
+    Endpoint(
+        "blog:list_blog_posts?category_tree",
+        "blog:list_blog_posts",
+        lambda context, rng: {
+            "category_tree": rng.choice(context["categories"]),
+            "page_size": 50,
+        },
+    ),
+    Endpoint(
+        "blog:get_blog_post",
+        "blog:get_blog_post",
+        kwargs=lambda context, rng: {"slug": rng.choice(context["slugs"])},
+    ),
+    Endpoint(
+        "blog:search_blog_posts",
+        "blog:search_blog_posts",
+        lambda context, rng: {"q": rng.choice(context["words"])},
+    ),
+    Endpoint("blog:list_blog_tags", "blog:list_blog_tags"),
+    Endpoint("blog:list_popular_blog_tags", "blog:list_popular_blog_tags"),
+    Endpoint("blog:list_blog_categories", "blog:list_blog_categories"),
+    Endpoint("blog:blog_category_tree", "blog:blog_category_tree"),
+    Endpoint("user_dashboard:dashboard", "user_dashboard:dashboard"),
+    Endpoint(
+        "authentication:login_history",
+        "authentication:login_history",
+        lambda context, rng: {"page_size": 50},
+    ),
+    Endpoint("authentication:auth_profile", "authentication:auth_profile"),
+    Endpoint(
+        "authentication:token_obtain_pair",
+        "authentication:token_obtain_pair",
+        lambda context, rng: {
+            "username": rng.choice(context["usernames"]),
+            "password": PASSWORD,
+        },
+        method="post",
+        authenticated=False,
+        # Password hashing dominates; a few logins are enough to track it.
+        max_requests=10,
+    ),
+)
+
+
+def percentile(values, p):
+    return values[min(len(values) - 1, len(values) * p // 100)]
+
+
+def load_context(sample_size=500):
+    from django.contrib.auth.models import User
+
+    from blog.models import BlogCategory, BlogPost, BlogTag
+
+    def sample(queryset):
+        values = list(queryset[:sample_size])
+        return values or [""]
+
+    posts = BlogPost.objects.order_by("pk")
+    contents = posts.values_list("content", flat=True)[:20]
+    return {
+        "usernames": sample(User.objects.values_list("username", flat=True)),
+        "slugs": sample(posts.values_list("slug", flat=True)),
+        "tags": sample(
+            BlogTag.objects.order_by("-post_count").values_list("name", flat=True)
+        ),
+        "categories": sample(
+            BlogCategory.objects.order_by("path").values_list("slug", flat=True)
+        ),
+        "words": sorted(
+            {word.strip(".,").lower() for text in contents for word in text.split()}
+        )
+        or [""],
+    }
+
+
+def drive(endpoint, clients, context, rng, requests, warmup, cold):
+    from django.core.cache import cache
+    from django.db import connection
+    from django.urls import reverse
+
+    from core.middleware import QueryRecorder
+
+    requests = min(requests, endpoint.max_requests or requests)
+    timings = []
+    queries = []
+    errors = 0
+    for index in range(warmup + requests):
+        client = rng.choice(clients) if endpoint.authenticated else clients[0]
+        url = reverse(endpoint.name, kwargs=endpoint.kwargs(context, rng))
+        params = endpoint.params(context, rng)
+        if cold:
+            cache.clear()
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        with connection.execute_wrapper(recorder):
+            if endpoint.method == "get":
+                response = client.get(url, params)
+            else:
+                response = client.generic(
+                    endpoint.method.upper(),
+                    url,
+                    json.dumps(params),
+                    content_type="application/json",
+                )
+        elapsed = time.perf_counter() - started
+        if index < warmup:
+            continue
+        timings.append(elapsed)
+        queries.append(recorder.count)
+        errors += response.status_code >= 400
+    timings.sort()
+    return {
+        "requests": requests,
+        "errors": errors,
+        "throughput": round(requests / sum(timings), 2),
+        "mean_ms": round(sum(timings) / requests * 1000, 3),
+        **{f"p{p}_ms": round(percentile(timings, p) * 1000, 3) for p in (50, 95, 99)},
+        "queries": {
+            "mean": round(sum(queries) / requests, 2),
+            "max": max(queries),
+        },
+    }
+
+
+def compare(report, baseline, threshold):
+    """Print the change against ``baseline`` and return the regressed labels."""
+    regressions = []
+    print(
+        f"\n{'endpoint':<40} {'p95 base':>10} {'p95 now':>10} {'change':>8} "
+        f"{'queries':>11}"
+    )
+    for label, now in report["endpoints"].items():
+        before = baseline["endpoints"].get(label)
+        if before is None:
+            print(f"{label:<40} {'new':>10}")
+            continue
+        change = now["p95_ms"] / before["p95_ms"] - 1 if before["p95_ms"] else 0.0
+        queries = f"{before['queries']['mean']:g}->{now['queries']['mean']:g}"
+        regressed = (
+            change > threshold or now["queries"]["mean"] > before["queries"]["mean"]
+        )
+        if regressed:
+            regressions.append(label)
+        print(
+            f"{label:<40} {before['p95_ms']:>8.2f}ms {now['p95_ms']:>8.2f}ms "
+            f"{change:>+7.0%} {queries:>11}{'  REGRESSION' if regressed else ''}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--posts", type=int, default=10_000)
+    parser.add_argument("--tags", type=int, default=1_000)
+    parser.add_argument("--categories", type=int, default=200)
+    parser.add_argument("--logins-per-user", type=int, default=100)
+    parser.add_argument("--zipf-exponent", type=float, default=1.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument(
+        "--cold", action="store_true", help="Clear the cache before every request."
+    )
+    parser.add_argument("--endpoint", action="append", help="Only run these labels.")
+    parser.add_argument("--output", default="benchmark-report.json")
+    parser.add_argument("--baseline", help="Report to diff against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative p95 increase reported as a regression.",
+    )
+    args = parser.parse_args()
+
+    database = setup_django(args.database)
+    # Slow request records would interleave with the report table.
+    logging.getLogger("core.requests").setLevel(logging.ERROR)
+
+    from django.contrib.auth.models import User
+    from rest_framework.test import APIClient
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    from authentication.login_history import writer
+    from blog.models import BlogPost
+
+    if BlogPost.objects.exists():
+        print(f"Reusing seeded database {database}")
+        dataset = dataset_counts()
+    else:
+        started = time.perf_counter()
+        dataset = seed(
+            users=args.users,
+            posts=args.posts,
+            tags=args.tags,
+            categories=args.categories,
+            logins_per_user=args.logins_per_user,
+            zipf_exponent=args.zipf_exponent,
+            random_seed=args.seed,
+        )
+        print(f"Seeded {dataset} in {time.perf_counter() - started:.1f}s")
+
+    rng = random.Random(args.seed)
+    context = load_context()
+    clients = []
+    for user in User.objects.order_by("pk")[:10]:
+        client = APIClient()
+        token = RefreshToken.for_user(user).access_token
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        clients.append(client)
+
+    endpoints = [
+        endpoint
+        for endpoint in ENDPOINTS
+        if not args.endpoint or endpoint.label in args.endpoint
+    ]
+    report = {
+        "database": database,
+        "dataset": dataset,
+        "options": {
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "cold": args.cold,
+            "seed": args.seed,
+        },
+        "endpoints": {},
+    }
+    print(
+        f"{'endpoint':<40} {'req/s':>8} {'p50':>9} {'p95':>9} {'p99':>9} "
+        f"{'queries':>8} {'errors':>7}"
+    )
+    for endpoint in endpoints:
+        result = drive(
+            endpoint, clients, context, rng, args.requests, args.warmup, args.cold
+        )
+        report["endpoints"][endpoint.label] = result
+        print(
+            f"{endpoint.label:<40} {result['throughput']:>8.1f} "
+            f"{result['p50_ms']:>7.2f}ms {result['p95_ms']:>7.2f}ms "
+            f"{result['p99_ms']:>7.2f}ms {result['queries']['mean']:>8g} "
+            f"{result['errors']:>7}"
+        )
+    writer.drain()
+
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2)
+    print(f"\nWrote {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            regressions = compare(report, json.load(baseline), args.threshold)
+        if regressions:
+            sys.exit(f"\n{len(regressions)} endpoint(s) regressed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Compare ModelSerializer and the fast ``.values()`` path on the blog lists.
+
+    python -m benchmarks.bench_list_serialization --posts 5000 --repeat 5
+"""
+
+import argparse
+import statistics
+
+from benchmarks.common import authenticated_client, setup_django, timed
+
+ENDPOINTS = (
+    ("blog:list_blog_posts", {}),
+    ("blog:list_blog_posts", {"page_size": 500}),
+    ("blog:list_blog_tags", {}),
+    ("blog:list_blog_categories", {}),
+)
+
+
+def seed(user, posts, tags, categories):
+    from blog.bulk import import_posts
+    from blog.models import BlogCategory, BlogTag
+
+    tag_ids = [
+        tag.pk
+        for tag in BlogTag.objects.bulk_create(
+            BlogTag(name=f"tag {i}") for i in range(tags)
+        )
+    ]
+    category_ids = [
+        category.pk
+        for category in BlogCategory.objects.bulk_create(
+            BlogCategory(name=f"category {i}", slug=f"category-{i}")
+            for i in range(categories)
+        )
+    ]
+    import_posts(
+        [
+            {
+                "title": f"post {i}",
+                "content": "lorem ipsum dolor sit amet " * 20,
+                "tags": tag_ids[i % tags : i % tags + 3],
+                "category": category_ids[i % categories],
+            }
+            for i in range(posts)
+        ],
+        author_id=user.pk,
+        batch_size=1000,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--posts", type=int, default=5000)
+    parser.add_argument("--tags", type=int, default=500)
+    parser.add_argument("--categories", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.core.cache import cache
+    from django.test import override_settings
+    from django.urls import reverse
+
+    client, user = authenticated_client()
+    seed(user, args.posts, args.tags, args.categories)
+
+    print(f"{'endpoint':<40} {'serializer':>12} {'fast':>12} {'speedup':>8}")
+    for name, params in ENDPOINTS:
+        url = reverse(name)
+
+        def fetch():
+            cache.clear()
+            return client.get(url, params).content
+
+        slow_body = fetch()
+        slow = statistics.median(timed(fetch, args.repeat))
+        with override_settings(BLOG_FAST_LIST_SERIALIZATION=True):
+            fast_body = fetch()
+            fast = statistics.median(timed(fetch, args.repeat))
+        if fast_body != slow_body:
+            raise SystemExit(f"{name}: fast path output differs")
+        label = f"{name} {params or ''}".strip()
+        print(
+            f"{label:<40} {slow * 1000:>10.1f}ms {fast * 1000:>10.1f}ms "
+            f"{slow / fast:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
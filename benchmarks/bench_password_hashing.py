@@ -0,0 +1,74 @@
+"""
+Compare logins/sec of one ASGI worker on the sync token view and on the
+async view that hashes on the worker pool.
+
+    python -m benchmarks.bench_password_hashing --logins 64 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from benchmarks.common import setup_django
+
+ENDPOINTS = (
+    ("sync", "authentication:token_obtain_pair"),
+    ("async", "authentication:token_obtain_pair_async"),
+)
+
+
+async def drive(client, url, body, logins, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    statuses = []
+
+    async def login():
+        async with semaphore:
+            response = await client.post(url, body, content_type="application/json")
+            statuses.append(response.status_code)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    return time.perf_counter() - started, statuses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--database")
+    args = parser.parse_args()
+
+    setup_django(args.database)
+
+    from django.conf import settings
+    from django.contrib.auth.models import User
+    from django.test import AsyncClient
+    from django.urls import reverse
+
+    from authentication.login_history import writer
+    from authentication.offload import pool
+
+    settings.AUTH_HASHING_POOL = {
+        "MAX_WORKERS": args.workers,
+        "MAX_PENDING": args.concurrency,
+    }
+    User.objects.filter(username="bench").delete()
+    User.objects.create_user(username="bench", password="BenchPass123!")
+    body = json.dumps({"username": "bench", "password": "BenchPass123!"})
+
+    client = AsyncClient()
+    print(f"{'path':<8} {'logins/s':>10} {'seconds':>9} {'errors':>7}")
+    for label, name in ENDPOINTS:
+        elapsed, statuses = asyncio.run(
+            drive(client, reverse(name), body, args.logins, args.concurrency)
+        )
+        errors = sum(status != 200 for status in statuses)
+        print(f"{label:<8} {args.logins / elapsed:>10.1f} {elapsed:>9.2f} {errors:>7}")
+    pool.shutdown()
+    writer.drain()
+
+
+if __name__ == "__main__":
+    main()
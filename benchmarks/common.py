@@ -0,0 +1,53 @@
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup_django(database=None):
+    """
+    Configure Django against a throwaway SQLite file and migrate it.
+
+    Benchmarks never touch ``db.sqlite3``; pass ``database`` to reuse a
+    seeded file between runs.
+    """
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+
+    import django
+    from django.conf import settings
+
+    if database is None:
+        database = os.path.join(tempfile.mkdtemp(prefix="blog-bench-"), "bench.sqlite3")
+    settings.DATABASES["default"]["NAME"] = database
+    settings.DEBUG = False
+    django.setup()
+
+    from django.core.management import call_command
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment(debug=False)
+    call_command("migrate", verbosity=0)
+    return database
+
+
+def authenticated_client(username="bench"):
+    from django.contrib.auth.models import User
+    from rest_framework.test import APIClient
+
+    user, _ = User.objects.get_or_create(username=username)
+    client = APIClient()
+    client.force_authenticate(user)
+    return client, user
+
+
+def timed(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return timings
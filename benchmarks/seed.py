@@ -0,0 +1,124 @@
+"""
+Bulk-seed a realistic dataset for the benchmarks.
+
+Posts, tags and categories come from :func:`blog.seeding.seed_blog`; users
+and login history are added here through ``core.factories``. Everything
+is written with ``bulk_create``, so seeding 10^6 posts takes minutes rather
+than hours. Every random choice derives from one seed, so the same
+arguments always produce the same rows (login times are relative to now).
+"""
+
+import random
+from datetime import timedelta
+from itertools import islice
+
+USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/124.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_4) Safari/605.1.15",
+    "Mozilla/5.0 (X11; Linux x86_64; rv:125.0) Gecko/20100101 Firefox/125.0",
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_4 like Mac OS X) Mobile/15E148",
+    "python-requests/2.31.0",
+)
+PASSWORD = "BenchPass123!"
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def random_ip(rng):
+    return f"10.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(1, 255)}"
+
+
+def seed_users(count):
+    import factory
+    from django.contrib.auth.hashers import make_password
+    from django.contrib.auth.models import User
+
+    from core.factories import UserFactory
+    from user_dashboard.models import UserProfile
+
+    # Hash once and bypass the factory's per-user hashing.
+    password = factory.Transformer.Force(make_password(PASSWORD))
+    users = User.objects.bulk_create(UserFactory.build_batch(count, password=password))
+    UserProfile.objects.bulk_create(UserProfile(user=user) for user in users)
+    return [user.pk for user in users]
+
+
+def seed_login_history(rng, user_ids, per_user, days, batch_size):
+    from django.utils import timezone
+
+    from authentication.login_history import daily_aggregates, save_rollups
+    from authentication.models import LoginHistory, UserAgent
+    from core.factories import LoginHistoryFactory
+
+    agents = UserAgent.objects.intern(USER_AGENTS)
+    now = timezone.now()
+    events = ((user_id, rng.random()) for user_id in user_ids for _ in range(per_user))
+    for batch in batched(events, batch_size):
+        LoginHistory.objects.bulk_create(
+            LoginHistoryFactory.build(
+                user_id=user_id,
+                login_datetime=now - timedelta(days=days * offset),
+                ip_address=random_ip(rng),
+                user_agent_id=agents[rng.choice(USER_AGENTS)],
+            )
+            for user_id, offset in batch
+        )
+    save_rollups(list(daily_aggregates(LoginHistory.objects.all())))
+
+
+def seed(
+    *,
+    users=50,
+    posts=10_000,
+    tags=1_000,
+    categories=200,
+    category_fanout=5,
+    logins_per_user=100,
+    login_days=90,
+    zipf_exponent=1.1,
+    max_tags=5,
+    batch_size=2_000,
+    random_seed=0,
+):
+    """Seed the default database and return :func:`dataset_counts`."""
+    import factory.random
+    from django.db import transaction
+
+    from blog.seeding import seed_blog
+
+    factory.random.reseed_random(random_seed)
+    rng = random.Random(random_seed)
+    with transaction.atomic():
+        user_ids = seed_users(users)
+        seed_blog(
+            user_ids,
+            posts,
+            tags,
+            categories,
+            category_fanout=category_fanout,
+            max_tags=max_tags,
+            zipf_exponent=zipf_exponent,
+            batch_size=batch_size,
+            random_seed=random_seed,
+        )
+        seed_login_history(rng, user_ids, logins_per_user, login_days, batch_size)
+    return dataset_counts()
+
+
+def dataset_counts():
+    from django.contrib.auth.models import User
+
+    from authentication.models import LoginHistory
+    from blog.models import BlogCategory, BlogPost, BlogTag
+
+    return {
+        "users": User.objects.count(),
+        "posts": BlogPost.objects.count(),
+        "tags": BlogTag.objects.count(),
+        "categories": BlogCategory.objects.count(),
+        "logins": LoginHistory.objects.count(),
+    }
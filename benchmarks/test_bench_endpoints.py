@@ -0,0 +1,41 @@
+from contextlib import redirect_stdout
+from io import StringIO
+
+from django.test import SimpleTestCase
+
+from benchmarks.bench_endpoints import compare
+
+
+def report(p95_ms, queries):
+    return {"p95_ms": p95_ms, "queries": {"mean": queries}}
+
+
+class CompareTest(SimpleTestCase):
+    def compare(self, now, before, threshold=0.2):
+        with redirect_stdout(StringIO()) as out:
+            regressions = compare({"endpoints": now}, {"endpoints": before}, threshold)
+        return regressions, out.getvalue()
+
+    def test_latency_and_query_regressions(self):
+        regressions, output = self.compare(
+            {
+                "steady": report(10.0, 2),
+                "slower": report(13.0, 2),
+                "chattier": report(10.0, 3),
+                "added": report(5.0, 1),
+            },
+            {
+                "steady": report(10.0, 2),
+                "slower": report(10.0, 2),
+                "chattier": report(10.0, 2),
+            },
+        )
+        self.assertEqual(regressions, ["slower", "chattier"])
+        self.assertIn("new", output.splitlines()[-1])
+        self.assertIn("2->3", output)
+
+    def test_zero_baseline_latency(self):
+        regressions, _ = self.compare(
+            {"instant": report(1.0, 0)}, {"instant": report(0.0, 0)}
+        )
+        self.assertEqual(regressions, [])
@@ -0,0 +1,27 @@
+from django.test import TestCase
+
+from authentication.models import LoginDailyRollup
+from benchmarks.seed import dataset_counts, seed
+from blog.models import BlogCategory, BlogTag
+
+
+class SeedTest(TestCase):
+    def test_seed_small_dataset(self):
+        counts = seed(
+            users=3,
+            posts=50,
+            tags=10,
+            categories=8,
+            logins_per_user=4,
+            batch_size=20,
+        )
+        self.assertEqual(
+            counts,
+            {"users": 3, "posts": 50, "tags": 10, "categories": 8, "logins": 12},
+        )
+        self.assertEqual(dataset_counts(), counts)
+        self.assertEqual(BlogTag.objects.reconcile_post_counts(), 0)
+        self.assertTrue(LoginDailyRollup.objects.exists())
+        for category in BlogCategory.objects.select_related("parent"):
+            parent_path = category.parent.path if category.parent else "/"
+            self.assertEqual(category.path, f"{parent_path}{category.pk}/")
@@ -1,24 +1,66 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.db.models import Q
+from django.db.models.functions import Left
+from django.utils.text import Truncator
 
-from blog import models
+from blog import models, search
+from core.pagination import EstimatedCountPaginator
+
+PREVIEW_LENGTH = 80
+
+
+class BlogPostChangeList(ChangeList):
+    def get_queryset(self, request, exclude_parameters=None):
+        # Only the head of each post is needed for the preview column.
+        return (
+            super()
+            .get_queryset(request, exclude_parameters)
+            .defer("content")
+            .annotate(content_head=Left("content", PREVIEW_LENGTH + 1))
+        )
 
 
 @admin.register(models.BlogPost)
 class BlogPostAdmin(admin.ModelAdmin):
-    list_display = ("title", "content", "author")
-    list_filter = ("title", "author")
-    search_fields = ("title", "author")
+    list_display = ("title", "content_preview", "author", "category", "created_at")
+    list_select_related = ("author", "category")
+    list_filter = ("category",)
+    search_fields = ("title", "=author__username")
+    autocomplete_fields = ("author", "category", "tags")
+    date_hierarchy = "created_at"
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_changelist(self, request, **kwargs):
+        return BlogPostChangeList
+
+    @admin.display(description="content")
+    def content_preview(self, obj):
+        return Truncator(obj.content_head).chars(PREVIEW_LENGTH)
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term or not search.is_supported():
+            return super().get_search_results(request, queryset, search_term)
+        # Title and content go through the full-text index, authors through
+        # the unique username index.
+        matches = search.match_filter(search_term) | Q(author__username=search_term)
+        return queryset.filter(matches), False
 
 
 @admin.register(models.BlogTag)
 class BlogTagAdmin(admin.ModelAdmin):
-    list_display = ("name",)
-    list_filter = ("name",)
+    list_display = ("name", "post_count")
     search_fields = ("name",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(models.BlogCategory)
 class BlogCategoryAdmin(admin.ModelAdmin):
-    list_display = ("name",)
-    list_filter = ("name",)
+    list_display = ("name", "parent")
+    list_select_related = ("parent",)
     search_fields = ("name",)
+    autocomplete_fields = ("parent",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
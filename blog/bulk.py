@@ -0,0 +1,154 @@
+from collections import Counter
+from dataclasses import dataclass, field
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils.text import slugify
+from rest_framework import serializers
+
+from blog import cache, search
+from blog.models import BlogCategory, BlogPost, BlogTag
+from blog.signals import posts_bulk_created
+
+
+class BulkBlogPostSerializer(serializers.Serializer):
+    title = serializers.CharField()
+    content = serializers.CharField()
+    author = serializers.IntegerField(required=False)
+    tags = serializers.ListField(
+        child=serializers.IntegerField(), required=False, default=list
+    )
+    category = serializers.IntegerField(required=False, allow_null=True)
+
+
+@dataclass
+class BulkImportResult:
+    created: list = field(default_factory=list)
+    errors: list = field(default_factory=list)
+
+
+def allocate_slugs(titles, taken=None):
+    """
+    Pick a unique slug per title, suffixing ``-2``, ``-3``... on collisions.
+
+    Collisions inside the batch are resolved in memory and collisions with
+    stored posts with one ``slug IN (...)`` query per round.
+    """
+    taken = set() if taken is None else taken
+    bases = [slugify(title) or "post" for title in titles]
+    attempts = Counter()
+    slugs = [None] * len(bases)
+    pending = list(range(len(bases)))
+    while pending:
+        candidates = {}
+        for index in pending:
+            base = bases[index]
+            while True:
+                attempts[base] += 1
+                slug = base if attempts[base] == 1 else f"{base}-{attempts[base]}"
+                if slug not in taken and slug not in candidates:
+                    break
+            candidates[slug] = index
+        existing = set(
+            BlogPost.objects.filter(slug__in=candidates).values_list("slug", flat=True)
+        )
+        pending = []
+        for slug, index in candidates.items():
+            taken.add(slug)
+            if slug in existing:
+                pending.append(index)
+            else:
+                slugs[index] = slug
+    return slugs
+
+
+def _existing_ids(model, ids):
+    return set(model.objects.filter(pk__in=ids).values_list("pk", flat=True))
+
+
+def _validate_batch(items, author_id, start):
+    valid = []
+    errors = []
+    for index, item in enumerate(items, start=start):
+        serializer = BulkBlogPostSerializer(data=item)
+        if not serializer.is_valid():
+            errors.append({"index": index, "errors": serializer.errors})
+            continue
+        data = serializer.validated_data
+        if author_id is not None:
+            data["author"] = author_id
+        elif "author" not in data:
+            errors.append({"index": index, "errors": {"author": ["Required."]}})
+            continue
+        valid.append((index, data))
+
+    authors = _existing_ids(User, {data["author"] for _, data in valid})
+    tags = _existing_ids(BlogTag, {pk for _, data in valid for pk in data["tags"]})
+    categories = _existing_ids(
+        BlogCategory, {data["category"] for _, data in valid if data.get("category")}
+    )
+    resolved = []
+    for index, data in valid:
+        item_errors = {}
+        if (author := data["author"]) not in authors:
+            item_errors["author"] = [f'Invalid pk "{author}".']
+        if missing := [pk for pk in data["tags"] if pk not in tags]:
+            item_errors["tags"] = [f'Invalid pk "{pk}".' for pk in missing]
+        if (category := data.get("category")) and category not in categories:
+            item_errors["category"] = [f'Invalid pk "{category}".']
+        if item_errors:
+            errors.append({"index": index, "errors": item_errors})
+        else:
+            resolved.append(data)
+    return resolved, errors
+
+
+def import_posts(items, author_id=None, batch_size=500, start=0):
+    """
+    Validate and insert posts with ``bulk_create`` in ``batch_size`` chunks.
+
+    Invalid items are skipped and reported by index; everything else is
+    written in one transaction, together with the tag through-rows, tag
+    post counts and search index entries.
+    """
+    result = BulkImportResult()
+    taken = set()
+    tag_counts = Counter()
+    author_ids = set()
+    with transaction.atomic():
+        for offset in range(0, len(items), batch_size):
+            batch, errors = _validate_batch(
+                items[offset : offset + batch_size], author_id, start + offset
+            )
+            result.errors.extend(errors)
+            if not batch:
+                continue
+            slugs = allocate_slugs([data["title"] for data in batch], taken)
+            posts = BlogPost.objects.bulk_create(
+                [
+                    BlogPost(
+                        title=data["title"],
+                        content=data["content"],
+                        author_id=data["author"],
+                        category_id=data.get("category"),
+                        slug=slug,
+                    )
+                    for data, slug in zip(batch, slugs)
+                ]
+            )
+            through_rows = []
+            for post, data in zip(posts, batch):
+                for tag_id in dict.fromkeys(data["tags"]):
+                    through_rows.append(
+                        BlogPost.tags.through(blogpost_id=post.pk, blogtag_id=tag_id)
+                    )
+                    tag_counts[tag_id] += 1
+            BlogPost.tags.through.objects.bulk_create(through_rows)
+            search.index_posts((post.pk, post.title, post.content) for post in posts)
+            result.created.extend(post.pk for post in posts)
+            author_ids.update(post.author_id for post in posts)
+        BlogTag.objects.adjust_post_counts(tag_counts)
+        if result.created:
+            cache.invalidate("post")
+            posts_bulk_created.send(sender=BlogPost, user_ids=author_ids)
+    return result
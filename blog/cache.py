@@ -0,0 +1,142 @@
+import hashlib
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core import checks
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.response import Response
+
+VERSION_KEY = "blog:version:{}"
+RESPONSE_KEY = "blog:response:{endpoint}:{versions}:{params}"
+LOCAL_BACKEND = "django.core.cache.backends.locmem.LocMemCache"
+
+
+@checks.register(checks.Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    if settings.CACHES["default"]["BACKEND"] != LOCAL_BACKEND:
+        return []
+    return [
+        checks.Warning(
+            "The default cache is local to each process, so blog response "
+            "cache invalidation does not reach other workers.",
+            hint="Use a shared cache backend when running several workers.",
+            id="blog.W001",
+        )
+    ]
+
+
+class CacheStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = Counter()
+        self.misses = Counter()
+
+    def record(self, endpoint, hit):
+        with self._lock:
+            (self.hits if hit else self.misses)[endpoint] += 1
+
+    def snapshot(self):
+        with self._lock:
+            endpoints = set(self.hits) | set(self.misses)
+            return {
+                endpoint: {
+                    "hits": self.hits[endpoint],
+                    "misses": self.misses[endpoint],
+                }
+                for endpoint in sorted(endpoints)
+            }
+
+    def reset(self):
+        with self._lock:
+            self.hits.clear()
+            self.misses.clear()
+
+
+stats = CacheStats()
+
+
+def get_versions(namespaces):
+    keys = [VERSION_KEY.format(namespace) for namespace in namespaces]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # Seed from the clock so an evicted version never reuses old keys.
+            cache.add(key, time.time_ns(), None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def bump_version(namespace):
+    key = VERSION_KEY.format(namespace)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def invalidate(*namespaces):
+    for namespace in namespaces:
+        bump_version(namespace)
+    # Bump again once the transaction commits so that a concurrent reader
+    # caching pre-commit data does so under a version that is now stale.
+    connection = transaction.get_connection()
+    if connection.in_atomic_block:
+        transaction.on_commit(
+            lambda: [bump_version(namespace) for namespace in namespaces]
+        )
+
+
+def normalize_params(query_params, names):
+    normalized = []
+    for name in names:
+        if value := query_params.get(name):
+            if "," in value:
+                value = ",".join(sorted(set(value.split(","))))
+            normalized.append(f"{name}={value}")
+    return "&".join(normalized)
+
+
+class CachedResponseMixin:
+    """
+    Cache successful GET responses under versioned keys.
+
+    Keys combine the URL name, its kwargs, the whitelisted query params and
+    the current version of every namespace in ``cache_namespaces``; writes
+    to those models bump the version so stale entries are never read again.
+    That guarantee spans processes only when the default cache is shared.
+    """
+
+    cache_namespaces = ()
+    cache_query_params = ()
+
+    def get_cache_key(self, request):
+        match = request.resolver_match
+        endpoint = ":".join(
+            [match.view_name, *(f"{k}={v}" for k, v in sorted(match.kwargs.items()))]
+        )
+        params = normalize_params(request.query_params, self.cache_query_params)
+        return RESPONSE_KEY.format(
+            endpoint=endpoint,
+            versions=".".join(map(str, get_versions(self.cache_namespaces))),
+            params=hashlib.md5(params.encode()).hexdigest(),
+        )
+
+    def get(self, request, *args, **kwargs):
+        endpoint = request.resolver_match.view_name
+        key = self.get_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            stats.record(endpoint, hit=True)
+            response = Response(data)
+            response["X-Cache"] = "HIT"
+            return response
+
+        stats.record(endpoint, hit=False)
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, settings.BLOG_RESPONSE_CACHE_TIMEOUT)
+        response["X-Cache"] = "MISS"
+        return response
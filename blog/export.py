@@ -0,0 +1,73 @@
+import csv
+import json
+
+from rest_framework.renderers import BaseRenderer
+
+EXPORT_FIELDS = ("title", "content", "author", "id", "tags", "slug", "category")
+
+
+def iter_rows(queryset, chunk_size):
+    # iterator(chunk_size=...) runs the tag prefetch once per chunk, so only
+    # one chunk of posts is ever held in memory.
+    for post in queryset.iterator(chunk_size=chunk_size):
+        yield {
+            "title": post.title,
+            "content": post.content,
+            "author": post.author_id,
+            "id": post.pk,
+            "tags": [tag.pk for tag in post.tags.all()],
+            "slug": post.slug,
+            "category": post.category_id,
+        }
+
+
+def buffered(lines, size=500):
+    buffer = []
+    for line in lines:
+        buffer.append(line)
+        if len(buffer) >= size:
+            yield "".join(buffer)
+            buffer = []
+    if buffer:
+        yield "".join(buffer)
+
+
+class Echo:
+    def write(self, value):
+        return value
+
+
+class NDJSONRenderer(BaseRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data, ensure_ascii=False) + "\n"
+
+    def stream(self, rows):
+        return buffered(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+
+
+class CSVRenderer(BaseRenderer):
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        writer = csv.writer(Echo())
+        items = data.items() if isinstance(data, dict) else [("detail", data)]
+        return "".join(writer.writerow([key, value]) for key, value in items)
+
+    def stream(self, rows):
+        writer = csv.writer(Echo())
+        yield writer.writerow(EXPORT_FIELDS)
+        yield from buffered(
+            writer.writerow(
+                [
+                    ";".join(map(str, row[name])) if name == "tags" else row[name]
+                    for name in EXPORT_FIELDS
+                ]
+            )
+            for row in rows
+        )
@@ -0,0 +1,115 @@
+import json
+
+from django.conf import settings
+from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
+from rest_framework.response import Response
+
+from blog.models import BlogPost
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# SQLite's historical bound on host parameters; larger pages use a subquery.
+MAX_IN_PARAMS = 999
+
+_encoder = json.JSONEncoder(
+    ensure_ascii=JSONRenderer.ensure_ascii,
+    allow_nan=not JSONRenderer.strict,
+    separators=(",", ":"),
+)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer producing the same bytes for plain data, but encoding with
+    orjson when installed and otherwise with a reused stdlib encoder.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if data is None or indent is not None or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            if orjson is not None:
+                ret = orjson.dumps(data)
+            else:
+                ret = _encoder.encode(data).encode()
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        return ret.replace("\u2028".encode(), b"\\u2028").replace(
+            "\u2029".encode(), b"\\u2029"
+        )
+
+
+def tag_ids_by_post(post_ids, queryset=None):
+    through = BlogPost.tags.through.objects
+    if len(post_ids) > MAX_IN_PARAMS and queryset is not None:
+        rows = through.filter(blogpost_id__in=queryset.values("id"))
+    else:
+        rows = through.filter(blogpost_id__in=post_ids)
+    tag_ids = {pk: [] for pk in post_ids}
+    for post_id, tag_id in rows.order_by("blogpost_id", "blogtag_id").values_list(
+        "blogpost_id", "blogtag_id"
+    ):
+        if post_id in tag_ids:
+            tag_ids[post_id].append(tag_id)
+    return tag_ids
+
+
+def post_rows(rows, queryset=None):
+    """Build ``BlogPostSerializer`` output from ``.values()`` rows."""
+    tag_ids = tag_ids_by_post([row["id"] for row in rows], queryset)
+    return [
+        {
+            "title": row["title"],
+            "content": row["content"],
+            "author": row["author_id"],
+            "id": row["id"],
+            "tags": tag_ids[row["id"]],
+            "slug": row["slug"],
+            "category": row["category_id"],
+        }
+        for row in rows
+    ]
+
+
+class FastListMixin:
+    """
+    Opt-in list path (``BLOG_FAST_LIST_SERIALIZATION``) that skips the
+    serializer and builds rows from ``.values()``, matching its output.
+    """
+
+    renderer_classes = (FastJSONRenderer, BrowsableAPIRenderer)
+    fast_fields = ()
+
+    def get_fast_queryset(self, queryset):
+        return queryset.prefetch_related(None).values(*self.fast_fields)
+
+    def build_fast_rows(self, rows, queryset):
+        return list(rows)
+
+    def list(self, request, *args, **kwargs):
+        if not settings.BLOG_FAST_LIST_SERIALIZATION:
+            return super().list(request, *args, **kwargs)
+        queryset = self.get_fast_queryset(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.build_fast_rows(page, None))
+        return Response(self.build_fast_rows(list(queryset), queryset))
+
+
+class FastPostListMixin(FastListMixin):
+    fast_fields = (
+        "title",
+        "content",
+        "author_id",
+        "id",
+        "slug",
+        "category_id",
+        "created_at",
+    )
+
+    def build_fast_rows(self, rows, queryset):
+        return post_rows(rows, queryset)
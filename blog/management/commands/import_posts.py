@@ -0,0 +1,74 @@
+import json
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from blog.bulk import import_posts
+
+
+class Command(BaseCommand):
+    help = "Bulk import blog posts from a newline-delimited JSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="NDJSON file, one post object per line.")
+        parser.add_argument(
+            "--batch-size", type=int, default=settings.BLOG_BULK_IMPORT_BATCH_SIZE
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=10000,
+            help="Lines imported per transaction.",
+        )
+        parser.add_argument(
+            "--author", type=int, help="Author id for posts that do not set one."
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        created = failed = 0
+        chunk = []
+        with open(options["path"], encoding="utf-8") as lines:
+            for line_number, line in enumerate(lines, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line)
+                except json.JSONDecodeError as e:
+                    self.report(line_number, {"non_field_errors": [str(e)]})
+                    failed += 1
+                    continue
+                if not isinstance(item, dict):
+                    self.report(
+                        line_number,
+                        {"non_field_errors": ["Expected a JSON object."]},
+                    )
+                    failed += 1
+                    continue
+                if options["author"] is not None:
+                    item.setdefault("author", options["author"])
+                chunk.append((line_number, item))
+                if len(chunk) >= options["chunk_size"]:
+                    created, failed = self.flush(chunk, options, created, failed)
+                    chunk = []
+        if chunk:
+            created, failed = self.flush(chunk, options, created, failed)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {created} posts ({failed} failed) in {elapsed:.2f}s."
+            )
+        )
+
+    def flush(self, chunk, options, created, failed):
+        result = import_posts(
+            [item for _, item in chunk], batch_size=options["batch_size"]
+        )
+        for error in result.errors:
+            self.report(chunk[error["index"]][0], error["errors"])
+        return created + len(result.created), failed + len(result.errors)
+
+    def report(self, line_number, errors):
+        self.stderr.write(f"line {line_number}: {json.dumps(errors)}")
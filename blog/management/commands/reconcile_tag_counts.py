@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from blog.models import BlogTag
+
+
+class Command(BaseCommand):
+    help = "Recompute denormalized blog tag post counts and repair any drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        repaired = BlogTag.objects.reconcile_post_counts(
+            batch_size=options["batch_size"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"Repaired {repaired} tag counts."))
@@ -0,0 +1,65 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from blog.seeding import seed_blog
+
+
+class Command(BaseCommand):
+    help = "Generate a large, deterministic blog dataset with bulk inserts."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--posts", type=int, default=100_000)
+        parser.add_argument("--tags", type=int, default=1000)
+        parser.add_argument("--categories", type=int, default=200)
+        parser.add_argument("--category-fanout", type=int, default=5)
+        parser.add_argument("--max-tags", type=int, default=5)
+        parser.add_argument("--zipf-exponent", type=float, default=1.1)
+        parser.add_argument("--min-words", type=int, default=40)
+        parser.add_argument("--max-words", type=int, default=200)
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--author",
+            type=int,
+            action="append",
+            help="Author id; repeat for several. Defaults to every user.",
+        )
+
+    def handle(self, *args, **options):
+        author_ids = options["author"] or list(
+            User.objects.order_by("pk").values_list("pk", flat=True)
+        )
+        if not author_ids:
+            raise CommandError("Create a user first; seeded posts need an author.")
+        if options["min_words"] > options["max_words"]:
+            raise CommandError("--min-words cannot exceed --max-words.")
+
+        started = time.perf_counter()
+        result = seed_blog(
+            author_ids,
+            options["posts"],
+            options["tags"],
+            options["categories"],
+            category_fanout=options["category_fanout"],
+            max_tags=options["max_tags"],
+            zipf_exponent=options["zipf_exponent"],
+            min_words=options["min_words"],
+            max_words=options["max_words"],
+            batch_size=options["batch_size"],
+            random_seed=options["seed"],
+        )
+        elapsed = time.perf_counter() - started
+        if result.deferred_indexes:
+            self.stdout.write(
+                f"Rebuilt {len(result.deferred_indexes)} indexes after loading: "
+                + ", ".join(result.deferred_indexes)
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {result.posts} posts, {result.tag_links} tag links, "
+                f"{result.tags} tags and {result.categories} categories in "
+                f"{elapsed:.2f}s ({result.rows / elapsed:,.0f} rows/s)."
+            )
+        )
@@ -0,0 +1,31 @@
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS blog_blogpost_fts "
+        "USING fts5(title, content, tokenize='porter unicode61')"
+    )
+    schema_editor.execute(
+        "INSERT INTO blog_blogpost_fts (rowid, title, content) "
+        "SELECT id, title, content FROM blog_blogpost"
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute("DROP TABLE IF EXISTS blog_blogpost_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0007_blogpost_created_id_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2 on 2026-10-18 20:27
+
+from django.db import migrations, models
+
+
+def populate_paths(apps, schema_editor):
+    BlogCategory = apps.get_model("blog", "BlogCategory")
+    parents = dict(BlogCategory.objects.values_list("pk", "parent_id"))
+    paths = {}
+
+    def build_path(pk, seen=()):
+        if pk not in paths:
+            parent_id = parents[pk]
+            if parent_id is None or parent_id in seen:
+                paths[pk] = f"/{pk}/"
+            else:
+                paths[pk] = f"{build_path(parent_id, (*seen, pk))}{pk}/"
+        return paths[pk]
+
+    categories = list(BlogCategory.objects.only("pk"))
+    for category in categories:
+        category.path = build_path(category.pk)
+    BlogCategory.objects.bulk_update(categories, ["path"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0008_blogpost_search_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blogcategory",
+            name="path",
+            field=models.CharField(
+                blank=True, db_index=True, editable=False, max_length=255
+            ),
+        ),
+        migrations.RunPython(populate_paths, migrations.RunPython.noop),
+    ]
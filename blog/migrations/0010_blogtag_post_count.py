@@ -0,0 +1,39 @@
+# Generated by Django 5.2 on 2026-10-18 20:30
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_post_counts(apps, schema_editor):
+    BlogTag = apps.get_model("blog", "BlogTag")
+    Through = apps.get_model("blog", "BlogPost").tags.through
+    counts = (
+        Through.objects.filter(blogtag_id=OuterRef("pk"))
+        .values("blogtag_id")
+        .annotate(count=Count("*"))
+        .values("count")
+    )
+    BlogTag.objects.update(post_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0009_blogcategory_path"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blogtag",
+            name="post_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="blogtag",
+            index=models.Index(
+                fields=["-post_count", "name"], name="blog_tag_popularity_idx"
+            ),
+        ),
+        migrations.RunPython(populate_post_counts, migrations.RunPython.noop),
+    ]
@@ -1,21 +1,81 @@
 from django.contrib.auth.models import User
 from django.db import models
+from django.db.models import Count, F, Value
+from django.db.models.functions import Concat, Substr
 from django.utils.text import slugify
 
 
+class BlogTagQuerySet(models.QuerySet):
+    def adjust_post_counts(self, deltas):
+        """Apply ``{tag_id: delta}`` with one UPDATE per distinct delta."""
+        by_delta = {}
+        for pk, delta in deltas.items():
+            if delta:
+                by_delta.setdefault(delta, []).append(pk)
+        for delta, pks in by_delta.items():
+            self.filter(pk__in=pks).update(post_count=F("post_count") + delta)
+
+    def reconcile_post_counts(self, batch_size=1000):
+        """Recompute post counts from the through table, returning repairs."""
+        repaired = 0
+        last_pk = 0
+        while True:
+            batch = list(
+                self.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .annotate(actual=Count("posts"))
+                .values_list("pk", "post_count", "actual")[:batch_size]
+            )
+            if not batch:
+                return repaired
+            last_pk = batch[-1][0]
+            drifted = [
+                self.model(pk=pk, post_count=actual)
+                for pk, post_count, actual in batch
+                if post_count != actual
+            ]
+            self.model.objects.bulk_update(drifted, ["post_count"])
+            repaired += len(drifted)
+
+
 class BlogTag(models.Model):
     name = models.CharField()
     created_at = models.DateTimeField(auto_now=True)
+    post_count = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = BlogTagQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["-post_count", "name"], name="blog_tag_popularity_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"Tag: {self.name}"
 
 
+class BlogCategoryQuerySet(models.QuerySet):
+    def subtree(self, path):
+        # Descendant paths share the "/1/5/" prefix and, since "/" sorts just
+        # before "0", all fall below "/1/50"; a range keeps the index usable.
+        return self.filter(path__gte=path, path__lt=f"{path[:-1]}0")
+
+    def rebase(self, old_path, new_path):
+        return self.subtree(old_path).update(
+            path=Concat(Value(new_path), Substr("path", len(old_path) + 1))
+        )
+
+
 class BlogCategory(models.Model):
     name = models.CharField()
     parent = models.ForeignKey("self", on_delete=models.SET_NULL, null=True, blank=True)
     slug = models.SlugField(unique=True, blank=True, null=True)
     created_at = models.DateTimeField(auto_now=True)
+    path = models.CharField(max_length=255, blank=True, editable=False, db_index=True)
+
+    objects = BlogCategoryQuerySet.as_manager()
 
     class Meta:
         verbose_name_plural = "categories"
@@ -23,7 +83,24 @@ class BlogCategory(models.Model):
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.name)
-        return super().save(*args, **kwargs)
+        paths = dict(
+            BlogCategory.objects.filter(
+                pk__in=[pk for pk in (self.pk, self.parent_id) if pk]
+            ).values_list("pk", "path")
+        )
+        parent_path = paths.get(self.parent_id, "/")
+        if self.pk and f"/{self.pk}/" in parent_path:
+            raise ValueError("A category cannot be moved under its descendant.")
+        old_path = paths.get(self.pk)
+        if self.pk:
+            self.path = f"{parent_path}{self.pk}/"
+        result = super().save(*args, **kwargs)
+        if not old_path:
+            self.path = f"{parent_path}{self.pk}/"
+            BlogCategory.objects.filter(pk=self.pk).update(path=self.path)
+        elif old_path != self.path:
+            BlogCategory.objects.rebase(old_path, self.path)
+        return result
 
     def __str__(self):
         return f"Category: {self.name}"
@@ -40,6 +117,13 @@ class BlogPost(models.Model):
         BlogCategory, on_delete=models.SET_NULL, null=True, related_name="posts"
     )
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["-created_at", "-id"], name="blog_post_created_id_idx"
+            ),
+        ]
+
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
@@ -0,0 +1,135 @@
+import re
+from dataclasses import dataclass
+
+from django.db import connection, transaction
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.utils.html import escape
+
+from blog.models import BlogPost
+
+FTS_TABLE = "blog_blogpost_fts"
+TITLE_WEIGHT = 10.0
+CONTENT_WEIGHT = 1.0
+SNIPPET_TOKENS = 16
+# Private-use sentinels FTS5 wraps around matches; they are swapped for
+# <mark> tags only after the snippet text has been escaped.
+MATCH_START = "\ue000"
+MATCH_END = "\ue001"
+
+
+@dataclass
+class SearchHit:
+    post_id: int
+    snippet: str
+    rank: float
+
+
+def is_supported():
+    return connection.vendor == "sqlite"
+
+
+def build_match_expression(query):
+    # Quote every word so user input can never be parsed as FTS5 syntax.
+    terms = re.findall(r"\w+", query)
+    return " ".join(f'"{term}"' for term in terms)
+
+
+def match_filter(query):
+    """Return a ``Q`` selecting posts whose title or content match ``query``."""
+    match = build_match_expression(query)
+    if not match:
+        return Q(pk__in=[])
+    return Q(
+        pk__in=RawSQL(
+            f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match]
+        )
+    )
+
+
+def index_posts(rows):
+    """Insert or replace ``(id, title, content)`` rows in the search index."""
+    rows = list(rows)
+    if not rows or not is_supported():
+        return
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [(row[0],) for row in rows]
+        )
+        cursor.executemany(
+            f"INSERT INTO {FTS_TABLE} (rowid, title, content) VALUES (%s, %s, %s)",
+            rows,
+        )
+
+
+def remove_posts(post_ids):
+    post_ids = list(post_ids)
+    if not post_ids or not is_supported():
+        return
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [(pk,) for pk in post_ids]
+        )
+
+
+def rebuild_index(batch_size=5000):
+    if not is_supported():
+        return 0
+    indexed = 0
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE}")
+            batch = []
+            rows = (
+                BlogPost.objects.order_by("id")
+                .values_list("id", "title", "content")
+                .iterator(chunk_size=batch_size)
+            )
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    cursor.executemany(
+                        f"INSERT INTO {FTS_TABLE} (rowid, title, content) "
+                        "VALUES (%s, %s, %s)",
+                        batch,
+                    )
+                    indexed += len(batch)
+                    batch = []
+            if batch:
+                cursor.executemany(
+                    f"INSERT INTO {FTS_TABLE} (rowid, title, content) "
+                    "VALUES (%s, %s, %s)",
+                    batch,
+                )
+                indexed += len(batch)
+            cursor.execute(f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('optimize')")
+    return indexed
+
+
+def search(query, limit=20):
+    match = build_match_expression(query)
+    if not match:
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT rowid, snippet({FTS_TABLE}, -1, %s, %s, '…', %s), "
+            f"bm25({FTS_TABLE}, %s, %s) AS rank "
+            f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s ORDER BY rank LIMIT %s",
+            [
+                MATCH_START,
+                MATCH_END,
+                SNIPPET_TOKENS,
+                TITLE_WEIGHT,
+                CONTENT_WEIGHT,
+                match,
+                limit,
+            ],
+        )
+        return [
+            SearchHit(post_id, highlight(snippet), rank)
+            for post_id, snippet, rank in cursor.fetchall()
+        ]
+
+
+def highlight(snippet):
+    return escape(snippet).replace(MATCH_START, "<mark>").replace(MATCH_END, "</mark>")
@@ -0,0 +1,221 @@
+import random
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import accumulate
+
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils.text import slugify
+
+from blog import cache, search
+from blog.bulk import allocate_slugs
+from blog.models import BlogCategory, BlogPost, BlogTag
+from blog.signals import posts_bulk_created
+
+SENTENCE_LENGTH = 12
+
+
+@dataclass
+class SeedResult:
+    posts: int = 0
+    tag_links: int = 0
+    tags: int = 0
+    categories: int = 0
+    deferred_indexes: tuple = ()
+
+    @property
+    def rows(self):
+        return self.posts + self.tag_links + self.tags + self.categories
+
+
+def word_pool():
+    from faker.providers.lorem.en_US import Provider
+
+    return tuple(Provider.word_list)
+
+
+class TextGenerator:
+    """
+    Produce titles and bodies from a fixed word pool.
+
+    Each batch draws all of its words with a single ``choices`` call and
+    slices them, instead of generating text field by field.
+    """
+
+    def __init__(self, rng, words=None):
+        self.rng = rng
+        self.words = words or word_pool()
+
+    def phrases(self, count, min_words, max_words):
+        lengths = [self.rng.randint(min_words, max_words) for _ in range(count)]
+        words = self.rng.choices(self.words, k=sum(lengths))
+        ends = list(accumulate(lengths))
+        return [words[end - length : end] for length, end in zip(lengths, ends)]
+
+    def titles(self, count):
+        return [" ".join(words).capitalize() for words in self.phrases(count, 3, 8)]
+
+    def bodies(self, count, min_words, max_words):
+        return [
+            ". ".join(
+                " ".join(words[start : start + SENTENCE_LENGTH]).capitalize()
+                for start in range(0, len(words), SENTENCE_LENGTH)
+            )
+            + "."
+            for words in self.phrases(count, min_words, max_words)
+        ]
+
+
+@contextmanager
+def deferred_indexes(models):
+    """
+    Drop the non-unique secondary indexes of ``models`` during a bulk load
+    and recreate them afterwards, all in one transaction.
+
+    Only SQLite is handled; its DDL is transactional, so a failed load rolls
+    the indexes back as well. Unique indexes are kept so constraints still
+    hold while loading.
+    """
+    with transaction.atomic():
+        if connection.vendor != "sqlite":
+            yield ()
+            return
+        tables = [model._meta.db_table for model in models]
+        placeholders = ", ".join(["%s"] * len(tables))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT name, sql FROM sqlite_master WHERE type = 'index' "
+                f"AND sql IS NOT NULL AND tbl_name IN ({placeholders})",
+                tables,
+            )
+            indexes = [
+                (name, sql)
+                for name, sql in cursor.fetchall()
+                if not sql.upper().startswith("CREATE UNIQUE")
+            ]
+            for name, _ in indexes:
+                cursor.execute(f"DROP INDEX {connection.ops.quote_name(name)}")
+        yield tuple(name for name, _ in indexes)
+        with connection.cursor() as cursor:
+            for _, sql in indexes:
+                cursor.execute(sql)
+
+
+def create_categories(rng, text, count, fanout):
+    """Create ``count`` categories as a tree at most ``fanout`` children wide."""
+    offset = BlogCategory.objects.aggregate(last=Max("pk"))["last"] or 0
+    names = iter(text.titles(count))
+    created = []
+    parents = [None]
+    while len(created) < count:
+        level = []
+        for parent in parents:
+            for _ in range(min(rng.randint(1, fanout), count - len(created))):
+                name = next(names)
+                number = offset + len(created) + 1
+                category = BlogCategory(
+                    name=name, parent=parent, slug=f"{slugify(name)}-{number}"
+                )
+                level.append(category)
+                created.append(category)
+        parents = BlogCategory.objects.bulk_create(level)
+    # bulk_create skips BlogCategory.save(), which maintains the paths.
+    for category in created:
+        parent_path = category.parent.path if category.parent else "/"
+        category.path = f"{parent_path}{category.pk}/"
+    BlogCategory.objects.bulk_update(created, ["path"], batch_size=1000)
+    return [category.pk for category in created]
+
+
+def insert_tag_links(links):
+    # Plain executemany; instantiating a through model per row dominates
+    # the load otherwise.
+    through = BlogPost.tags.through
+    table = connection.ops.quote_name(through._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {table} (blogpost_id, blogtag_id) VALUES (%s, %s)", links
+        )
+
+
+def seed_blog(
+    author_ids,
+    posts,
+    tags=0,
+    categories=0,
+    *,
+    category_fanout=5,
+    max_tags=5,
+    zipf_exponent=1.1,
+    min_words=40,
+    max_words=200,
+    batch_size=5000,
+    random_seed=0,
+):
+    """
+    Generate ``posts`` posts plus ``tags`` tags and ``categories`` categories.
+
+    Tag popularity follows a Zipf distribution. The same seed always
+    produces the same content.
+    """
+    rng = random.Random(random_seed)
+    text = TextGenerator(rng)
+    result = SeedResult()
+    tag_counts = Counter()
+    with deferred_indexes(
+        [BlogPost, BlogPost.tags.through, BlogTag, BlogCategory]
+    ) as dropped:
+        result.deferred_indexes = dropped
+        category_ids = create_categories(rng, text, categories, category_fanout)
+        tag_ids = [
+            tag.pk
+            for tag in BlogTag.objects.bulk_create(
+                BlogTag(name=name) for name in text.titles(tags)
+            )
+        ]
+        result.tags = len(tag_ids)
+        result.categories = len(category_ids)
+        if not tag_ids:
+            tag_ids = list(BlogTag.objects.values_list("pk", flat=True))
+        if not category_ids:
+            category_ids = list(BlogCategory.objects.values_list("pk", flat=True))
+        tag_weights = list(
+            accumulate(1 / rank**zipf_exponent for rank in range(1, len(tag_ids) + 1))
+        )
+        taken = set()
+        for offset in range(0, posts, batch_size):
+            size = min(batch_size, posts - offset)
+            titles = text.titles(size)
+            created = BlogPost.objects.bulk_create(
+                BlogPost(
+                    title=title,
+                    content=content,
+                    author_id=rng.choice(author_ids),
+                    category_id=rng.choice(category_ids) if category_ids else None,
+                    slug=slug,
+                )
+                for title, content, slug in zip(
+                    titles,
+                    text.bodies(size, min_words, max_words),
+                    allocate_slugs(titles, taken),
+                )
+            )
+            links = []
+            for post in created:
+                if not tag_ids:
+                    break
+                picked = rng.choices(
+                    tag_ids, cum_weights=tag_weights, k=rng.randint(0, max_tags)
+                )
+                links.extend((post.pk, tag_id) for tag_id in dict.fromkeys(picked))
+            insert_tag_links(links)
+            tag_counts.update(tag_id for _, tag_id in links)
+            search.index_posts((post.pk, post.title, post.content) for post in created)
+            result.posts += len(created)
+            result.tag_links += len(links)
+        BlogTag.objects.adjust_post_counts(tag_counts)
+    cache.invalidate("post", "tag", "category")
+    if result.posts:
+        posts_bulk_created.send(sender=BlogPost, user_ids=set(author_ids))
+    return result
@@ -1,11 +1,42 @@
 from django.contrib.auth.models import User
 from django.contrib.auth.password_validation import validate_password
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
 
 from blog.models import BlogCategory, BlogPost, BlogTag
 
 
+class BulkPrimaryKeyRelatedField(serializers.ManyRelatedField):
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, "__iter__"):
+            self.fail("not_a_list", input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail("empty")
+
+        child = self.child_relation
+        queryset = child.get_queryset()
+        pk_field = queryset.model._meta.pk
+        pks = []
+        for item in data:
+            try:
+                pks.append(pk_field.to_python(item))
+            except DjangoValidationError:
+                child.fail("incorrect_type", data_type=type(item).__name__)
+        objects = queryset.in_bulk(pks)
+        for pk in pks:
+            if pk not in objects:
+                child.fail("does_not_exist", pk_value=pk)
+        return [objects[pk] for pk in pks]
+
+
 class BlogPostSerializer(serializers.ModelSerializer):
+    tags = BulkPrimaryKeyRelatedField(
+        child_relation=serializers.PrimaryKeyRelatedField(
+            queryset=BlogTag.objects.all()
+        ),
+        required=False,
+    )
+
     class Meta:
         model = BlogPost
         fields = ("title", "content", "author", "id", "tags", "slug", "category")
@@ -22,6 +53,14 @@ class BlogPostSerializer(serializers.ModelSerializer):
         return blog_post
 
 
+class BlogPostSearchResultSerializer(BlogPostSerializer):
+    snippet = serializers.CharField(read_only=True)
+    rank = serializers.FloatField(read_only=True)
+
+    class Meta(BlogPostSerializer.Meta):
+        fields = BlogPostSerializer.Meta.fields + ("snippet", "rank")
+
+
 class BlogTagSerializer(serializers.ModelSerializer):
     class Meta:
         model = BlogTag
@@ -31,6 +70,12 @@ class BlogTagSerializer(serializers.ModelSerializer):
         )
 
 
+class BlogTagPopularitySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = BlogTag
+        fields = ("id", "name", "post_count")
+
+
 class BlogCategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = BlogCategory
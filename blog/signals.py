@@ -0,0 +1,80 @@
+from collections import Counter
+
+from django.db.models.signals import (m2m_changed, post_delete, post_save,
+                                      pre_delete)
+from django.dispatch import Signal, receiver
+
+from blog import cache, search
+from blog.models import BlogCategory, BlogPost, BlogTag
+
+# Sent with ``user_ids`` (the authors) after import_posts inserts posts.
+posts_bulk_created = Signal()
+
+
+@receiver(post_save, sender=BlogPost)
+def index_blog_post(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not {"title", "content"} & set(update_fields):
+        return
+    search.index_posts([(instance.pk, instance.title, instance.content)])
+
+
+@receiver(post_delete, sender=BlogPost)
+def unindex_blog_post(sender, instance, **kwargs):
+    search.remove_posts([instance.pk])
+
+
+@receiver(post_save, sender=BlogPost)
+@receiver(post_delete, sender=BlogPost)
+@receiver(m2m_changed, sender=BlogPost.tags.through)
+def invalidate_blog_posts(sender, **kwargs):
+    cache.invalidate("post")
+
+
+@receiver(post_save, sender=BlogTag)
+@receiver(post_delete, sender=BlogTag)
+def invalidate_blog_tags(sender, **kwargs):
+    cache.invalidate("tag")
+
+
+@receiver(post_save, sender=BlogCategory)
+@receiver(post_delete, sender=BlogCategory)
+def invalidate_blog_categories(sender, **kwargs):
+    cache.invalidate("category")
+
+
+@receiver(pre_delete, sender=BlogCategory)
+def reroot_child_categories(sender, instance, **kwargs):
+    # Children are detached by SET_NULL, so their subtrees become new roots.
+    for pk, path in BlogCategory.objects.filter(parent=instance).values_list(
+        "pk", "path"
+    ):
+        BlogCategory.objects.rebase(path, f"/{pk}/")
+
+
+@receiver(m2m_changed, sender=BlogPost.tags.through)
+def update_tag_post_counts(sender, instance, action, reverse, pk_set, **kwargs):
+    # Forward changes come from post.tags, reverse ones from tag.posts.
+    source, target = (
+        ("blogtag_id", "blogpost_id") if reverse else ("blogpost_id", "blogtag_id")
+    )
+    if action == "post_add":
+        tag_ids = [instance.pk] * len(pk_set) if reverse else pk_set
+        BlogTag.objects.adjust_post_counts(Counter(tag_ids))
+    elif action in ("pre_remove", "pre_clear"):
+        rows = sender.objects.filter(**{source: instance.pk})
+        if action == "pre_remove":
+            rows = rows.filter(**{f"{target}__in": pk_set})
+        instance._removed_tag_ids = list(rows.values_list("blogtag_id", flat=True))
+    elif action in ("post_remove", "post_clear"):
+        tag_ids = instance.__dict__.pop("_removed_tag_ids", [])
+        BlogTag.objects.adjust_post_counts(
+            {pk: -count for pk, count in Counter(tag_ids).items()}
+        )
+
+
+@receiver(pre_delete, sender=BlogPost)
+def release_tag_post_counts(sender, instance, **kwargs):
+    tag_ids = BlogPost.tags.through.objects.filter(blogpost_id=instance.pk)
+    BlogTag.objects.adjust_post_counts(
+        {pk: -1 for pk in tag_ids.values_list("blogtag_id", flat=True)}
+    )
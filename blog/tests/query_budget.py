@@ -0,0 +1,42 @@
+from contextlib import contextmanager
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudgetMixin:
+    """
+    Assertions for keeping endpoints at a fixed number of queries.
+
+    ``assertQueryBudget`` caps the queries run inside a block, and
+    ``assertConstantQueries`` fails when the count for a request grows with
+    the number of rows created by ``populate``.
+    """
+
+    @contextmanager
+    def assertQueryBudget(self, budget):
+        with CaptureQueriesContext(connection) as context:
+            yield context
+        if len(context) > budget:
+            queries = "\n".join(
+                f"{i}. {query['sql']}"
+                for i, query in enumerate(context.captured_queries, start=1)
+            )
+            self.fail(f"{len(context)} queries executed, budget is {budget}\n{queries}")
+
+    def assertConstantQueries(self, request, populate, sizes=(1, 10), budget=None):
+        counts = []
+        for size in sizes:
+            populate(size)
+            with CaptureQueriesContext(connection) as context:
+                response = request()
+            self.assertLess(response.status_code, 400, response.content)
+            counts.append(len(context))
+        self.assertEqual(
+            len(set(counts)),
+            1,
+            f"query count grows with rows: {dict(zip(sizes, counts))}",
+        )
+        if budget is not None:
+            self.assertLessEqual(counts[0], budget)
+        return counts[0]
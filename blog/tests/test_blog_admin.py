@@ -0,0 +1,70 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+
+from blog.tests.query_budget import QueryBudgetMixin
+from core.factories import BlogCategoryFactory, BlogPostFactory, BlogTagFactory
+from core.pagination import EstimatedCountPaginator
+from core.tests import AuthenticationTestCase
+
+
+class BlogAdminTest(QueryBudgetMixin, AuthenticationTestCase):
+    def setUp(self):
+        super().setUp()
+        self.admin = User.objects.create_superuser(username="admin", password="x")
+        self.client.force_login(self.admin)
+
+    def create_posts(self, count):
+        for _ in range(count):
+            BlogPostFactory(
+                author=self.test_user,
+                category=BlogCategoryFactory(),
+                content="lorem " * 200,
+            ).tags.add(BlogTagFactory())
+
+    def test_post_changelist_query_count_is_constant(self):
+        url = reverse("admin:blog_blogpost_changelist")
+        self.assertConstantQueries(
+            lambda: self.client.get(url), self.create_posts, budget=8
+        )
+
+    def test_tag_and_category_changelists_query_count_is_constant(self):
+        for name in ("blogtag", "blogcategory"):
+            url = reverse(f"admin:blog_{name}_changelist")
+            self.assertConstantQueries(
+                lambda: self.client.get(url), self.create_posts, budget=6
+            )
+
+    def test_post_changelist_shows_truncated_preview(self):
+        self.create_posts(1)
+        response = self.client.get(reverse("admin:blog_blogpost_changelist"))
+        self.assertContains(response, "lorem lorem")
+        self.assertNotContains(response, "lorem " * 20)
+
+    def test_post_search_uses_full_text_index(self):
+        BlogPostFactory(author=self.test_user, title="Async views", content="x")
+        BlogPostFactory(author=self.test_user, title="Other", content="asyncio")
+        BlogPostFactory(author=self.admin, title="Unrelated", content="y")
+        url = reverse("admin:blog_blogpost_changelist")
+        response = self.client.get(url, {"q": "async"})
+        self.assertEqual(
+            [post.title for post in response.context["cl"].result_list],
+            ["Async views"],
+        )
+        response = self.client.get(url, {"q": self.admin.username})
+        self.assertEqual(
+            [post.title for post in response.context["cl"].result_list],
+            ["Unrelated"],
+        )
+
+    def test_large_changelist_uses_estimated_count(self):
+        self.create_posts(3)
+        url = reverse("admin:blog_blogpost_changelist")
+        with mock.patch.object(EstimatedCountPaginator, "exact_count_threshold", 1):
+            with self.assertQueryBudget(8) as context:
+                response = self.client.get(url)
+        self.assertFalse(
+            any("COUNT(*)" in query["sql"] for query in context.captured_queries)
+        )
+        self.assertEqual(response.context["cl"].result_count, 3)
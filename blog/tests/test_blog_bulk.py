@@ -0,0 +1,134 @@
+import json
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+
+from blog.bulk import allocate_slugs
+from blog.models import BlogPost
+from blog.tests.query_budget import QueryBudgetMixin
+from blog.tests.test_blog_views import AuthenticatedUserTestCase
+from core.factories import BlogCategoryFactory, BlogPostFactory, BlogTagFactory
+
+
+class BlogBulkImportTest(QueryBudgetMixin, AuthenticatedUserTestCase):
+    def test_allocate_slugs_resolves_collisions(self):
+        BlogPostFactory(author=self.test_user, title="Hello world")
+        BlogPostFactory(
+            author=self.test_user, title="Hello world", slug="hello-world-2"
+        )
+        self.assertEqual(
+            allocate_slugs(["Hello world", "Hello world", "Other", "!!!"]),
+            ["hello-world-3", "hello-world-4", "other", "post"],
+        )
+
+    def test_bulk_create_blog_posts(self):
+        tag = BlogTagFactory()
+        category = BlogCategoryFactory()
+        url = reverse("blog:bulk_create_blog_posts")
+        data = [
+            {"title": "first", "content": "one", "tags": [tag.id]},
+            {"title": "first", "content": "two", "category": category.id},
+        ]
+        response = self.client.post(url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()["errors"], [])
+        posts = BlogPost.objects.order_by("id")
+        self.assertEqual(response.json()["created"], [post.id for post in posts])
+        self.assertEqual([post.slug for post in posts], ["first", "first-2"])
+        self.assertEqual({post.author for post in posts}, {self.test_user})
+        self.assertEqual(list(posts[0].tags.all()), [tag])
+        self.assertEqual(posts[1].category, category)
+        tag.refresh_from_db()
+        self.assertEqual(tag.post_count, 1)
+        search_url = reverse("blog:search_blog_posts")
+        response = self.client.get(search_url, {"q": "two"}, format="json")
+        self.assertEqual([post["id"] for post in response.json()], [posts[1].id])
+
+    def test_bulk_create_reports_item_errors(self):
+        url = reverse("blog:bulk_create_blog_posts")
+        data = [
+            {"title": "first", "content": "one"},
+            {"title": "second"},
+            {"title": "third", "content": "three", "tags": [999]},
+        ]
+        response = self.client.post(url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.json()["created"]), 1)
+        self.assertEqual(
+            response.json()["errors"],
+            [
+                {"index": 1, "errors": {"content": ["This field is required."]}},
+                {"index": 2, "errors": {"tags": ['Invalid pk "999".']}},
+            ],
+        )
+        self.assertEqual(BlogPost.objects.get().title, "first")
+
+    def test_bulk_create_rejects_non_list(self):
+        url = reverse("blog:bulk_create_blog_posts")
+        response = self.client.post(url, {"title": "x"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_create_query_count_is_constant(self):
+        url = reverse("blog:bulk_create_blog_posts")
+        tags = [BlogTagFactory().id for _ in range(3)]
+        payload = []
+
+        def grow(count):
+            payload[:] = [
+                {"title": f"post {count} {i}", "content": "text", "tags": tags}
+                for i in range(count)
+            ]
+
+        self.assertConstantQueries(
+            lambda: self.client.post(url, payload, format="json"), grow
+        )
+
+    def test_import_posts_command(self):
+        tag = BlogTagFactory()
+        lines = [
+            json.dumps({"title": "first", "content": "one", "tags": [tag.id]}),
+            "not json",
+            json.dumps({"title": "second", "content": "two", "author": 999}),
+            json.dumps({"title": "third", "content": "three"}),
+        ]
+        with tempfile.NamedTemporaryFile("w", suffix=".ndjson") as source:
+            source.write("\n".join(lines))
+            source.flush()
+            out, err = StringIO(), StringIO()
+            call_command(
+                "import_posts",
+                source.name,
+                author=self.test_user.id,
+                chunk_size=2,
+                stdout=out,
+                stderr=err,
+            )
+        self.assertIn("Imported 2 posts (2 failed)", out.getvalue())
+        self.assertIn("line 2:", err.getvalue())
+        self.assertIn('line 3: {"author"', err.getvalue())
+        self.assertCountEqual(
+            BlogPost.objects.values_list("title", flat=True), ["first", "third"]
+        )
+
+    def test_import_posts_command_reports_non_object_lines(self):
+        lines = ["[1]", "5", '"x"', json.dumps({"title": "kept", "content": "c"})]
+        with tempfile.NamedTemporaryFile("w", suffix=".ndjson") as source:
+            source.write("\n".join(lines))
+            source.flush()
+            out, err = StringIO(), StringIO()
+            call_command(
+                "import_posts",
+                source.name,
+                author=self.test_user.id,
+                stdout=out,
+                stderr=err,
+            )
+        self.assertIn("Imported 1 posts (3 failed)", out.getvalue())
+        for line_number in (1, 2, 3):
+            self.assertIn(f"line {line_number}: ", err.getvalue())
+        self.assertEqual(
+            list(BlogPost.objects.values_list("title", flat=True)), ["kept"]
+        )
@@ -0,0 +1,131 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from blog import cache
+from blog.models import BlogTag
+from blog.tests.test_blog_views import AuthenticatedUserTestCase
+from core.factories import BlogCategoryFactory, BlogPostFactory, BlogTagFactory
+
+
+class BlogResponseCacheTest(AuthenticatedUserTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.stats.reset()
+
+    def test_list_blog_posts_is_served_from_cache(self):
+        blog_post = BlogPostFactory(author=self.test_user)
+        url = reverse("blog:list_blog_posts")
+        first = self.client.get(url, format="json")
+        with self.assertNumQueries(0):
+            second = self.client.get(url, format="json")
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual([post["id"] for post in second.json()], [blog_post.id])
+        self.assertEqual(
+            cache.stats.snapshot(),
+            {"blog:list_blog_posts": {"hits": 1, "misses": 1}},
+        )
+
+    def test_cache_key_normalizes_tag_order(self):
+        tag_1 = BlogTagFactory()
+        tag_2 = BlogTagFactory()
+        url = reverse("blog:list_blog_posts")
+        self.client.get(url, {"tags": f"{tag_1.name},{tag_2.name}"}, format="json")
+        response = self.client.get(
+            url, {"tags": f"{tag_2.name},{tag_1.name}"}, format="json"
+        )
+        self.assertEqual(response["X-Cache"], "HIT")
+
+    def test_cache_key_includes_filters(self):
+        BlogPostFactory(author=self.test_user)
+        url = reverse("blog:list_blog_posts")
+        self.client.get(url, format="json")
+        response = self.client.get(url, {"author": "999"}, format="json")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json(), [])
+
+    def test_post_write_invalidates_list_and_retrieve(self):
+        blog_post = BlogPostFactory(author=self.test_user)
+        list_url = reverse("blog:list_blog_posts")
+        url = reverse("blog:get_blog_post", kwargs={"slug": blog_post.slug})
+        self.client.get(list_url, format="json")
+        self.client.get(url, format="json")
+        response = self.client.patch(url, {"title": "second"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(url, format="json")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["title"], "second")
+        response = self.client.get(list_url, format="json")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()[0]["title"], "second")
+
+    def test_tag_assignment_invalidates_post_retrieve(self):
+        blog_post = BlogPostFactory(author=self.test_user)
+        url = reverse("blog:get_blog_post", kwargs={"slug": blog_post.slug})
+        self.client.get(url, format="json")
+        blog_tag = BlogTagFactory()
+        blog_post.tags.add(blog_tag)
+        response = self.client.get(url, format="json")
+        self.assertEqual(response.json()["tags"], [blog_tag.id])
+
+    def test_tag_write_invalidates_tag_list_only(self):
+        BlogCategoryFactory()
+        tags_url = reverse("blog:list_blog_tags")
+        categories_url = reverse("blog:list_blog_categories")
+        self.client.get(tags_url, format="json")
+        self.client.get(categories_url, format="json")
+        BlogTag.objects.create(name="new")
+        self.assertEqual(self.client.get(tags_url, format="json")["X-Cache"], "MISS")
+        self.assertEqual(
+            self.client.get(categories_url, format="json")["X-Cache"], "HIT"
+        )
+
+    def test_category_delete_invalidates_post_list(self):
+        category = BlogCategoryFactory()
+        BlogPostFactory(author=self.test_user, category=category)
+        url = reverse("blog:list_blog_posts")
+        self.assertEqual(
+            self.client.get(url, format="json").json()[0]["category"], category.id
+        )
+        category.delete()
+        self.assertIsNone(self.client.get(url, format="json").json()[0]["category"])
+
+    def test_errors_are_not_cached(self):
+        url = reverse("blog:list_blog_posts")
+        self.client.get(url, {"cursor": "garbage"}, format="json")
+        response = self.client.get(url, {"cursor": "garbage"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(
+            cache.stats.snapshot(),
+            {"blog:list_blog_posts": {"hits": 0, "misses": 2}},
+        )
+
+    @override_settings(ALLOWED_HOSTS=["a.example.com", "b.example.com"])
+    def test_cached_next_links_do_not_embed_the_host(self):
+        BlogPostFactory.create_batch(3, author=self.test_user)
+        url = reverse("blog:list_blog_posts")
+        response = self.client.get(
+            url, {"page_size": 1}, format="json", HTTP_HOST="a.example.com"
+        )
+        self.assertTrue(response.json()["next"].startswith(url))
+        response = self.client.get(
+            url, {"page_size": 1}, format="json", HTTP_HOST="b.example.com"
+        )
+        self.assertEqual(response["X-Cache"], "HIT")
+        self.assertNotIn("a.example.com", response.json()["next"])
+
+    def test_deploy_check_flags_process_local_cache(self):
+        self.assertEqual(
+            [error.id for error in cache.check_shared_cache(None)], ["blog.W001"]
+        )
+        with self.settings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                    "LOCATION": "redis://localhost:6379",
+                }
+            }
+        ):
+            self.assertEqual(cache.check_shared_cache(None), [])
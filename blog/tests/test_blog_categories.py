@@ -0,0 +1,114 @@
+from django.urls import reverse
+from rest_framework import status
+
+from blog.models import BlogCategory
+from blog.tests.test_blog_views import AuthenticatedUserTestCase
+from core.factories import BlogCategoryFactory, BlogPostFactory
+
+
+class BlogCategoryTreeTest(AuthenticatedUserTestCase):
+    def setUp(self):
+        super().setUp()
+        self.root = BlogCategoryFactory(name="root")
+        self.child = BlogCategoryFactory(name="child", parent=self.root)
+        self.grandchild = BlogCategoryFactory(name="grandchild", parent=self.child)
+        self.other = BlogCategoryFactory(name="other")
+
+    def refresh(self):
+        for category in (self.root, self.child, self.grandchild, self.other):
+            category.refresh_from_db()
+
+    def test_paths_are_materialized_on_save(self):
+        self.refresh()
+        self.assertEqual(self.root.path, f"/{self.root.id}/")
+        self.assertEqual(self.child.path, f"/{self.root.id}/{self.child.id}/")
+        self.assertEqual(
+            self.grandchild.path,
+            f"/{self.root.id}/{self.child.id}/{self.grandchild.id}/",
+        )
+
+    def test_reparenting_moves_the_subtree(self):
+        self.child.parent = self.other
+        self.child.save()
+        self.refresh()
+        self.assertEqual(self.child.path, f"/{self.other.id}/{self.child.id}/")
+        self.assertEqual(
+            self.grandchild.path,
+            f"/{self.other.id}/{self.child.id}/{self.grandchild.id}/",
+        )
+        self.assertCountEqual(BlogCategory.objects.subtree(self.root.path), [self.root])
+
+    def test_cannot_move_category_under_its_descendant(self):
+        self.root.parent = self.grandchild
+        with self.assertRaises(ValueError):
+            self.root.save()
+
+    def test_deleting_a_category_reroots_its_children(self):
+        self.child.delete()
+        self.grandchild.refresh_from_db()
+        self.assertIsNone(self.grandchild.parent)
+        self.assertEqual(self.grandchild.path, f"/{self.grandchild.id}/")
+
+    def test_subtree_does_not_match_ids_sharing_a_prefix(self):
+        BlogCategory.objects.filter(pk=self.other.pk).update(path=f"/{self.root.id}0/")
+        self.refresh()
+        self.assertCountEqual(
+            BlogCategory.objects.subtree(self.root.path),
+            [self.root, self.child, self.grandchild],
+        )
+
+    def test_list_posts_filters_by_category_tree(self):
+        post_root = BlogPostFactory(author=self.test_user, category=self.root)
+        post_grandchild = BlogPostFactory(
+            author=self.test_user, category=self.grandchild
+        )
+        BlogPostFactory(author=self.test_user, category=self.other)
+        BlogPostFactory(author=self.test_user)
+        url = reverse("blog:list_blog_posts")
+        response = self.client.get(url, {"category_tree": self.root.slug})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertCountEqual(
+            [post["id"] for post in response.json()],
+            [post_root.id, post_grandchild.id],
+        )
+        response = self.client.get(url, {"category_tree": self.child.slug})
+        self.assertEqual([post["id"] for post in response.json()], [post_grandchild.id])
+        response = self.client.get(url, {"category_tree": "missing"})
+        self.assertEqual(response.json(), [])
+
+    def test_category_tree_is_built_from_one_query(self):
+        url = reverse("blog:blog_category_tree")
+        with self.assertNumQueries(1):
+            response = self.client.get(url, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            [
+                {
+                    "id": self.other.id,
+                    "name": "other",
+                    "slug": self.other.slug,
+                    "children": [],
+                },
+                {
+                    "id": self.root.id,
+                    "name": "root",
+                    "slug": self.root.slug,
+                    "children": [
+                        {
+                            "id": self.child.id,
+                            "name": "child",
+                            "slug": self.child.slug,
+                            "children": [
+                                {
+                                    "id": self.grandchild.id,
+                                    "name": "grandchild",
+                                    "slug": self.grandchild.slug,
+                                    "children": [],
+                                }
+                            ],
+                        }
+                    ],
+                },
+            ],
+        )
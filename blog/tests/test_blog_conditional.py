@@ -0,0 +1,111 @@
+from django.urls import reverse
+from django.utils.http import http_date
+from rest_framework import status
+
+from blog.tests.test_blog_views import AuthenticatedUserTestCase
+from core.factories import BlogCategoryFactory, BlogPostFactory, BlogTagFactory
+
+
+class BlogConditionalRequestTest(AuthenticatedUserTestCase):
+    def setUp(self):
+        super().setUp()
+        self.blog_post = BlogPostFactory(author=self.test_user)
+        self.url = reverse("blog:get_blog_post", kwargs={"slug": self.blog_post.slug})
+
+    def test_retrieve_sets_validators(self):
+        response = self.client.get(self.url, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertEqual(
+            response["Last-Modified"],
+            http_date(int(self.blog_post.created_at.timestamp())),
+        )
+
+    def test_if_none_match_returns_not_modified_in_one_lookup(self):
+        etag = self.client.get(self.url, format="json")["ETag"]
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_if_modified_since_returns_not_modified(self):
+        last_modified = self.client.get(self.url, format="json")["Last-Modified"]
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_etag_changes_after_update(self):
+        etag = self.client.get(self.url, format="json")["ETag"]
+        response = self.client.patch(self.url, {"title": "second"}, format="json")
+        self.assertNotEqual(response["ETag"], etag)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["title"], "second")
+
+    def test_if_match_rejects_stale_update(self):
+        etag = self.client.get(self.url, format="json")["ETag"]
+        response = self.client.patch(
+            self.url, {"title": "second"}, format="json", HTTP_IF_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.patch(
+            self.url, {"title": "third"}, format="json", HTTP_IF_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.blog_post.refresh_from_db()
+        self.assertEqual(self.blog_post.title, "second")
+
+    def test_missing_post_returns_not_found(self):
+        url = reverse("blog:get_blog_post", kwargs={"slug": "missing"})
+        response = self.client.get(url, HTTP_IF_NONE_MATCH='"abc"')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_category_conditional_retrieve(self):
+        category = BlogCategoryFactory()
+        url = reverse("blog:get_blog_category", kwargs={"slug": category.slug})
+        etag = self.client.get(url, format="json")["ETag"]
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def assertETagChanged(self, etag):
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        return response.json()
+
+    def test_etag_changes_when_tags_are_added(self):
+        tag = BlogTagFactory()
+        etag = self.client.get(self.url, format="json")["ETag"]
+        self.blog_post.tags.add(tag)
+        self.assertEqual(self.assertETagChanged(etag)["tags"], [tag.id])
+
+    def test_etag_changes_when_post_is_tagged_from_the_tag(self):
+        tag = BlogTagFactory()
+        etag = self.client.get(self.url, format="json")["ETag"]
+        tag.posts.add(self.blog_post)
+        etag = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)["ETag"]
+        tag.posts.clear()
+        self.assertEqual(self.assertETagChanged(etag)["tags"], [])
+
+    def test_etag_changes_when_tag_is_deleted(self):
+        tag = BlogTagFactory()
+        self.blog_post.tags.add(tag)
+        etag = self.client.get(self.url, format="json")["ETag"]
+        tag.delete()
+        self.assertEqual(self.assertETagChanged(etag)["tags"], [])
+
+    def test_retagging_keeps_created_at(self):
+        created_at = self.blog_post.created_at
+        tag = BlogTagFactory()
+        self.blog_post.tags.add(tag)
+        tag.delete()
+        self.blog_post.refresh_from_db()
+        self.assertEqual(self.blog_post.created_at, created_at)
+
+    def test_etag_changes_when_category_is_deleted(self):
+        category = BlogCategoryFactory()
+        self.blog_post.category = category
+        self.blog_post.save()
+        etag = self.client.get(self.url, format="json")["ETag"]
+        category.delete()
+        self.assertIsNone(self.assertETagChanged(etag)["category"])
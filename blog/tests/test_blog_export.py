@@ -0,0 +1,82 @@
+import csv
+import io
+import json
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from blog.tests.query_budget import QueryBudgetMixin
+from blog.tests.test_blog_views import AuthenticatedUserTestCase
+from core.factories import BlogPostFactory, BlogTagFactory
+
+
+class BlogExportTest(QueryBudgetMixin, AuthenticatedUserTestCase):
+    def export(self, **params):
+        url = reverse("blog:export_blog_posts")
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return response, b"".join(response.streaming_content).decode()
+
+    def test_export_ndjson(self):
+        tag = BlogTagFactory()
+        blog_post = BlogPostFactory(author=self.test_user, content="ünïcode")
+        blog_post.tags.add(tag)
+        response, body = self.export()
+        self.assertEqual(
+            response["Content-Type"], "application/x-ndjson; charset=utf-8"
+        )
+        self.assertEqual(
+            [json.loads(line) for line in body.splitlines()],
+            [
+                {
+                    "title": blog_post.title,
+                    "content": "ünïcode",
+                    "author": self.test_user.id,
+                    "id": blog_post.id,
+                    "tags": [tag.id],
+                    "slug": blog_post.slug,
+                    "category": None,
+                }
+            ],
+        )
+
+    def test_export_csv(self):
+        tags = [BlogTagFactory(), BlogTagFactory()]
+        blog_post = BlogPostFactory(author=self.test_user, content='a, "quoted"')
+        blog_post.tags.add(*tags)
+        response, body = self.export(format="csv")
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["content"], 'a, "quoted"')
+        self.assertEqual(rows[0]["tags"], f"{tags[0].id};{tags[1].id}")
+
+    def test_export_applies_list_filters(self):
+        other = BlogPostFactory(author=self.test_user)
+        tag = BlogTagFactory()
+        tagged = BlogPostFactory(author=self.test_user)
+        tagged.tags.add(tag)
+        _, body = self.export(tags=tag.name)
+        self.assertEqual(
+            [json.loads(line)["id"] for line in body.splitlines()], [tagged.id]
+        )
+        _, body = self.export(author="999")
+        self.assertEqual(body, "")
+
+    @override_settings(BLOG_EXPORT_CHUNK_SIZE=2)
+    def test_export_prefetches_per_chunk(self):
+        tag = BlogTagFactory()
+        for _ in range(6):
+            BlogPostFactory(author=self.test_user).tags.add(tag)
+        url = reverse("blog:export_blog_posts")
+        with self.assertQueryBudget(1 + 3 * 2):
+            response = self.client.get(url)
+            lines = b"".join(response.streaming_content).splitlines()
+        self.assertEqual(len(lines), 6)
+
+    def test_export_requires_authentication(self):
+        self.client.credentials()
+        response = self.client.get(reverse("blog:export_blog_posts"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,74 @@
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+
+from blog.fast import FastJSONRenderer
+from blog.models import BlogPost
+from blog.serializers import BlogPostSerializer
+from blog.tests.query_budget import QueryBudgetMixin
+from blog.tests.test_blog_views import AuthenticatedUserTestCase
+from core.factories import BlogCategoryFactory, BlogPostFactory, BlogTagFactory
+
+
+class BlogFastSerializationTest(QueryBudgetMixin, AuthenticatedUserTestCase):
+    def setUp(self):
+        super().setUp()
+        tags = [BlogTagFactory() for _ in range(3)]
+        category = BlogCategoryFactory(name="Caté\u2028gory")
+        for i in range(5):
+            blog_post = BlogPostFactory(
+                author=self.test_user,
+                content=f'ünïcode \u2028 \u2029 \x1f "quoted" {i}',
+                category=category if i % 2 else None,
+            )
+            blog_post.tags.add(*tags[: i % 4])
+
+    def get_both(self, url, params=None):
+        cache.clear()
+        slow = self.client.get(url, params or {})
+        cache.clear()
+        with override_settings(BLOG_FAST_LIST_SERIALIZATION=True):
+            fast = self.client.get(url, params or {})
+        self.assertEqual(slow.status_code, 200)
+        self.assertEqual(fast.status_code, 200)
+        return slow, fast
+
+    def test_post_list_is_byte_identical(self):
+        slow, fast = self.get_both(reverse("blog:list_blog_posts"))
+        self.assertEqual(fast.content, slow.content)
+        posts = BlogPost.objects.order_by("-created_at", "-id")
+        expected = JSONRenderer().render(BlogPostSerializer(posts, many=True).data)
+        self.assertEqual(fast.content, expected)
+
+    def test_filtered_page_is_byte_identical(self):
+        url = reverse("blog:list_blog_posts")
+        slow, fast = self.get_both(url, {"page_size": 2, "author": self.test_user.id})
+        self.assertEqual(fast.content, slow.content)
+        next_url = fast.json()["next"]
+        slow, fast = self.get_both(next_url)
+        self.assertEqual(fast.content, slow.content)
+
+    def test_tag_and_category_lists_are_byte_identical(self):
+        for name in ("blog:list_blog_tags", "blog:list_blog_categories"):
+            slow, fast = self.get_both(reverse(name))
+            self.assertEqual(fast.content, slow.content)
+
+    @override_settings(BLOG_FAST_LIST_SERIALIZATION=True)
+    def test_fast_post_list_query_count_is_constant(self):
+        url = reverse("blog:list_blog_posts")
+
+        def grow(count):
+            cache.clear()
+            for _ in range(count):
+                BlogPostFactory(author=self.test_user).tags.add(BlogTagFactory())
+
+        self.assertConstantQueries(lambda: self.client.get(url), grow, budget=3)
+
+    def test_fast_renderer_matches_json_renderer(self):
+        data = [{"a": "\u2028\u2029", "b": [1, None, True], "c": "é/\x00"}]
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+        self.assertEqual(
+            FastJSONRenderer().render(data, "application/json; indent=2"),
+            JSONRenderer().render(data, "application/json; indent=2"),
+        )
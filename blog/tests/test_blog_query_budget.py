@@ -0,0 +1,63 @@
+from django.urls import reverse
+
+from blog.models import BlogPost
+from blog.tests.query_budget import QueryBudgetMixin
+from blog.tests.test_blog_views import AuthenticatedUserTestCase
+from core.factories import BlogCategoryFactory, BlogPostFactory, BlogTagFactory
+
+
+class BlogQueryBudgetTest(QueryBudgetMixin, AuthenticatedUserTestCase):
+    def create_posts(self, count):
+        tags = [BlogTagFactory(), BlogTagFactory()]
+        for _ in range(count):
+            blog_post = BlogPostFactory(
+                author=self.test_user, category=BlogCategoryFactory()
+            )
+            blog_post.tags.add(*tags)
+
+    def test_list_blog_posts_query_count_is_constant(self):
+        url = reverse("blog:list_blog_posts")
+        self.assertConstantQueries(
+            lambda: self.client.get(url, format="json"), self.create_posts, budget=3
+        )
+
+    def test_list_blog_posts_page_query_count_is_constant(self):
+        url = reverse("blog:list_blog_posts")
+        self.assertConstantQueries(
+            lambda: self.client.get(url, {"page_size": 5}, format="json"),
+            self.create_posts,
+            budget=3,
+        )
+
+    def test_retrieve_blog_post_query_count_is_constant(self):
+        blog_post = BlogPostFactory(author=self.test_user)
+        url = reverse("blog:get_blog_post", kwargs={"slug": blog_post.slug})
+
+        def add_tags(count):
+            blog_post.tags.add(*[BlogTagFactory() for _ in range(count)])
+
+        self.assertConstantQueries(
+            lambda: self.client.get(url, format="json"), add_tags, budget=4
+        )
+
+    def test_create_blog_post_query_count_is_constant(self):
+        url = reverse("blog:blog_post")
+        tag_ids = []
+
+        def add_tags(count):
+            BlogPost.objects.all().delete()
+            tag_ids.extend(BlogTagFactory().id for _ in range(count))
+
+        self.assertConstantQueries(
+            lambda: self.client.post(
+                url,
+                {"title": "first", "content": "lorum ipsum", "tags": tag_ids},
+                format="json",
+            ),
+            add_tags,
+        )
+
+    def test_query_budget_reports_queries_over_budget(self):
+        with self.assertRaises(AssertionError):
+            with self.assertQueryBudget(0):
+                BlogPost.objects.count()
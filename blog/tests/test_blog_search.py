@@ -0,0 +1,90 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+
+from blog.models import BlogPost
+from blog.tests.test_blog_views import AuthenticatedUserTestCase
+from core.factories import BlogPostFactory
+
+
+class BlogSearchTest(AuthenticatedUserTestCase):
+    def search(self, query, **params):
+        url = reverse("blog:search_blog_posts")
+        return self.client.get(url, {"q": query, **params}, format="json")
+
+    def test_search_ranks_title_matches_first(self):
+        content_match = BlogPostFactory(
+            author=self.test_user, title="Gardening", content="all about django"
+        )
+        title_match = BlogPostFactory(
+            author=self.test_user, title="Django tips", content="some tips"
+        )
+        BlogPostFactory(author=self.test_user, title="Cooking", content="pasta")
+        response = self.search("django")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()
+        self.assertEqual(
+            [post["id"] for post in results], [title_match.id, content_match.id]
+        )
+        self.assertIn("<mark>", results[0]["snippet"])
+        self.assertEqual(results[1]["snippet"], "all about <mark>django</mark>")
+
+    def test_search_snippets_escape_post_content(self):
+        BlogPostFactory(
+            author=self.test_user,
+            title="Markup",
+            content='<script>alert("django")</script> & more',
+        )
+        snippet = self.search("django").json()[0]["snippet"]
+        self.assertNotIn("<script>", snippet)
+        self.assertEqual(
+            snippet,
+            "&lt;script&gt;alert(&quot;<mark>django</mark>&quot;)&lt;/script&gt; "
+            "&amp; more",
+        )
+
+    def test_search_matches_word_stems(self):
+        blog_post = BlogPostFactory(
+            author=self.test_user, title="Queries", content="running migrations"
+        )
+        response = self.search("run migration")
+        self.assertEqual([post["id"] for post in response.json()], [blog_post.id])
+
+    def test_search_index_follows_updates_and_deletes(self):
+        blog_post = BlogPostFactory(
+            author=self.test_user, title="Original", content="first draft"
+        )
+        blog_post.title = "Rewritten"
+        blog_post.save()
+        self.assertEqual(self.search("original").json(), [])
+        self.assertEqual(len(self.search("rewritten").json()), 1)
+        blog_post.delete()
+        self.assertEqual(self.search("rewritten").json(), [])
+
+    def test_search_escapes_query_syntax(self):
+        BlogPostFactory(author=self.test_user, title="Quotes", content="a b c")
+        response = self.search('"unbalanced OR NEAR(')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), [])
+
+    def test_search_requires_query(self):
+        response = self.search("")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_search_limits_results(self):
+        for _ in range(3):
+            BlogPostFactory(author=self.test_user, content="repeated words")
+        response = self.search("repeated", limit=2)
+        self.assertEqual(len(response.json()), 2)
+
+    def test_rebuild_search_index_command(self):
+        blog_post = BlogPostFactory(author=self.test_user, content="bulk loaded")
+        BlogPost.objects.filter(pk=blog_post.pk).update(content="changed quietly")
+        self.assertEqual(self.search("changed").json(), [])
+        out = StringIO()
+        call_command("rebuild_search_index", batch_size=1, stdout=out)
+        self.assertIn("Indexed 1 posts", out.getvalue())
+        self.assertEqual(len(self.search("changed").json()), 1)
+        self.assertEqual(self.search("bulk").json(), [])
@@ -0,0 +1,88 @@
+import random
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from blog import search
+from blog.models import BlogCategory, BlogPost, BlogTag
+from blog.seeding import TextGenerator, seed_blog
+
+
+def index_names():
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' "
+            "AND tbl_name LIKE 'blog_%' ORDER BY name"
+        )
+        return [name for (name,) in cursor.fetchall()]
+
+
+class SeedBlogTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="author", password="x")
+
+    def test_seed_blog_command(self):
+        indexes = index_names()
+        out = StringIO()
+        call_command(
+            "seed_blog",
+            posts=120,
+            tags=15,
+            categories=12,
+            batch_size=50,
+            stdout=out,
+        )
+        self.assertIn("Created 120 posts", out.getvalue())
+        self.assertIn("rows/s", out.getvalue())
+        self.assertEqual(index_names(), indexes)
+        self.assertEqual(BlogPost.objects.count(), 120)
+        self.assertEqual(BlogTag.objects.count(), 15)
+        self.assertEqual(BlogCategory.objects.count(), 12)
+        self.assertEqual(BlogTag.objects.reconcile_post_counts(), 0)
+        self.assertEqual(
+            BlogPost.objects.values("slug").distinct().count(), BlogPost.objects.count()
+        )
+        for category in BlogCategory.objects.select_related("parent"):
+            parent_path = category.parent.path if category.parent else "/"
+            self.assertEqual(category.path, f"{parent_path}{category.pk}/")
+
+    def test_popular_tags_follow_zipf(self):
+        seed_blog([self.user.pk], 300, 20, zipf_exponent=1.5)
+        counts = list(
+            BlogTag.objects.order_by("pk").values_list("post_count", flat=True)
+        )
+        self.assertEqual(max(counts), counts[0])
+        self.assertGreater(counts[0], counts[-1])
+
+    def test_same_seed_same_content(self):
+        seed_blog([self.user.pk], 20, random_seed=7)
+        first = list(BlogPost.objects.order_by("pk").values_list("title", "content"))
+        BlogPost.objects.all().delete()
+        seed_blog([self.user.pk], 20, random_seed=7)
+        second = list(BlogPost.objects.order_by("pk").values_list("title", "content"))
+        self.assertEqual(first, second)
+
+    def test_seeded_posts_are_searchable(self):
+        seed_blog([self.user.pk], 10)
+        post = BlogPost.objects.first()
+        hits = search.search(post.title, limit=100)
+        self.assertIn(post.pk, [hit.post_id for hit in hits])
+
+    def test_requires_an_author(self):
+        User.objects.all().delete()
+        with self.assertRaises(CommandError):
+            call_command("seed_blog", posts=1, stdout=StringIO())
+
+
+class TextGeneratorTest(SimpleTestCase):
+    def test_bodies_respect_word_bounds(self):
+        text = TextGenerator(random.Random(0), words=("alpha", "beta"))
+        for body in text.bodies(50, 5, 30):
+            words = body.replace(".", "").split()
+            self.assertGreaterEqual(len(words), 5)
+            self.assertLessEqual(len(words), 30)
+            self.assertTrue(body[0].isupper())
@@ -0,0 +1,85 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+
+from blog.models import BlogPost, BlogTag
+from blog.tests.test_blog_views import AuthenticatedUserTestCase
+from core.factories import BlogPostFactory, BlogTagFactory
+
+
+class BlogTagPostCountTest(AuthenticatedUserTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tag_1 = BlogTagFactory()
+        self.tag_2 = BlogTagFactory()
+        self.post_1 = BlogPostFactory(author=self.test_user)
+        self.post_2 = BlogPostFactory(author=self.test_user)
+
+    def assertCounts(self, tag_1, tag_2):
+        self.tag_1.refresh_from_db()
+        self.tag_2.refresh_from_db()
+        self.assertEqual((self.tag_1.post_count, self.tag_2.post_count), (tag_1, tag_2))
+
+    def test_add_and_remove_from_post(self):
+        self.post_1.tags.add(self.tag_1, self.tag_2)
+        self.post_1.tags.add(self.tag_1)
+        self.post_2.tags.add(self.tag_1)
+        self.assertCounts(2, 1)
+        self.post_1.tags.remove(self.tag_1, self.tag_1)
+        self.post_2.tags.remove(self.tag_2)
+        self.assertCounts(1, 1)
+        self.post_1.tags.clear()
+        self.assertCounts(1, 0)
+
+    def test_add_and_remove_from_tag(self):
+        self.tag_1.posts.add(self.post_1, self.post_2)
+        self.assertCounts(2, 0)
+        self.tag_1.posts.remove(self.post_1)
+        self.assertCounts(1, 0)
+        self.tag_1.posts.clear()
+        self.assertCounts(0, 0)
+
+    def test_set_tags(self):
+        self.post_1.tags.set([self.tag_1])
+        self.post_1.tags.set([self.tag_2])
+        self.assertCounts(0, 1)
+
+    def test_post_delete_releases_counts(self):
+        self.post_1.tags.add(self.tag_1, self.tag_2)
+        self.post_2.tags.add(self.tag_1)
+        BlogPost.objects.filter(pk__in=[self.post_1.pk, self.post_2.pk]).delete()
+        self.assertCounts(0, 0)
+
+    def test_popular_tags_endpoint(self):
+        self.post_1.tags.add(self.tag_1, self.tag_2)
+        self.post_2.tags.add(self.tag_2)
+        BlogTagFactory()
+        url = reverse("blog:list_popular_blog_tags")
+        response = self.client.get(url, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            [
+                {"id": self.tag_2.id, "name": self.tag_2.name, "post_count": 2},
+                {"id": self.tag_1.id, "name": self.tag_1.name, "post_count": 1},
+            ],
+        )
+        response = self.client.get(url, {"limit": 1}, format="json")
+        self.assertEqual([tag["id"] for tag in response.json()], [self.tag_2.id])
+
+    def test_popular_tags_refresh_after_tagging(self):
+        url = reverse("blog:list_popular_blog_tags")
+        self.assertEqual(self.client.get(url, format="json").json(), [])
+        self.post_1.tags.add(self.tag_1)
+        self.assertEqual(len(self.client.get(url, format="json").json()), 1)
+
+    def test_reconcile_command_repairs_drift(self):
+        self.post_1.tags.add(self.tag_1)
+        BlogTag.objects.filter(pk=self.tag_1.pk).update(post_count=7)
+        BlogPost.tags.through.objects.create(blogpost=self.post_2, blogtag=self.tag_2)
+        out = StringIO()
+        call_command("reconcile_tag_counts", batch_size=1, stdout=out)
+        self.assertIn("Repaired 2 tag counts", out.getvalue())
+        self.assertCounts(1, 1)
@@ -2,6 +2,7 @@ from django.contrib.auth.models import User
 from django.urls import reverse
 from rest_framework import status
 
+from authentication.authentication import user_cache
 from authentication.models import LoginHistory
 from blog.models import BlogCategory, BlogPost, BlogTag
 from core.factories import BlogCategoryFactory, BlogPostFactory, BlogTagFactory
@@ -19,6 +20,7 @@ class AuthenticatedUserTestCase(AuthenticationTestCase):
         token_response = self.client.post(token_url, token_data, format="json")
         token = token_response.data["access"]
         self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        user_cache.set(self.test_user.id, self.test_user)
 
 
 class BlogViewsTest(AuthenticatedUserTestCase):
@@ -284,3 +286,46 @@ class BlogViewsTest(AuthenticatedUserTestCase):
         response_json = response.json()
         self.assertEqual(blog_category.id, response_json["id"])
         self.assertEqual(blog_category.name, response_json["name"])
+
+    def test_retrieve_blog_post_list_paginates_with_cursor(self):
+        blog_posts = [BlogPostFactory(author=self.test_user) for _ in range(5)]
+        url = reverse("blog:list_blog_posts")
+        response = self.client.get(url, {"page_size": 2}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        seen = [post["id"] for post in response.json()["results"]]
+        next_url = response.json()["next"]
+        while next_url:
+            response = self.client.get(next_url, format="json")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.json()["results"]), 2)
+            seen.extend(post["id"] for post in response.json()["results"])
+            next_url = response.json()["next"]
+        self.assertEqual(seen, [post.id for post in reversed(blog_posts)])
+
+    def test_retrieve_blog_post_list_paginates_with_filters(self):
+        new_user = User.objects.create_user(
+            username="newtestuser",
+            email="newtest@example.com",
+            password=self.test_user_password + "1",
+        )
+        blog_post_1 = BlogPostFactory(author=self.test_user)
+        BlogPostFactory(author=new_user)
+        blog_post_2 = BlogPostFactory(author=self.test_user)
+        url = reverse("blog:list_blog_posts")
+        response = self.client.get(
+            url, {"page_size": 1, "author": f"{self.test_user.id}"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [post["id"] for post in response.json()["results"]], [blog_post_2.id]
+        )
+        response = self.client.get(response.json()["next"], format="json")
+        self.assertEqual(
+            [post["id"] for post in response.json()["results"]], [blog_post_1.id]
+        )
+        self.assertIsNone(response.json()["next"])
+
+    def test_retrieve_blog_post_list_invalid_cursor(self):
+        url = reverse("blog:list_blog_posts")
+        response = self.client.get(url, {"cursor": "garbage"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -1,9 +1,11 @@
 from django.urls import path
 
 from .views import (BlogCategoryListView, BlogCategoryRetrieveUpdateView,
-                    BlogCategoryView, BlogPostListView,
-                    BlogPostRetrieveUpdateView, BlogPostView, BlogTagListView,
-                    BlogTagView)
+                    BlogCategoryTreeView, BlogCategoryView,
+                    BlogPostBulkCreateView, BlogPostExportView,
+                    BlogPostListView, BlogPostRetrieveUpdateView,
+                    BlogPostSearchView, BlogPostView, BlogTagListView,
+                    BlogTagPopularListView, BlogTagView)
 
 urlpatterns = [
     path("blog/", BlogPostView.as_view(), name="blog_post"),
@@ -11,13 +13,34 @@ urlpatterns = [
         "blog/<slug:slug>", BlogPostRetrieveUpdateView.as_view(), name="get_blog_post"
     ),
     path("blog/posts/", BlogPostListView.as_view(), name="list_blog_posts"),
+    path(
+        "blog/posts/export/",
+        BlogPostExportView.as_view(),
+        name="export_blog_posts",
+    ),
+    path(
+        "blog/posts/bulk/",
+        BlogPostBulkCreateView.as_view(),
+        name="bulk_create_blog_posts",
+    ),
+    path("blog/search/", BlogPostSearchView.as_view(), name="search_blog_posts"),
     path("blog/tags/", BlogTagView.as_view(), name="blog_tag"),
     path("blog/tags/list/", BlogTagListView.as_view(), name="list_blog_tags"),
+    path(
+        "blog/tags/popular/",
+        BlogTagPopularListView.as_view(),
+        name="list_popular_blog_tags",
+    ),
     path(
         "blog/categories/list/",
         BlogCategoryListView.as_view(),
         name="list_blog_categories",
     ),
+    path(
+        "blog/categories/tree/",
+        BlogCategoryTreeView.as_view(),
+        name="blog_category_tree",
+    ),
     path(
         "blog/categories/",
         BlogCategoryView.as_view(),
@@ -1,9 +1,53 @@
+from django.conf import settings
+from django.db.models import OuterRef, Prefetch, Subquery
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404, render
-from rest_framework import generics, permissions, status
+from rest_framework import exceptions, generics, permissions, status
+from rest_framework.response import Response
 
+from blog import bulk, export, search
+from blog.cache import CachedResponseMixin
+from blog.conditional import ConditionalRequestMixin, SortedIds
+from blog.fast import FastListMixin, FastPostListMixin
 from blog.models import BlogCategory, BlogPost, BlogTag
-from blog.serializers import (BlogCategorySerializer, BlogPostSerializer,
+from blog.serializers import (BlogCategorySerializer,
+                              BlogPostSearchResultSerializer,
+                              BlogPostSerializer, BlogTagPopularitySerializer,
                               BlogTagSerializer)
+from core.pagination import KeysetPagination
+
+
+def parse_limit(request, default, maximum):
+    try:
+        limit = int(request.query_params.get("limit", default))
+    except ValueError:
+        raise exceptions.ValidationError({"limit": "A valid integer is required."})
+    return max(1, min(limit, maximum))
+
+
+def blog_post_queryset():
+    return BlogPost.objects.prefetch_related(
+        Prefetch("tags", queryset=BlogTag.objects.only("id").order_by("id"))
+    )
+
+
+def filter_blog_posts(qs, params):
+    if author_id := params.get("author"):
+        qs = qs.filter(author__id=author_id)
+    if tags := params.get("tags"):
+        qs = qs.filter(tags__name__in=tags.split(","))
+    if category := params.get("category"):
+        qs = qs.filter(category__name=category)
+    if category_tree := params.get("category_tree"):
+        path = (
+            BlogCategory.objects.filter(slug=category_tree)
+            .values_list("path", flat=True)
+            .first()
+        )
+        if path is None:
+            return qs.none()
+        qs = qs.filter(category__in=BlogCategory.objects.subtree(path))
+    return qs
 
 
 class BlogPostView(generics.CreateAPIView):
@@ -17,28 +61,118 @@ class BlogPostView(generics.CreateAPIView):
         return super().post(request, *args, **kwargs)
 
 
-class BlogPostRetrieveUpdateView(generics.RetrieveUpdateAPIView):
-    queryset = BlogPost.objects.all()
+class BlogPostBulkCreateView(generics.GenericAPIView):
+    permission_classes = (permissions.IsAuthenticated,)
+    serializer_class = bulk.BulkBlogPostSerializer
+
+    def post(self, request, *args, **kwargs):
+        items = request.data
+        if not isinstance(items, list):
+            raise exceptions.ValidationError("Expected a list of posts.")
+        if len(items) > settings.BLOG_BULK_IMPORT_MAX_ITEMS:
+            raise exceptions.ValidationError(
+                f"At most {settings.BLOG_BULK_IMPORT_MAX_ITEMS} posts per request."
+            )
+        result = bulk.import_posts(
+            items,
+            author_id=request.user.pk,
+            batch_size=settings.BLOG_BULK_IMPORT_BATCH_SIZE,
+        )
+        return Response(
+            {"created": result.created, "errors": result.errors},
+            status=(
+                status.HTTP_201_CREATED
+                if result.created or not result.errors
+                else status.HTTP_400_BAD_REQUEST
+            ),
+        )
+
+
+class BlogPostRetrieveUpdateView(
+    ConditionalRequestMixin, CachedResponseMixin, generics.RetrieveUpdateAPIView
+):
     permission_classes = (permissions.IsAuthenticated,)
     serializer_class = BlogPostSerializer
+    cache_namespaces = ("post", "tag", "category")
+
+    def get_queryset(self):
+        return blog_post_queryset()
 
     def get_object(self):
-        return get_object_or_404(BlogPost, slug=self.kwargs.get("slug"))
+        return get_object_or_404(self.get_queryset(), slug=self.kwargs.get("slug"))
+
+    def get_validator_fields(self):
+        tag_ids = (
+            BlogPost.tags.through.objects.filter(blogpost_id=OuterRef("pk"))
+            .values("blogpost_id")
+            .annotate(ids=SortedIds("blogtag_id"))
+            .values("ids")
+        )
+        return ("category_id", Subquery(tag_ids))
 
 
-class BlogPostListView(generics.ListAPIView):
+class BlogPostListView(CachedResponseMixin, FastPostListMixin, generics.ListAPIView):
     serializer_class = BlogPostSerializer
     permission_classes = (permissions.IsAuthenticated,)
+    pagination_class = KeysetPagination
+    cache_namespaces = ("post", "tag", "category")
+    cache_query_params = (
+        "author",
+        "tags",
+        "category",
+        "category_tree",
+        "cursor",
+        "page_size",
+    )
 
     def get_queryset(self):
-        qs = BlogPost.objects.order_by("-created_at")
-        if author_id := self.request.query_params.get("author"):
-            qs = qs.filter(author__id=author_id)
-        if tags := self.request.query_params.get("tags"):
-            qs = qs.filter(tags__name__in=tags.split(","))
-        if category := self.request.query_params.get("category"):
-            qs = qs.filter(category__name=category)
-        return qs
+        qs = blog_post_queryset().order_by("-created_at", "-id")
+        return filter_blog_posts(qs, self.request.query_params)
+
+
+class BlogPostExportView(generics.GenericAPIView):
+    permission_classes = (permissions.IsAuthenticated,)
+    renderer_classes = (export.NDJSONRenderer, export.CSVRenderer)
+
+    def get(self, request, *args, **kwargs):
+        qs = blog_post_queryset().order_by("id")
+        qs = filter_blog_posts(qs, request.query_params)
+        renderer = request.accepted_renderer
+        response = StreamingHttpResponse(
+            renderer.stream(
+                export.iter_rows(qs, chunk_size=settings.BLOG_EXPORT_CHUNK_SIZE)
+            ),
+            content_type=f"{renderer.media_type}; charset={renderer.charset}",
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="blog-posts.{renderer.format}"'
+        )
+        return response
+
+
+class BlogPostSearchView(generics.GenericAPIView):
+    serializer_class = BlogPostSearchResultSerializer
+    permission_classes = (permissions.IsAuthenticated,)
+    default_limit = 20
+    max_limit = 100
+
+    def get(self, request, *args, **kwargs):
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            raise exceptions.ValidationError({"q": "This parameter is required."})
+        if not search.is_supported():
+            raise exceptions.APIException("Full-text search is not available.")
+        limit = parse_limit(request, self.default_limit, self.max_limit)
+
+        hits = search.search(query, limit=limit)
+        posts = blog_post_queryset().in_bulk([hit.post_id for hit in hits])
+        results = []
+        for hit in hits:
+            if blog_post := posts.get(hit.post_id):
+                blog_post.snippet = hit.snippet
+                blog_post.rank = hit.rank
+                results.append(blog_post)
+        return Response(self.get_serializer(results, many=True).data)
 
 
 class BlogTagView(generics.CreateAPIView):
@@ -47,29 +181,70 @@ class BlogTagView(generics.CreateAPIView):
     serializer_class = BlogTagSerializer
 
 
-class BlogTagListView(generics.ListAPIView):
+class BlogTagListView(CachedResponseMixin, FastListMixin, generics.ListAPIView):
     serializer_class = BlogTagSerializer
     permission_classes = (permissions.IsAuthenticated,)
+    cache_namespaces = ("tag",)
+    fast_fields = ("id", "name")
 
     def get_queryset(self):
         return BlogTag.objects.order_by("name")
 
 
-class BlogCategoryListView(generics.ListAPIView):
+class BlogTagPopularListView(CachedResponseMixin, generics.ListAPIView):
+    serializer_class = BlogTagPopularitySerializer
+    permission_classes = (permissions.IsAuthenticated,)
+    cache_namespaces = ("tag", "post")
+    cache_query_params = ("limit",)
+    default_limit = 20
+    max_limit = 100
+
+    def get_queryset(self):
+        limit = parse_limit(self.request, self.default_limit, self.max_limit)
+        queryset = BlogTag.objects.filter(post_count__gt=0)
+        return queryset.order_by("-post_count", "name")[:limit]
+
+
+class BlogCategoryListView(CachedResponseMixin, FastListMixin, generics.ListAPIView):
     serializer_class = BlogCategorySerializer
     permission_classes = (permissions.IsAuthenticated,)
+    cache_namespaces = ("category",)
+    fast_fields = ("id", "name", "slug")
 
     def get_queryset(self):
         return BlogCategory.objects.order_by("name")
 
 
+class BlogCategoryTreeView(CachedResponseMixin, generics.GenericAPIView):
+    permission_classes = (permissions.IsAuthenticated,)
+    cache_namespaces = ("category",)
+
+    def get(self, request, *args, **kwargs):
+        nodes = {}
+        roots = []
+        categories = BlogCategory.objects.order_by("path").values_list(
+            "id", "name", "slug", "parent_id"
+        )
+        # Ordering by path guarantees every parent is seen before its children.
+        for pk, name, slug, parent_id in categories:
+            node = {"id": pk, "name": name, "slug": slug, "children": []}
+            nodes[pk] = node
+            parent = nodes.get(parent_id)
+            (parent["children"] if parent else roots).append(node)
+        for node in [*nodes.values(), {"children": roots}]:
+            node["children"].sort(key=lambda child: child["name"])
+        return Response(roots)
+
+
 class BlogCategoryView(generics.CreateAPIView):
     queryset = BlogCategory.objects.all()
     permission_classes = (permissions.IsAuthenticated,)
     serializer_class = BlogCategorySerializer
 
 
-class BlogCategoryRetrieveUpdateView(generics.RetrieveUpdateAPIView):
+class BlogCategoryRetrieveUpdateView(
+    ConditionalRequestMixin, generics.RetrieveUpdateAPIView
+):
     queryset = BlogCategory.objects.all()
     permission_classes = (permissions.IsAuthenticated,)
     serializer_class = BlogCategorySerializer
@@ -1,10 +1,21 @@
 import factory
+from django.contrib.auth.models import User
 from django.utils import timezone
 from factory.django import DjangoModelFactory
 
+from authentication.models import LoginHistory
 from blog.models import BlogCategory, BlogPost, BlogTag
 
 
+class UserFactory(DjangoModelFactory):
+    class Meta:
+        model = User
+
+    username = factory.Sequence(lambda n: f"user{n}")
+    email = factory.LazyAttribute(lambda o: f"{o.username}@example.com")
+    password = factory.django.Password("TestPass123!")
+
+
 class BlogPostFactory(DjangoModelFactory):
     class Meta:
         model = BlogPost
@@ -28,3 +39,11 @@ class BlogCategoryFactory(DjangoModelFactory):
 
     name = factory.Sequence(lambda n: f"Blog category {n}")
     created_at = factory.LazyFunction(timezone.now)
+
+
+class LoginHistoryFactory(DjangoModelFactory):
+    class Meta:
+        model = LoginHistory
+
+    login_datetime = factory.LazyFunction(timezone.now)
+    ip_address = factory.Faker("ipv4")
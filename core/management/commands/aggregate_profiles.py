@@ -0,0 +1,69 @@
+import json
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+def read_folded(path):
+    stacks = Counter()
+    with open(path) as folded:
+        for line in folded:
+            stack, _, count = line.rstrip("\n").rpartition(" ")
+            if stack:
+                stacks[stack] += int(count)
+    return stacks
+
+
+class Command(BaseCommand):
+    help = (
+        "Merge stored request profiles into one collapsed-stack file per "
+        "endpoint, ready for flamegraph.pl or speedscope."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--directory", default=str(settings.REQUEST_PROFILING["DIRECTORY"])
+        )
+        parser.add_argument("--output", help="Defaults to DIRECTORY/aggregated.")
+        parser.add_argument("--endpoint", help="Only aggregate this URL name.")
+        parser.add_argument("--top", type=int, default=10)
+
+    def handle(self, *args, **options):
+        directory = Path(options["directory"])
+        output = Path(options["output"] or directory / "aggregated")
+        stacks = defaultdict(Counter)
+        profiles = defaultdict(list)
+        for sidecar in sorted(directory.glob("*/*.json")):
+            metadata = json.loads(sidecar.read_text())
+            endpoint = metadata["endpoint"]
+            folded = sidecar.with_suffix(".folded")
+            if options["endpoint"] not in (None, endpoint) or not folded.exists():
+                continue
+            stacks[endpoint].update(read_folded(folded))
+            profiles[endpoint].append(metadata)
+
+        if not profiles:
+            self.stdout.write("No profiles found.")
+            return
+        output.mkdir(parents=True, exist_ok=True)
+        for endpoint in sorted(profiles):
+            merged = stacks[endpoint]
+            name = endpoint.replace(":", "__").replace("/", "_")
+            with open(output / f"{name}.folded", "w") as folded:
+                for stack, count in sorted(merged.items()):
+                    folded.write(f"{stack} {count}\n")
+
+            samples = sum(merged.values())
+            durations = [profile["duration_ms"] for profile in profiles[endpoint]]
+            self.stdout.write(
+                f"{endpoint}: {len(durations)} profiles, {samples} samples, "
+                f"mean {sum(durations) / len(durations):.1f} ms"
+            )
+            leaves = Counter()
+            for stack, count in merged.items():
+                leaves[stack.rpartition(";")[2]] += count
+            for frame, count in leaves.most_common(options["top"]):
+                self.stdout.write(f"  {count / samples:6.1%}  {frame}")
+        self.stdout.write(self.style.SUCCESS(f"Wrote collapsed stacks to {output}"))
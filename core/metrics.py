@@ -0,0 +1,229 @@
+"""
+In-process metrics rendered in the Prometheus text exposition format.
+
+Every thread updates its own shard of each metric, so recording never takes
+a lock; shards are only summed when ``/metrics`` is scraped. Shards of
+finished threads are folded into a retired total so thread churn does not
+grow memory.
+"""
+
+import threading
+from bisect import bisect_left
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+
+
+def escape(value):
+    return str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def format_labels(names, values, extra=()):
+    pairs = [*zip(names, values), *extra]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{escape(value)}"' for name, value in pairs) + "}"
+
+
+def format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = []
+
+    def register(self, metric):
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        with self._lock:
+            metrics = list(self._metrics)
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+
+class ShardedMetric:
+    type = None
+
+    def __init__(self, name, documentation, labelnames=(), registry=registry):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards = []
+        self._retired = {}
+        registry.register(self)
+
+    def _shard(self):
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._retire_finished_threads()
+                self._shards.append((threading.current_thread(), shard))
+            return shard
+
+    def _retire_finished_threads(self):
+        alive = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                alive.append((thread, shard))
+            else:
+                for key, value in shard.copy().items():
+                    self._retired[key] = self.merge(self._retired.get(key), value)
+        self._shards = alive
+
+    def collect(self):
+        with self._lock:
+            self._retire_finished_threads()
+            totals = dict(self._retired)
+            shards = [shard.copy() for _, shard in self._shards]
+        for shard in shards:
+            for key, value in shard.items():
+                totals[key] = self.merge(totals.get(key), value)
+        return dict(sorted(totals.items()))
+
+    def key(self, labels):
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+
+class Counter(ShardedMetric):
+    type = "counter"
+
+    def inc(self, amount=1, **labels):
+        shard = self._shard()
+        key = self.key(labels)
+        shard[key] = shard.get(key, 0) + amount
+
+    def merge(self, total, value):
+        return (total or 0) + value
+
+    def render(self):
+        for key, value in self.collect().items():
+            yield f"{self.name}{format_labels(self.labelnames, key)} {format_value(value)}"
+
+
+class Histogram(ShardedMetric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name,
+        documentation,
+        labelnames=(),
+        buckets=DEFAULT_BUCKETS,
+        registry=registry,
+    ):
+        self.buckets = tuple(buckets)
+        super().__init__(name, documentation, labelnames, registry)
+
+    def observe(self, value, **labels):
+        shard = self._shard()
+        key = self.key(labels)
+        # Per-bucket counts (the last one is +Inf), then the sum and count.
+        counts = shard.get(key)
+        if counts is None:
+            counts = shard[key] = [0] * (len(self.buckets) + 3)
+        counts[bisect_left(self.buckets, value)] += 1
+        counts[-2] += value
+        counts[-1] += 1
+
+    def merge(self, total, value):
+        value = list(value)
+        return value if total is None else [a + b for a, b in zip(total, value)]
+
+    def render(self):
+        for key, counts in self.collect().items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                labels = format_labels(self.labelnames, key, [("le", bound)])
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {format_value(float(counts[-2]))}"
+            yield f"{self.name}_count{labels} {counts[-1]}"
+
+
+class CallbackMetric:
+    """Metric whose ``{label values: value}`` samples are read at scrape time."""
+
+    def __init__(self, name, documentation, labelnames, callback, type="counter"):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+        self.type = type
+        registry.register(self)
+
+    def render(self):
+        for key, value in sorted(self.callback().items()):
+            yield f"{self.name}{format_labels(self.labelnames, key)} {format_value(value)}"
+
+
+def blog_response_cache_samples():
+    from blog.cache import stats
+
+    return {
+        (endpoint, result): counts[key]
+        for endpoint, counts in stats.snapshot().items()
+        for result, key in (("hit", "hits"), ("miss", "misses"))
+    }
+
+
+def user_cache_samples():
+    from authentication.authentication import user_cache
+
+    snapshot = user_cache.snapshot()
+    return {("hit",): snapshot["hits"], ("miss",): snapshot["misses"]}
+
+
+request_duration = Histogram(
+    "http_request_duration_seconds",
+    "Time spent handling requests.",
+    ("view", "method", "status"),
+)
+request_queries = Histogram(
+    "http_request_db_queries",
+    "Database queries run per request.",
+    ("view",),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+request_db_duration = Histogram(
+    "http_request_db_duration_seconds",
+    "Time spent in the database per request.",
+    ("view",),
+)
+logins = Counter(
+    "auth_login_attempts_total", "Token obtain attempts by result.", ("result",)
+)
+CallbackMetric(
+    "blog_response_cache_requests_total",
+    "Blog response cache lookups by endpoint and result.",
+    ("endpoint", "result"),
+    blog_response_cache_samples,
+)
+CallbackMetric(
+    "auth_user_cache_requests_total",
+    "JWT user cache lookups by result.",
+    ("result",),
+    user_cache_samples,
+)
+
+
+def observe_request(view, method, status, duration, queries, db_duration):
+    request_duration.observe(duration, view=view, method=method, status=status)
+    request_queries.observe(queries, view=view)
+    request_db_duration.observe(db_duration, view=view)
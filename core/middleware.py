@@ -0,0 +1,206 @@
+import contextvars
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+
+from asgiref.sync import (iscoroutinefunction, markcoroutinefunction,
+                          sync_to_async)
+from django.conf import settings
+from django.db import connections
+
+from core import metrics
+
+logger = logging.getLogger("core.requests")
+
+current_recorder = contextvars.ContextVar("current_recorder", default=None)
+
+
+class QueryRecorder:
+    """``execute_wrapper`` that times every query run while it is installed."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.count += 1
+            self.duration += elapsed
+            self.queries.append((elapsed, sql))
+
+    def slowest(self, limit):
+        return sorted(self.queries, key=lambda query: query[0], reverse=True)[:limit]
+
+
+class EndpointStats:
+    """Rolling window of request durations per endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timings = defaultdict(self._window)
+
+    def _window(self):
+        return deque(maxlen=settings.REQUEST_INSTRUMENTATION["WINDOW"])
+
+    def record(self, endpoint, duration):
+        with self._lock:
+            self._timings[endpoint].append(duration)
+
+    def snapshot(self):
+        with self._lock:
+            timings = {endpoint: sorted(t) for endpoint, t in self._timings.items()}
+        return {
+            endpoint: {
+                "count": len(values),
+                **{
+                    f"p{p}": values[min(len(values) - 1, len(values) * p // 100)]
+                    for p in (50, 95, 99)
+                },
+            }
+            for endpoint, values in sorted(timings.items())
+            if values
+        }
+
+    def reset(self):
+        with self._lock:
+            self._timings.clear()
+
+
+endpoint_stats = EndpointStats()
+
+
+def record_current_request(execute, sql, params, many, context):
+    recorder = current_recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    return recorder(execute, sql, params, many, context)
+
+
+def record_request_queries():
+    """
+    Count queries on this thread's connection against the current request.
+
+    Connections are per thread, and a request may query from several: the
+    request thread, the thread running an async view's ORM calls, or a
+    worker it offloads to (see ``authentication.views.OffloadedView``).
+    Each installs the same wrapper once; it reports to the recorder in the
+    calling context, which ``sync_to_async`` copies along.
+    """
+    connection = connections["default"]
+    if record_current_request not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_current_request)
+
+
+def get_endpoint(request):
+    match = getattr(request, "resolver_match", None)
+    return match.view_name if match else "<unresolved>"
+
+
+class RequestInstrumentationMiddleware:
+    """
+    Time the database, the view and response rendering of every request.
+
+    The phases are reported in a ``Server-Timing`` header, fed into
+    :data:`endpoint_stats`, and requests slower than ``SLOW_REQUEST_MS`` are
+    logged to ``core.requests`` together with their slowest queries, unless
+    their endpoint is listed in ``SLOW_REQUEST_EXCLUDE``.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        record_request_queries()
+        recorder, token, started = self.start(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_recorder.reset(token)
+        return self.finish(request, response, recorder, started)
+
+    async def __acall__(self, request):
+        # ORM calls of async views run on the request's sync thread.
+        await sync_to_async(record_request_queries)()
+        recorder, token, started = self.start(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_recorder.reset(token)
+        return self.finish(request, response, recorder, started)
+
+    def start(self, request):
+        recorder = QueryRecorder()
+        request._instrumentation = {}
+        return recorder, current_recorder.set(recorder), time.perf_counter()
+
+    def finish(self, request, response, recorder, started):
+        finished = time.perf_counter()
+        timings = request._instrumentation
+        view_started = timings.get("view_started", started)
+        view_finished = timings.get("view_finished", finished)
+        phases = {
+            "db": recorder.duration,
+            "view": view_finished - view_started,
+            "render": finished - view_finished,
+            "total": finished - started,
+        }
+        response["Server-Timing"] = ", ".join(
+            f"{name};dur={duration * 1000:.2f}"
+            + (f';desc="{recorder.count} queries"' if name == "db" else "")
+            for name, duration in phases.items()
+        )
+        endpoint = get_endpoint(request)
+        endpoint_stats.record(endpoint, phases["total"])
+        metrics.observe_request(
+            endpoint,
+            request.method,
+            response.status_code,
+            phases["total"],
+            recorder.count,
+            phases["db"],
+        )
+
+        options = settings.REQUEST_INSTRUMENTATION
+        if (
+            phases["total"] * 1000 >= options["SLOW_REQUEST_MS"]
+            and endpoint not in options["SLOW_REQUEST_EXCLUDE"]
+        ):
+            self.log_slow_request(request, response, phases, recorder, options)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._instrumentation["view_started"] = time.perf_counter()
+
+    def process_template_response(self, request, response):
+        # Called once the view has returned and right before rendering.
+        request._instrumentation["view_finished"] = time.perf_counter()
+        return response
+
+    def log_slow_request(self, request, response, phases, recorder, options):
+        record = {
+            "endpoint": get_endpoint(request),
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "queries": recorder.count,
+            **{f"{name}_ms": round(value * 1000, 2) for name, value in phases.items()},
+            "slowest_queries": [
+                {"ms": round(elapsed * 1000, 2), "sql": sql}
+                for elapsed, sql in recorder.slowest(options["SLOW_QUERIES"])
+            ],
+        }
+        logger.warning(json.dumps(record), extra={"request_record": record})
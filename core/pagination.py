@@ -0,0 +1,158 @@
+import base64
+from urllib import parse
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination over ``(position_field, id)``, newest first.
+
+    Pagination is opt-in: it only kicks in when the client sends a ``cursor``
+    or ``page_size`` query parameter, so existing callers still receive a
+    plain list. Each page is a single range scan on the composite index and
+    no ``COUNT(*)`` is ever issued.
+    """
+
+    position_field = "created_at"
+    page_size = 50
+    max_page_size = 500
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if (
+            self.cursor_query_param not in params
+            and self.page_size_query_param not in params
+        ):
+            return None
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if cursor := params.get(self.cursor_query_param):
+            position, pk = self.decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(**{f"{self.position_field}__lt": position})
+                | Q(**{self.position_field: position, "id__lt": pk})
+            )
+        queryset = queryset.order_by(f"-{self.position_field}", "-id")
+
+        results = list(queryset[: self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri-reference",
+                },
+                "results": schema,
+            },
+        }
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        if isinstance(last, dict):
+            position, pk = last[self.position_field], last["id"]
+        else:
+            position, pk = getattr(last, self.position_field), last.pk
+        # Host-relative, so responses cached for one Host never leak it to
+        # clients of another.
+        url = self.request.get_full_path()
+        url = replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(position, pk)
+        )
+        return replace_query_param(url, self.page_size_query_param, self.page_size)
+
+    def encode_cursor(self, position, pk):
+        querystring = parse.urlencode({"p": position.isoformat(), "id": pk})
+        return base64.urlsafe_b64encode(querystring.encode("ascii")).decode("ascii")
+
+    def decode_cursor(self, cursor):
+        try:
+            querystring = base64.urlsafe_b64decode(cursor.encode("ascii")).decode(
+                "ascii"
+            )
+            tokens = parse.parse_qs(querystring, strict_parsing=True)
+            position = parse_datetime(tokens["p"][0])
+            pk = int(tokens["id"][0])
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if position is None:
+            raise NotFound(self.invalid_cursor_message)
+        return position, pk
+
+
+def estimate_row_count(model, using="default"):
+    """
+    Return a cheap estimate of the rows in ``model``'s table, or ``None``.
+
+    PostgreSQL and MySQL keep statistics; elsewhere the largest primary key
+    is read from the index, which overestimates only by deleted rows.
+    """
+    connection = connections[using]
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute("SELECT reltuples FROM pg_class WHERE relname = %s", [table])
+        elif connection.vendor == "mysql":
+            cursor.execute(
+                "SELECT table_rows FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = %s",
+                [table],
+            )
+        else:
+            pk = connection.ops.quote_name(model._meta.pk.column)
+            cursor.execute(f"SELECT MAX({pk}) FROM {connection.ops.quote_name(table)}")
+        row = cursor.fetchone()
+    if row is None or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that skips ``COUNT(*)`` for unfiltered querysets over large
+    tables and uses :func:`estimate_row_count` instead.
+    """
+
+    exact_count_threshold = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = estimate_row_count(queryset.model, queryset.db)
+            if estimate is not None and estimate > self.exact_count_threshold:
+                return estimate
+        return super().count
@@ -0,0 +1,163 @@
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from pathlib import Path
+
+from asgiref.sync import (iscoroutinefunction, markcoroutinefunction,
+                          sync_to_async)
+from django.conf import settings
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+from authentication.authentication import CachedJWTAuthentication
+from core.middleware import get_endpoint
+
+
+def frame_name(frame):
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{code.co_name}:{code.co_firstlineno}"
+
+
+class StackSampler:
+    """
+    Sample the stacks of ``thread_ids`` every ``interval`` seconds from a
+    helper thread and count the collapsed (``root;...;leaf``) stacks.
+    """
+
+    def __init__(self, thread_ids, interval):
+        self.thread_ids = set(thread_ids)
+        self.interval = interval
+        self.stacks = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            frames = sys._current_frames()
+            for thread_id in self.thread_ids:
+                frame = frames.get(thread_id)
+                stack = []
+                while frame is not None:
+                    stack.append(frame_name(frame))
+                    frame = frame.f_back
+                if stack:
+                    self.stacks[";".join(reversed(stack))] += 1
+
+
+def is_staff(request):
+    user = getattr(request, "user", None)
+    if user is not None and user.is_staff:
+        return True
+    try:
+        authenticated = CachedJWTAuthentication().authenticate(request)
+    except (InvalidToken, AuthenticationFailed):
+        return False
+    return bool(authenticated and authenticated[0].is_staff)
+
+
+def endpoint_directory(directory, endpoint):
+    return Path(directory) / endpoint.replace(":", "__").replace("/", "_")
+
+
+class ProfilingMiddleware:
+    """
+    Profile a request when a staff user sends the ``HEADER`` header, or for a
+    random ``SAMPLE_RATE`` fraction of requests.
+
+    The collapsed stacks are written to ``DIRECTORY/<endpoint>/<id>.folded``
+    with a JSON sidecar describing the request; ``aggregate_profiles`` merges
+    them per endpoint.
+
+    In async chains the event loop thread and the request's sync thread are
+    both sampled; samples of the loop may include other requests' tasks.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        trigger = self.get_trigger(request)
+        if trigger is None:
+            return self.get_response(request)
+        options = settings.REQUEST_PROFILING
+        started = time.perf_counter()
+        with StackSampler([threading.get_ident()], options["INTERVAL"]) as sampler:
+            response = self.get_response(request)
+        duration = time.perf_counter() - started
+        return self.record(request, response, sampler, duration, trigger)
+
+    async def __acall__(self, request):
+        trigger = await sync_to_async(self.get_trigger)(request)
+        if trigger is None:
+            return await self.get_response(request)
+        options = settings.REQUEST_PROFILING
+        threads = [threading.get_ident(), await sync_to_async(threading.get_ident)()]
+        started = time.perf_counter()
+        with StackSampler(threads, options["INTERVAL"]) as sampler:
+            response = await self.get_response(request)
+        duration = time.perf_counter() - started
+        return await sync_to_async(self.record)(
+            request, response, sampler, duration, trigger
+        )
+
+    def get_trigger(self, request):
+        options = settings.REQUEST_PROFILING
+        header = f"HTTP_{options['HEADER'].upper().replace('-', '_')}"
+        if header in request.META and is_staff(request):
+            return "header"
+        if options["SAMPLE_RATE"] and random.random() < options["SAMPLE_RATE"]:
+            return "sample"
+        return None
+
+    def record(self, request, response, sampler, duration, trigger):
+        options = settings.REQUEST_PROFILING
+        profile_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        self.save(
+            endpoint_directory(options["DIRECTORY"], get_endpoint(request)),
+            profile_id,
+            sampler.stacks,
+            {
+                "id": profile_id,
+                "endpoint": get_endpoint(request),
+                "method": request.method,
+                "path": request.get_full_path(),
+                "status": response.status_code,
+                "duration_ms": round(duration * 1000, 2),
+                "interval_ms": options["INTERVAL"] * 1000,
+                "samples": sum(sampler.stacks.values()),
+                "trigger": trigger,
+                "pid": os.getpid(),
+                "created_at": time.time(),
+            },
+        )
+        response["X-Profile-Id"] = profile_id
+        return response
+
+    def save(self, directory, profile_id, stacks, metadata):
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(directory / f"{profile_id}.folded", "w") as folded:
+            for stack, count in stacks.most_common():
+                folded.write(f"{stack} {count}\n")
+        with open(directory / f"{profile_id}.json", "w") as sidecar:
+            json.dump(metadata, sidecar)
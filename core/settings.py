@@ -44,33 +44,102 @@ INSTALLED_APPS = [
     "authentication",
     "user_dashboard",
     "blog",
+    "core",
 ]
 
 MIDDLEWARE = [
+    "core.middleware.RequestInstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "core.profiling.ProfilingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
 ROOT_URLCONF = "core.urls"
 
+# Stack-sampling profiler for live requests: staff opt in per request with
+# the X-Profile header, and SAMPLE_RATE profiles a fraction of all requests.
+REQUEST_PROFILING = {
+    "HEADER": "X-Profile",
+    "SAMPLE_RATE": 0.0,
+    "INTERVAL": 0.001,
+    "DIRECTORY": BASE_DIR / "profiles",
+}
+
+# Server-Timing headers, rolling per-endpoint percentiles and slow request
+# logging (see core.middleware). Password hashing makes every login and
+# registration slow by design, so those endpoints are never logged.
+REQUEST_INSTRUMENTATION = {
+    "SLOW_REQUEST_MS": 500,
+    "SLOW_REQUEST_EXCLUDE": (
+        "authentication:token_obtain_pair",
+        "authentication:token_obtain_pair_async",
+        "authentication:auth_register",
+        "authentication:auth_register_async",
+    ),
+    "SLOW_QUERIES": 5,
+    "WINDOW": 1000,
+}
+
+# Prometheus endpoint at /metrics. Scrapes are allowed from ALLOWED_IPS
+# (REMOTE_ADDR as seen by Django, so behind a proxy list the proxy), or from
+# anywhere with "Authorization: Bearer <TOKEN>" when TOKEN is set.
+METRICS = {
+    "ALLOWED_IPS": ("127.0.0.1", "::1"),
+    "TOKEN": None,
+}
+
 # JWT Settings
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "authentication.authentication.CachedJWTAuthentication",
     ),
 }
 
+# Per-process cache of users resolved from access tokens.
+AUTH_USER_CACHE = {
+    "MAX_SIZE": 10000,
+    "TIMEOUT": 60,
+}
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=30),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
     "ROTATE_REFRESH_TOKENS": True,
+    "TOKEN_REFRESH_SERIALIZER": "authentication.serializers.TokenRefreshSerializer",
+}
+
+# Worker pool for password hashing in the async register/login views.
+AUTH_HASHING_POOL = {
+    "MAX_WORKERS": 4,
+    "MAX_PENDING": 64,
+}
+
+# Bloom filter over blacklisted refresh tokens; tokens blacklisted by other
+# processes are picked up after at most SYNC_INTERVAL seconds. SYNC_OVERLAP
+# must exceed the longest transaction that blacklists a token.
+TOKEN_BLACKLIST_FILTER = {
+    "CAPACITY": 100000,
+    "ERROR_RATE": 0.001,
+    "SYNC_INTERVAL": 1.0,
+    "SYNC_OVERLAP": 60.0,
+}
+
+# Login history is buffered and written in batches by a background thread.
+LOGIN_HISTORY_WRITER = {
+    "ASYNC": True,
+    "BATCH_SIZE": 200,
+    "FLUSH_INTERVAL": 1.0,
+    "MAX_QUEUE_SIZE": 10000,
 }
 
+# Raw login history older than this is compacted into daily rollups.
+LOGIN_HISTORY_RETENTION_DAYS = 90
+
 # CORS settings
 CORS_ALLOW_ALL_ORIGINS = True  # Change in production
 
@@ -103,6 +172,34 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# The blog response cache invalidates by bumping version keys in this cache.
+# LocMemCache keeps them per process, so with several workers a write only
+# invalidates the worker that handled it and the others may serve stale
+# lists for up to BLOG_RESPONSE_CACHE_TIMEOUT. Multi-worker deployments
+# must use a shared backend (Redis, Memcached or the database cache).
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    }
+}
+
+BLOG_RESPONSE_CACHE_TIMEOUT = 300
+
+# Build list responses from .values() rows instead of ModelSerializer.
+BLOG_FAST_LIST_SERIALIZATION = False
+
+# Blog bulk import
+BLOG_BULK_IMPORT_BATCH_SIZE = 500
+BLOG_BULK_IMPORT_MAX_ITEMS = 5000
+
+# Blog export
+BLOG_EXPORT_CHUNK_SIZE = 2000
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -139,6 +236,21 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 
+MEDIA_URL = "media/"
+MEDIA_ROOT = BASE_DIR / "media"
+
+DASHBOARD_SUMMARY_CACHE_TIMEOUT = 300
+
+# Resized WebP/JPEG variants of profile images, rendered in a process pool.
+PROFILE_IMAGE_PIPELINE = {
+    "ASYNC": True,
+    "MAX_WORKERS": 2,
+    "SIZES": {"small": 64, "medium": 256, "large": 640},
+    "FORMATS": ("webp", "jpeg"),
+    "QUALITY": 82,
+    "DIRECTORY": "profile_images/variants",
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
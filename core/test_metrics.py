@@ -0,0 +1,143 @@
+import threading
+
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+
+from blog.tests.test_blog_views import AuthenticatedUserTestCase
+from core import metrics
+from core.tests import AuthenticationTestCase
+
+
+def sample(body, line):
+    for entry in body.splitlines():
+        if entry.startswith(line + " "):
+            return float(entry.rsplit(" ", 1)[1])
+    return 0.0
+
+
+class MetricsViewTest(AuthenticatedUserTestCase):
+    def scrape(self):
+        response = self.client.get(reverse("metrics"))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        return response.content.decode()
+
+    def test_request_histograms_per_url_name(self):
+        url = reverse("blog:list_blog_posts")
+        labels = '{view="blog:list_blog_posts",method="GET",status="200"}'
+        before = sample(self.scrape(), f"http_request_duration_seconds_count{labels}")
+        self.client.get(url, format="json")
+        self.client.get(url, format="json")
+        body = self.scrape()
+        self.assertEqual(
+            sample(body, f"http_request_duration_seconds_count{labels}"), before + 2
+        )
+        self.assertIn(
+            'http_request_duration_seconds_bucket{view="blog:list_blog_posts",'
+            'method="GET",status="200",le="+Inf"}',
+            body,
+        )
+        self.assertIn(
+            'http_request_db_queries_count{view="blog:list_blog_posts"}', body
+        )
+        self.assertIn(
+            'http_request_db_duration_seconds_sum{view="blog:list_blog_posts"}', body
+        )
+
+    def test_cache_lookups(self):
+        self.client.get(reverse("blog:list_blog_posts"), format="json")
+        body = self.scrape()
+        self.assertIn("# TYPE auth_user_cache_requests_total counter", body)
+        self.assertGreater(
+            sample(body, 'auth_user_cache_requests_total{result="hit"}'), 0
+        )
+
+
+class MetricsAccessTest(SimpleTestCase):
+    def test_other_addresses_are_forbidden(self):
+        response = self.client.get(reverse("metrics"), REMOTE_ADDR="203.0.113.7")
+        self.assertEqual(response.status_code, 403)
+
+    @override_settings(METRICS={**settings.METRICS, "TOKEN": "s3cret"})
+    def test_bearer_token_is_accepted(self):
+        url = reverse("metrics")
+        response = self.client.get(
+            url, REMOTE_ADDR="203.0.113.7", HTTP_AUTHORIZATION="Bearer s3cret"
+        )
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get(
+            url, REMOTE_ADDR="203.0.113.7", HTTP_AUTHORIZATION="Bearer wrong"
+        )
+        self.assertEqual(response.status_code, 403)
+
+
+class LoginMetricsTest(AuthenticationTestCase):
+    def attempts(self, result):
+        return sample(
+            metrics.registry.render(), f'auth_login_attempts_total{{result="{result}"}}'
+        )
+
+    def test_successes_and_failures(self):
+        url = reverse("authentication:token_obtain_pair")
+        successes, failures = self.attempts("success"), self.attempts("failure")
+        self.client.post(
+            url,
+            {"username": self.test_user.username, "password": self.test_user_password},
+            format="json",
+        )
+        response = self.client.post(
+            url,
+            {"username": self.test_user.username, "password": "wrong"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(self.attempts("success"), successes + 1)
+        self.assertEqual(self.attempts("failure"), failures + 1)
+
+
+class ShardedMetricTest(SimpleTestCase):
+    def setUp(self):
+        self.registry = metrics.Registry()
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = metrics.Histogram(
+            "latency", "Latency.", ("view",), (0.1, 1.0), registry=self.registry
+        )
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value, view="a")
+        self.assertEqual(
+            self.registry.render().splitlines()[2:],
+            [
+                'latency_bucket{view="a",le="0.1"} 2',
+                'latency_bucket{view="a",le="1.0"} 3',
+                'latency_bucket{view="a",le="+Inf"} 4',
+                'latency_sum{view="a"} 3.65',
+                'latency_count{view="a"} 4',
+            ],
+        )
+
+    def test_counts_from_all_threads_are_kept(self):
+        counter = metrics.Counter(
+            "events_total", "Events.", ("kind",), registry=self.registry
+        )
+
+        def work():
+            for _ in range(1000):
+                counter.inc(kind="x")
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counter.inc(kind="x")
+        self.assertEqual(counter.collect(), {("x",): 8001})
+        self.assertEqual(len(counter._shards), 1)
+
+    def test_label_values_are_escaped(self):
+        counter = metrics.Counter(
+            "events_total", "Events.", ("kind",), registry=self.registry
+        )
+        counter.inc(kind='a"b\\c')
+        self.assertIn('events_total{kind="a\\"b\\\\c"} 1', self.registry.render())
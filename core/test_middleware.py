@@ -0,0 +1,88 @@
+import json
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from blog.tests.test_blog_views import AuthenticatedUserTestCase
+from core.factories import BlogPostFactory
+from core.middleware import RequestInstrumentationMiddleware, endpoint_stats
+
+
+class RequestInstrumentationMiddlewareTest(AuthenticatedUserTestCase):
+    def setUp(self):
+        super().setUp()
+        endpoint_stats.reset()
+        self.url = reverse("blog:list_blog_posts")
+
+    def test_server_timing_header(self):
+        BlogPostFactory(author=self.test_user)
+        response = self.client.get(self.url, format="json")
+        phases = {
+            entry.split(";")[0]: entry
+            for entry in response["Server-Timing"].split(", ")
+        }
+        self.assertEqual(list(phases), ["db", "view", "render", "total"])
+        self.assertIn('desc="2 queries"', phases["db"])
+
+    async def test_async_requests_count_queries(self):
+        token = await sync_to_async(AccessToken.for_user)(self.test_user)
+        response = await self.async_client.get(
+            self.url, headers={"Authorization": f"Bearer {token}"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('desc="1 queries"', response["Server-Timing"])
+
+    async def test_runs_natively_in_async_chains(self):
+        async def get_response(request):
+            return HttpResponse()
+
+        middleware = RequestInstrumentationMiddleware(get_response)
+        self.assertTrue(iscoroutinefunction(middleware))
+        response = await middleware(RequestFactory().get("/"))
+        self.assertIn("total;dur=", response["Server-Timing"])
+
+    def test_endpoint_percentiles(self):
+        for _ in range(3):
+            self.client.get(self.url, format="json")
+        stats = endpoint_stats.snapshot()["blog:list_blog_posts"]
+        self.assertEqual(stats["count"], 3)
+        self.assertLessEqual(stats["p50"], stats["p95"])
+        self.assertLessEqual(stats["p95"], stats["p99"])
+
+    @override_settings(
+        REQUEST_INSTRUMENTATION={
+            **settings.REQUEST_INSTRUMENTATION,
+            "SLOW_REQUEST_MS": 0,
+            "SLOW_QUERIES": 1,
+        }
+    )
+    def test_slow_requests_are_logged(self):
+        BlogPostFactory(author=self.test_user)
+        with self.assertLogs("core.requests", "WARNING") as logs:
+            self.client.get(self.url, format="json")
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record["endpoint"], "blog:list_blog_posts")
+        self.assertEqual(record["status"], 200)
+        self.assertEqual(record["queries"], 2)
+        self.assertEqual(len(record["slowest_queries"]), 1)
+        self.assertIn("SELECT", record["slowest_queries"][0]["sql"])
+
+    @override_settings(
+        REQUEST_INSTRUMENTATION={
+            **settings.REQUEST_INSTRUMENTATION,
+            "SLOW_REQUEST_MS": 0,
+        }
+    )
+    def test_excluded_endpoints_are_not_logged(self):
+        url = reverse("authentication:token_obtain_pair")
+        data = {"username": self.test_user.username, "password": "wrong"}
+        with self.assertNoLogs("core.requests", "WARNING"):
+            self.client.post(url, data, format="json")
+
+    def test_fast_requests_are_not_logged(self):
+        with self.assertNoLogs("core.requests", "WARNING"):
+            self.client.get(self.url, format="json")
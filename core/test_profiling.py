@@ -0,0 +1,109 @@
+import json
+import shutil
+import tempfile
+import threading
+import time
+from io import StringIO
+from pathlib import Path
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.profiling import StackSampler
+from core.tests import AuthenticationTestCase
+
+
+class ProfilingMiddlewareTest(AuthenticationTestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.directory)
+        profiling = override_settings(
+            REQUEST_PROFILING={
+                **settings.REQUEST_PROFILING,
+                "DIRECTORY": self.directory,
+                "INTERVAL": 0.0005,
+            }
+        )
+        profiling.enable()
+        self.addCleanup(profiling.disable)
+        self.url = reverse("blog:list_blog_posts")
+
+    def get(self, user, **extra):
+        token = AccessToken.for_user(user)
+        return self.client.get(self.url, HTTP_AUTHORIZATION=f"Bearer {token}", **extra)
+
+    def test_staff_can_profile_with_header(self):
+        staff = User.objects.create_user(username="staff", is_staff=True)
+        response = self.get(staff, HTTP_X_PROFILE="1")
+        profile_id = response["X-Profile-Id"]
+        directory = self.directory / "blog__list_blog_posts"
+        metadata = json.loads((directory / f"{profile_id}.json").read_text())
+        self.assertEqual(metadata["endpoint"], "blog:list_blog_posts")
+        self.assertEqual(metadata["trigger"], "header")
+        self.assertEqual(metadata["status"], 200)
+        self.assertTrue((directory / f"{profile_id}.folded").exists())
+
+    def test_header_is_ignored_for_other_users(self):
+        response = self.get(self.test_user, HTTP_X_PROFILE="1")
+        self.assertNotIn("X-Profile-Id", response)
+        self.assertEqual(list(self.directory.iterdir()), [])
+
+    def test_sampled_requests_are_profiled(self):
+        with self.settings(
+            REQUEST_PROFILING={**settings.REQUEST_PROFILING, "SAMPLE_RATE": 1.0}
+        ):
+            response = self.get(self.test_user)
+        self.assertIn("X-Profile-Id", response)
+
+    async def test_async_requests_are_profiled(self):
+        staff = await sync_to_async(User.objects.create_user)(
+            username="staff", is_staff=True
+        )
+        token = await sync_to_async(AccessToken.for_user)(staff)
+        response = await self.async_client.get(
+            self.url, headers={"Authorization": f"Bearer {token}", "X-Profile": "1"}
+        )
+        self.assertEqual(response.status_code, 200)
+        directory = self.directory / "blog__list_blog_posts"
+        self.assertTrue((directory / f"{response['X-Profile-Id']}.folded").exists())
+
+    def test_sampler_collects_collapsed_stacks(self):
+        def wait_for_samples():
+            time.sleep(0.05)
+
+        with StackSampler([threading.get_ident()], 0.001) as sampler:
+            wait_for_samples()
+        stack = sampler.stacks.most_common(1)[0][0]
+        self.assertIn("core.test_profiling:wait_for_samples:", stack.split(";")[-1])
+
+
+class AggregateProfilesCommandTest(AuthenticationTestCase):
+    def test_merges_profiles_per_endpoint(self):
+        directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, directory)
+        endpoint = directory / "blog__list_blog_posts"
+        endpoint.mkdir()
+        for profile_id, stacks, duration in (
+            ("a", "main;view;query 3\nmain;view;render 1\n", 10),
+            ("b", "main;view;query 2\n", 20),
+        ):
+            (endpoint / f"{profile_id}.folded").write_text(stacks)
+            (endpoint / f"{profile_id}.json").write_text(
+                json.dumps(
+                    {"endpoint": "blog:list_blog_posts", "duration_ms": duration}
+                )
+            )
+        out = StringIO()
+        call_command("aggregate_profiles", f"--directory={directory}", stdout=out)
+        self.assertIn("blog:list_blog_posts: 2 profiles, 6 samples", out.getvalue())
+        self.assertIn("83.3%  query", out.getvalue())
+        self.assertEqual(
+            (directory / "aggregated" / "blog__list_blog_posts.folded").read_text(),
+            "main;view;query 5\nmain;view;render 1\n",
+        )
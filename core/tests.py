@@ -1,13 +1,29 @@
+from django.conf import settings
 from django.contrib.auth.models import User
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from rest_framework.test import APIClient
 
+from authentication.authentication import user_cache
+from authentication.blacklist import blacklist_filter
 from authentication.models import LoginHistory
 
 
+# Slow request records would only clutter the test output; tests that check
+# them lower the threshold themselves.
+@override_settings(
+    LOGIN_HISTORY_WRITER={**settings.LOGIN_HISTORY_WRITER, "ASYNC": False},
+    REQUEST_INSTRUMENTATION={
+        **settings.REQUEST_INSTRUMENTATION,
+        "SLOW_REQUEST_MS": 60_000,
+    },
+)
 class AuthenticationTestCase(TestCase):
     def setUp(self):
+        cache.clear()
+        user_cache.clear()
+        blacklist_filter.reset()
         # Create a test user
         self.test_user_password = "TestPass123!"
         self.test_user = User.objects.create_user(
@@ -15,9 +15,13 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
 
+from core.views import metrics_view
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path(
@@ -29,4 +33,5 @@ urlpatterns = [
         include(("user_dashboard.urls", "user_dashboard"), namespace="user_dashboard"),
     ),
     path("api/", include(("blog.urls", "blog"), namespace="blog")),
-]
+    path("metrics", metrics_view, name="metrics"),
+] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
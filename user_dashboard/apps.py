@@ -1,6 +1,14 @@
+import atexit
+
 from django.apps import AppConfig
 
 
 class UserDashboardConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "user_dashboard"
+
+    def ready(self):
+        from user_dashboard import signals  # noqa: F401
+        from user_dashboard.thumbnails import pipeline
+
+        atexit.register(pipeline.shutdown)
@@ -0,0 +1,47 @@
+"""
+Pillow-only helpers for profile image variants.
+
+Nothing here imports Django, so :func:`render_variants` can run in a
+spawned worker process.
+"""
+
+import io
+
+from PIL import Image, ImageOps
+
+SAVE_OPTIONS = {
+    "webp": {"format": "WEBP", "method": 4},
+    "jpeg": {"format": "JPEG", "optimize": True, "progressive": True},
+}
+
+
+def render_file(path, sizes, formats, quality):
+    """Like :func:`render_variants`, reading the image from ``path``."""
+    with open(path, "rb") as image:
+        return render_variants(image.read(), sizes, formats, quality)
+
+
+def render_variants(data, sizes, formats, quality):
+    """
+    Resize the image in ``data`` to fit each ``{label: size}`` box and encode
+    it in every format. Metadata (EXIF, ICC, comments) is dropped.
+
+    Returns ``[(label, format, width, height, content), ...]``.
+    """
+    with Image.open(io.BytesIO(data)) as source:
+        image = ImageOps.exif_transpose(source)
+        image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+    variants = []
+    for label, size in sizes.items():
+        resized = image.copy()
+        resized.thumbnail((size, size), Image.Resampling.LANCZOS)
+        resized.info = {}
+        for fmt in formats:
+            output = resized
+            if fmt == "jpeg" and output.mode != "RGB":
+                output = Image.new("RGB", output.size, "white")
+                output.paste(resized, mask=resized.getchannel("A"))
+            buffer = io.BytesIO()
+            output.save(buffer, quality=quality, **SAVE_OPTIONS[fmt])
+            variants.append((label, fmt, *output.size, buffer.getvalue()))
+    return variants
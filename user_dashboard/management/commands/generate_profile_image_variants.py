@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+
+from user_dashboard.models import UserProfile
+from user_dashboard.thumbnails import needs_variants, pipeline
+
+
+class Command(BaseCommand):
+    help = "Render resized variants for profile images that lack them."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument(
+            "--force", action="store_true", help="Re-render existing variants."
+        )
+
+    def handle(self, *args, **options):
+        profiles = (
+            UserProfile.objects.exclude(profile_image="")
+            .exclude(profile_image__isnull=True)
+            .only("pk", "profile_image", "image_variants")
+            .order_by("pk")
+        )
+        processed = failed = 0
+        last_pk = 0
+        while batch := list(profiles.filter(pk__gt=last_pk)[: options["batch_size"]]):
+            last_pk = batch[-1].pk
+            jobs = [
+                (profile.pk, profile.profile_image.name)
+                for profile in batch
+                if options["force"] or needs_variants(profile)
+            ]
+            async_ = pipeline.options["ASYNC"]
+            futures = [
+                pipeline.submit(source) if async_ else None for _, source in jobs
+            ]
+            for (pk, source), future in zip(jobs, futures):
+                try:
+                    variants = future.result() if future else pipeline.render(source)
+                    pipeline.store(pk, source, variants)
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f"profile {pk}: {e}")
+                else:
+                    processed += 1
+        pipeline.shutdown()
+        self.stdout.write(
+            self.style.SUCCESS(f"Generated variants for {processed} profiles.")
+        )
+        if failed:
+            self.stdout.write(self.style.WARNING(f"{failed} profiles failed."))
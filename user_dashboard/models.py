@@ -10,6 +10,7 @@ class UserProfile(models.Model):
     )
     location = models.CharField(max_length=100, blank=True, null=True)
     date_of_birth = models.DateField(blank=True, null=True)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
 
     def __str__(self):
         return f"Profile of {self.user.username}"
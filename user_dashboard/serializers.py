@@ -1,30 +1,67 @@
 from django.contrib.auth.models import User
+from django.core.files.storage import default_storage
 from rest_framework import serializers
 
 from user_dashboard.models import UserProfile
+from user_dashboard.summary import get_summary
+
+
+def save_changed_fields(instance, data):
+    changed = [key for key, val in data.items() if getattr(instance, key) != val]
+    for key in changed:
+        setattr(instance, key, data[key])
+    if changed:
+        instance.save(update_fields=changed)
 
 
 class UserProfileSerializer(serializers.ModelSerializer):
+    image_variants = serializers.SerializerMethodField()
+
     class Meta:
         model = UserProfile
-        fields = ["id", "bio", "location", "date_of_birth"]
+        fields = ["id", "bio", "location", "date_of_birth", "image_variants"]
+
+    def get_image_variants(self, profile):
+        request = self.context.get("request")
+        variants = {}
+        for label, formats in profile.image_variants.get("variants", {}).items():
+            for fmt, variant in formats.items():
+                url = default_storage.url(variant["name"])
+                variants.setdefault(label, {})[fmt] = {
+                    "url": request.build_absolute_uri(url) if request else url,
+                    "width": variant["width"],
+                    "height": variant["height"],
+                }
+        return variants
+
+
+class SummaryCountSerializer(serializers.Serializer):
+    id = serializers.IntegerField(allow_null=True)
+    name = serializers.CharField(allow_null=True)
+    count = serializers.IntegerField()
+
+
+class DashboardSummarySerializer(serializers.Serializer):
+    post_count = serializers.IntegerField()
+    posts_per_category = SummaryCountSerializer(many=True)
+    top_tags = SummaryCountSerializer(many=True)
+    last_login = serializers.DateTimeField(allow_null=True)
+    logins_last_30_days = serializers.IntegerField()
 
 
 class DashboardSerializer(serializers.ModelSerializer):
     profile = UserProfileSerializer()
+    summary = serializers.SerializerMethodField()
 
     class Meta:
         model = User
-        fields = ["id", "username", "profile", "first_name", "last_name"]
+        fields = ["id", "username", "profile", "first_name", "last_name", "summary"]
+
+    def get_summary(self, user):
+        return DashboardSummarySerializer(get_summary(user)).data
 
     def update(self, instance, validated_data):
-        profile = instance.profile
-        profile_data = validated_data.pop("profile")
-        for key, val in profile_data.items():
-            setattr(profile, key, val)
-        profile.save()
-        user = instance
-        for key, val in validated_data.items():
-            setattr(user, key, val)
-        user.save()
-        return user
+        profile_data = validated_data.pop("profile", {})
+        save_changed_fields(instance.profile, profile_data)
+        save_changed_fields(instance, validated_data)
+        return instance
@@ -0,0 +1,44 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from authentication.signals import login_history_written
+from blog.models import BlogPost
+from blog.signals import posts_bulk_created
+from user_dashboard.models import UserProfile
+from user_dashboard.summary import invalidate_summaries
+from user_dashboard.thumbnails import needs_variants, pipeline
+
+
+@receiver(post_save, sender=UserProfile)
+def generate_profile_image_variants(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and "profile_image" not in update_fields:
+        return
+    if needs_variants(instance):
+        pipeline.schedule(instance)
+
+
+@receiver(post_save, sender=BlogPost)
+@receiver(post_delete, sender=BlogPost)
+def invalidate_author_summary(sender, instance, **kwargs):
+    invalidate_summaries([instance.author_id])
+
+
+@receiver(m2m_changed, sender=BlogPost.tags.through)
+def invalidate_tagged_author_summaries(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if not reverse:
+        if action.startswith("post_"):
+            invalidate_summaries([instance.author_id])
+    elif action in ("post_add", "post_remove"):
+        posts = BlogPost.objects.filter(pk__in=pk_set)
+        invalidate_summaries(set(posts.values_list("author_id", flat=True)))
+    elif action == "pre_clear":
+        posts = BlogPost.objects.filter(tags=instance)
+        invalidate_summaries(set(posts.values_list("author_id", flat=True)))
+
+
+@receiver(posts_bulk_created)
+@receiver(login_history_written)
+def invalidate_user_summaries(sender, user_ids, **kwargs):
+    invalidate_summaries(user_ids)
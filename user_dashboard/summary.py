@@ -0,0 +1,128 @@
+from datetime import date, timedelta
+from datetime import timezone as dt_timezone
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from authentication.login_history import utc_date, utc_day_start
+from authentication.models import LoginDailyRollup, LoginHistory
+from blog.cache import get_versions
+from blog.models import BlogPost, BlogTag
+
+SUMMARY_KEY = "dashboard:summary:{}"
+TOP_TAGS = 5
+RECENT_LOGIN_DAYS = 30
+
+
+def login_activity(user):
+    """
+    Return the last login and the recent login count of ``user``.
+
+    Raw rows answer for the days they still cover. Days that compaction has
+    already folded away, i.e. before the earliest remaining raw row, are
+    counted from the daily rollups. Rollups count whole UTC days, and when
+    no raw rows are left the last login becomes the start of the last day
+    with logins.
+    """
+    since = timezone.now() - timedelta(days=RECENT_LOGIN_DAYS)
+    raw = LoginHistory.objects.filter(user=OuterRef("pk"))
+    rollups = LoginDailyRollup.objects.filter(user=OuterRef("pk"))
+    first_raw_day = TruncDate(
+        Subquery(
+            LoginHistory.objects.filter(user=OuterRef(OuterRef("pk")))
+            .order_by("login_datetime")
+            .values("login_datetime")[:1]
+        ),
+        tzinfo=dt_timezone.utc,
+    )
+    activity = (
+        User.objects.filter(pk=user.pk)
+        .values(
+            last_raw=Subquery(
+                raw.order_by("-login_datetime").values("login_datetime")[:1]
+            ),
+            recent_raw=Subquery(
+                raw.filter(login_datetime__gte=since)
+                .values("user")
+                .annotate(count=Count("id"))
+                .values("count")
+            ),
+            last_rollup=Subquery(rollups.order_by("-date").values("date")[:1]),
+            recent_rollups=Subquery(
+                rollups.filter(
+                    date__gte=utc_date(since),
+                    date__lt=Coalesce(first_raw_day, Value(date.max)),
+                )
+                .values("user")
+                .annotate(count=Sum("login_count"))
+                .values("count")
+            ),
+        )
+        .get()
+    )
+    last_login = activity["last_raw"]
+    if last_login is None and activity["last_rollup"] is not None:
+        last_login = utc_day_start(activity["last_rollup"])
+    return {
+        "last_login": last_login,
+        "recent": (activity["recent_raw"] or 0) + (activity["recent_rollups"] or 0),
+    }
+
+
+def build_summary(user):
+    categories = list(
+        BlogPost.objects.filter(author=user)
+        .values("category_id", "category__name")
+        .annotate(count=Count("id"))
+        .order_by("-count", "category__name")
+    )
+    top_tags = (
+        BlogTag.objects.filter(posts__author=user)
+        .annotate(count=Count("posts"))
+        .order_by("-count", "name")
+        .values("id", "name", "count")[:TOP_TAGS]
+    )
+    logins = login_activity(user)
+    return {
+        "post_count": sum(row["count"] for row in categories),
+        "posts_per_category": [
+            {
+                "id": row["category_id"],
+                "name": row["category__name"],
+                "count": row["count"],
+            }
+            for row in categories
+        ],
+        "top_tags": list(top_tags),
+        "last_login": logins["last_login"],
+        "logins_last_30_days": logins["recent"],
+    }
+
+
+def get_summary(user):
+    """
+    Return the cached summary of ``user``, rebuilding it when missing or
+    when tags or categories were renamed since it was cached.
+    """
+    key = SUMMARY_KEY.format(user.pk)
+    versions = get_versions(["tag", "category"])
+    cached = cache.get(key)
+    if cached is not None and cached[0] == versions:
+        return cached[1]
+    summary = build_summary(user)
+    cache.set(key, (versions, summary), settings.DASHBOARD_SUMMARY_CACHE_TIMEOUT)
+    return summary
+
+
+def invalidate_summaries(user_ids):
+    keys = [SUMMARY_KEY.format(user_id) for user_id in user_ids if user_id]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1,128 @@
+from datetime import timedelta
+from datetime import timezone as dt_timezone
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+
+from authentication.login_history import compact, record_login
+from authentication.models import LoginDailyRollup, LoginHistory
+from blog.bulk import import_posts
+from blog.models import BlogPost
+from core.factories import BlogCategoryFactory, BlogPostFactory, BlogTagFactory
+from core.tests import AuthenticationTestCase
+from user_dashboard.models import UserProfile
+
+
+class DashboardSummaryTest(AuthenticationTestCase):
+    def setUp(self):
+        super().setUp()
+        UserProfile.objects.create(user=self.test_user)
+        self.client.force_authenticate(self.test_user)
+        self.url = reverse("user_dashboard:dashboard")
+
+    def get_summary(self):
+        return self.client.get(self.url, format="json").json()["summary"]
+
+    def test_summary_is_built_from_aggregates(self):
+        python, django = BlogTagFactory(name="python"), BlogTagFactory(name="django")
+        news = BlogCategoryFactory(name="news")
+        BlogPostFactory(author=self.test_user, category=news).tags.set([python])
+        BlogPostFactory(author=self.test_user, category=news).tags.set([python, django])
+        BlogPostFactory(author=self.test_user, category=None)
+        other = User.objects.create_user(username="other", password="x")
+        BlogPostFactory(author=other).tags.set([django])
+        LoginHistory.objects.create(
+            user=self.test_user, login_datetime=timezone.now() - timedelta(days=40)
+        )
+        latest = LoginHistory.objects.create(user=self.test_user)
+        with self.assertNumQueries(4):
+            summary = self.get_summary()
+        self.assertEqual(summary["post_count"], 3)
+        self.assertEqual(
+            summary["posts_per_category"],
+            [
+                {"id": news.id, "name": "news", "count": 2},
+                {"id": None, "name": None, "count": 1},
+            ],
+        )
+        self.assertEqual(
+            summary["top_tags"],
+            [
+                {"id": python.id, "name": "python", "count": 2},
+                {"id": django.id, "name": "django", "count": 1},
+            ],
+        )
+        self.assertEqual(
+            summary["last_login"],
+            latest.login_datetime.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+        )
+        self.assertEqual(summary["logins_last_30_days"], 1)
+
+    def test_summary_is_cached(self):
+        self.get_summary()
+        with self.assertNumQueries(1):
+            self.get_summary()
+
+    def test_post_writes_invalidate_summary(self):
+        self.assertEqual(self.get_summary()["post_count"], 0)
+        post = BlogPostFactory(author=self.test_user)
+        self.assertEqual(self.get_summary()["post_count"], 1)
+        tag = BlogTagFactory()
+        tag.posts.add(post)
+        self.assertEqual(self.get_summary()["top_tags"][0]["id"], tag.id)
+        post.delete()
+        self.assertEqual(self.get_summary()["post_count"], 0)
+
+    def test_bulk_import_invalidates_summary(self):
+        self.get_summary()
+        import_posts(
+            [{"title": "Imported", "content": "Body"}], author_id=self.test_user.id
+        )
+        self.assertEqual(self.get_summary()["post_count"], 1)
+
+    def test_login_invalidates_summary(self):
+        self.assertEqual(self.get_summary()["logins_last_30_days"], 0)
+        record_login(self.test_user, "127.0.0.1", "agent")
+        self.assertEqual(self.get_summary()["logins_last_30_days"], 1)
+
+    def test_login_activity_falls_back_to_rollups(self):
+        now = timezone.now()
+        for days in (3, 3, 45):
+            LoginHistory.objects.create(
+                user=self.test_user, login_datetime=now - timedelta(days=days)
+            )
+        compact(now)
+        self.assertFalse(LoginHistory.objects.exists())
+        self.assertEqual(LoginDailyRollup.objects.count(), 2)
+        summary = self.get_summary()
+        last_day = (now - timedelta(days=3)).astimezone(dt_timezone.utc).date()
+        self.assertEqual(summary["last_login"], f"{last_day}T00:00:00Z")
+        self.assertEqual(summary["logins_last_30_days"], 2)
+
+    def test_recent_logins_span_raw_rows_and_rollups(self):
+        now = timezone.now()
+        for days in (1, 2, 10, 10, 20, 40):
+            LoginHistory.objects.create(
+                user=self.test_user, login_datetime=now - timedelta(days=days)
+            )
+        compact(now - timedelta(days=7))
+        self.assertEqual(LoginHistory.objects.count(), 2)
+        summary = self.get_summary()
+        self.assertEqual(summary["logins_last_30_days"], 5)
+        self.assertEqual(
+            summary["last_login"],
+            LoginHistory.objects.latest("login_datetime").login_datetime.strftime(
+                "%Y-%m-%dT%H:%M:%S.%fZ"
+            ),
+        )
+
+    def test_category_rename_refreshes_summary(self):
+        category = BlogCategoryFactory(name="old")
+        BlogPost.objects.bulk_create(
+            [BlogPostFactory.build(author=self.test_user, category=category)]
+        )
+        self.assertEqual(self.get_summary()["posts_per_category"][0]["name"], "old")
+        category.name = "new"
+        category.save()
+        self.assertEqual(self.get_summary()["posts_per_category"][0]["name"], "new")
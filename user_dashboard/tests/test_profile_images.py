@@ -0,0 +1,155 @@
+import io
+import shutil
+import tempfile
+import threading
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+from PIL import Image
+
+from core.tests import AuthenticationTestCase
+from user_dashboard.models import UserProfile
+from user_dashboard.thumbnails import pipeline
+
+
+def jpeg_upload(size=(1200, 800)):
+    exif = Image.Exif()
+    exif[0x010F] = "Camera maker"
+    buffer = io.BytesIO()
+    Image.new("RGB", size, "red").save(buffer, format="JPEG", exif=exif)
+    return SimpleUploadedFile("avatar.jpg", buffer.getvalue(), "image/jpeg")
+
+
+def pipeline_settings(**options):
+    return override_settings(
+        PROFILE_IMAGE_PIPELINE={**settings.PROFILE_IMAGE_PIPELINE, **options}
+    )
+
+
+def use_temporary_media(test):
+    media_root = tempfile.mkdtemp()
+    test.addCleanup(shutil.rmtree, media_root)
+    media = override_settings(MEDIA_ROOT=media_root)
+    media.enable()
+    test.addCleanup(media.disable)
+
+
+@pipeline_settings(ASYNC=False, SIZES={"small": 64, "large": 640})
+class ProfileImageVariantsTest(AuthenticationTestCase):
+    def setUp(self):
+        super().setUp()
+        use_temporary_media(self)
+
+    def create_profile(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            return UserProfile.objects.create(
+                user=self.test_user, profile_image=jpeg_upload()
+            )
+
+    def test_variants_are_generated_on_upload(self):
+        profile = self.create_profile()
+        profile.refresh_from_db()
+        variants = profile.image_variants["variants"]
+        self.assertEqual(profile.image_variants["source"], profile.profile_image.name)
+        self.assertEqual(set(variants), {"small", "large"})
+        self.assertEqual(set(variants["large"]), {"webp", "jpeg"})
+        self.assertEqual(
+            (variants["large"]["jpeg"]["width"], variants["large"]["jpeg"]["height"]),
+            (640, 427),
+        )
+        with default_storage.open(variants["small"]["jpeg"]["name"]) as file:
+            with Image.open(file) as image:
+                self.assertEqual(image.size, (64, 43))
+                self.assertFalse(image.getexif())
+        with default_storage.open(variants["small"]["webp"]["name"]) as file:
+            with Image.open(file) as image:
+                self.assertEqual(image.format, "WEBP")
+
+    def test_variant_urls_are_exposed(self):
+        profile = self.create_profile()
+        self.client.force_authenticate(self.test_user)
+        response = self.client.get(reverse("user_dashboard:dashboard"))
+        variants = response.json()["profile"]["image_variants"]
+        profile.refresh_from_db()
+        name = profile.image_variants["variants"]["small"]["webp"]["name"]
+        self.assertEqual(
+            variants["small"]["webp"],
+            {
+                "url": f"http://testserver{settings.MEDIA_URL}{name}",
+                "width": 64,
+                "height": 43,
+            },
+        )
+
+    def test_saving_other_fields_does_not_regenerate(self):
+        profile = self.create_profile()
+        profile.refresh_from_db()
+        variants = profile.image_variants
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            profile.bio = "new bio"
+            profile.save()
+        self.assertEqual(callbacks, [])
+        profile.refresh_from_db()
+        self.assertEqual(profile.image_variants, variants)
+
+    @pipeline_settings(ASYNC=True, MAX_WORKERS=1, SIZES={"small": 64})
+    def test_backfill_command(self):
+        profile = UserProfile.objects.create(user=self.test_user)
+        profile.profile_image.save("avatar.jpg", jpeg_upload(), save=False)
+        UserProfile.objects.filter(pk=profile.pk).update(
+            profile_image=profile.profile_image.name
+        )
+        out = StringIO()
+        call_command("generate_profile_image_variants", stdout=out)
+        self.assertIn("Generated variants for 1 profiles.", out.getvalue())
+        profile.refresh_from_db()
+        self.assertEqual(
+            profile.image_variants["variants"]["small"]["webp"]["width"], 64
+        )
+
+
+@pipeline_settings(ASYNC=True, MAX_WORKERS=1, SIZES={"small": 64})
+class AsyncProfileImageVariantsTest(TransactionTestCase):
+    def setUp(self):
+        use_temporary_media(self)
+        self.addCleanup(pipeline.shutdown)
+        self.user = User.objects.create_user(username="async", password="x")
+
+    def test_variants_are_stored_by_the_pipeline_thread(self):
+        store = pipeline.store
+        threads = []
+
+        def record_thread(*args):
+            threads.append(threading.current_thread().name)
+            store(*args)
+
+        with mock.patch.object(pipeline, "store", record_thread):
+            with mock.patch.object(pipeline, "_read") as read:
+                profile = UserProfile.objects.create(
+                    user=self.user, profile_image=jpeg_upload()
+                )
+                pipeline.shutdown()
+        read.assert_not_called()
+        self.assertEqual(threads, ["profile-image-variants"])
+        profile.refresh_from_db()
+        self.assertEqual(
+            profile.image_variants["variants"]["small"]["jpeg"]["width"], 64
+        )
+
+    def test_jobs_are_rendered_inline_once_the_pool_refuses_work(self):
+        with mock.patch.object(pipeline, "submit", side_effect=RuntimeError):
+            profile = UserProfile.objects.create(
+                user=self.user, profile_image=jpeg_upload()
+            )
+            pipeline.shutdown()
+        profile.refresh_from_db()
+        self.assertEqual(
+            profile.image_variants["variants"]["small"]["jpeg"]["width"], 64
+        )
@@ -1,4 +1,8 @@
+from unittest import mock
+
 from django.contrib.auth.models import User
+from django.db import DatabaseError, connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 
@@ -26,6 +30,9 @@ class UserDashboardViewsTest(AuthenticationTestCase):
         self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
         response = self.client.get(url, format="json")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        login_datetime = LoginHistory.objects.get().login_datetime.strftime(
+            "%Y-%m-%dT%H:%M:%S.%fZ"
+        )
         expected = {
             "id": self.test_user.id,
             "username": f"{self.test_user.username}",
@@ -36,6 +43,14 @@ class UserDashboardViewsTest(AuthenticationTestCase):
                 "bio": f"{test_user_profile.bio}",
                 "location": f"{test_user_profile.location}",
                 "date_of_birth": f"{test_user_profile.date_of_birth}",
+                "image_variants": {},
+            },
+            "summary": {
+                "post_count": 0,
+                "posts_per_category": [],
+                "top_tags": [],
+                "last_login": login_datetime,
+                "logins_last_30_days": 1,
             },
         }
         self.assertEqual(response.json(), expected)
@@ -68,6 +83,9 @@ class UserDashboardViewsTest(AuthenticationTestCase):
         }
         response = self.client.patch(url, data, format="json")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        login_datetime = LoginHistory.objects.get().login_datetime.strftime(
+            "%Y-%m-%dT%H:%M:%S.%fZ"
+        )
         expected = {
             "id": self.test_user.id,
             "username": f'{data["username"]}',
@@ -78,6 +96,68 @@ class UserDashboardViewsTest(AuthenticationTestCase):
                 "bio": f'{data["profile"]["bio"]}',
                 "location": f'{data["profile"]["location"]}',
                 "date_of_birth": f'{data["profile"]["date_of_birth"]}',
+                "image_variants": {},
+            },
+            "summary": {
+                "post_count": 0,
+                "posts_per_category": [],
+                "top_tags": [],
+                "last_login": login_datetime,
+                "logins_last_30_days": 1,
             },
         }
         self.assertEqual(response.json(), expected)
+
+    def test_dashboard_is_read_in_one_query(self):
+        UserProfile.objects.create(user=self.test_user, bio="bio123")
+        self.client.force_authenticate(self.test_user)
+        url = reverse("user_dashboard:dashboard")
+        # One query for the user and profile, three for the uncached summary.
+        with self.assertNumQueries(4):
+            response = self.client.get(url, format="json")
+        self.assertEqual(response.json()["profile"]["bio"], "bio123")
+
+    def test_cached_dashboard_is_read_in_one_query(self):
+        UserProfile.objects.create(user=self.test_user, bio="bio123")
+        self.client.force_authenticate(self.test_user)
+        url = reverse("user_dashboard:dashboard")
+        self.client.get(url, format="json")
+        with self.assertNumQueries(1):
+            response = self.client.get(url, format="json")
+        self.assertEqual(response.json()["profile"]["bio"], "bio123")
+
+    def test_dashboard_provisions_missing_profile(self):
+        self.client.force_authenticate(self.test_user)
+        url = reverse("user_dashboard:dashboard")
+        response = self.client.get(url, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        profile = UserProfile.objects.get(user=self.test_user)
+        self.assertEqual(response.json()["profile"]["id"], profile.id)
+
+    def test_failed_update_rolls_back_provisioned_profile(self):
+        self.client.force_authenticate(self.test_user)
+        url = reverse("user_dashboard:dashboard")
+        data = {"first_name": "New", "profile": {"bio": "newbio"}}
+        with mock.patch.object(User, "save", side_effect=DatabaseError):
+            with self.assertRaises(DatabaseError):
+                self.client.patch(url, data, format="json")
+        self.assertFalse(UserProfile.objects.filter(user=self.test_user).exists())
+
+    def test_partial_update_writes_only_changed_columns(self):
+        UserProfile.objects.create(
+            user=self.test_user, bio="bio123", location="location123"
+        )
+        self.client.force_authenticate(self.test_user)
+        url = reverse("user_dashboard:dashboard")
+        data = {"profile": {"bio": "newbio", "location": "location123"}}
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.patch(url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        updates = [
+            query["sql"] for query in context if query["sql"].startswith("UPDATE")
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"bio"', updates[0])
+        self.assertNotIn('"location"', updates[0])
+        self.assertEqual(response.json()["profile"]["bio"], "newbio")
+        self.assertEqual(response.json()["username"], self.test_user.username)
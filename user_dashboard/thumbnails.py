@@ -0,0 +1,195 @@
+import logging
+import multiprocessing
+import posixpath
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
+
+from user_dashboard.imaging import render_file, render_variants
+from user_dashboard.models import UserProfile
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class ThumbnailPipeline:
+    """
+    Generate resized variants of profile images off the request path.
+
+    Workers in a process pool read the source and render it. A daemon
+    thread in the parent submits the jobs, writes the files and records
+    them on ``UserProfile.image_variants``, so neither the request thread
+    nor the pool's callback thread touches storage or the database. With
+    ``ASYNC`` disabled (as in tests) variants are rendered inline.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._jobs = None
+        self._thread = None
+
+    @property
+    def options(self):
+        return settings.PROFILE_IMAGE_PIPELINE
+
+    def schedule(self, profile):
+        transaction.on_commit(
+            partial(self.process, profile.pk, profile.profile_image.name)
+        )
+
+    def process(self, profile_id, source):
+        if not self.options["ASYNC"]:
+            self.store(profile_id, source, self.render(source))
+            return
+        jobs = self._ensure_started()
+        jobs.put(partial(self._submit_job, jobs, profile_id, source))
+
+    def render(self, source):
+        return render_variants(self._read(source), *self._render_options())
+
+    def submit(self, source):
+        executor = self._get_executor()
+        try:
+            path = default_storage.path(source)
+        except NotImplementedError:
+            # Remote storages cannot be opened from the worker.
+            return executor.submit(
+                render_variants, self._read(source), *self._render_options()
+            )
+        return executor.submit(render_file, path, *self._render_options())
+
+    def store(self, profile_id, source, variants):
+        """Save rendered variants unless the profile image changed meanwhile."""
+        stem = posixpath.splitext(posixpath.basename(source))[0]
+        directory = posixpath.join(self.options["DIRECTORY"], str(profile_id))
+        saved = {}
+        for label, fmt, width, height, content in variants:
+            name = default_storage.save(
+                posixpath.join(directory, f"{stem}-{label}.{fmt}"),
+                ContentFile(content),
+            )
+            saved.setdefault(label, {})[fmt] = {
+                "name": name,
+                "width": width,
+                "height": height,
+            }
+        with transaction.atomic():
+            profile = (
+                UserProfile.objects.select_for_update()
+                .filter(pk=profile_id, profile_image=source)
+                .first()
+            )
+            if profile is None:
+                stale = saved
+            else:
+                stale = profile.image_variants.get("variants", {})
+                profile.image_variants = {"source": source, "variants": saved}
+                profile.save(update_fields=["image_variants"])
+        for formats in stale.values():
+            for variant in formats.values():
+                default_storage.delete(variant["name"])
+
+    def shutdown(self, timeout=None):
+        """Finish every scheduled job, then stop the thread and the pool."""
+        with self._lock:
+            thread, jobs = self._thread, self._jobs
+            self._thread = None
+        if thread is None:
+            self._shutdown_executor()
+            return
+        jobs.put(_STOP)
+        thread.join(timeout)
+
+    def _read(self, source):
+        with default_storage.open(source, "rb") as image:
+            return image.read()
+
+    def _render_options(self):
+        options = self.options
+        return options["SIZES"], options["FORMATS"], options["QUALITY"]
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.options["MAX_WORKERS"],
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _shutdown_executor(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None:
+                self._jobs = queue.Queue()
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(self._jobs,),
+                    name="profile-image-variants",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._jobs
+
+    def _run(self, jobs):
+        while (job := jobs.get()) is not _STOP:
+            self._run_job(job)
+        # Let the pool finish; its callbacks queue the remaining stores.
+        self._shutdown_executor()
+        while True:
+            try:
+                job = jobs.get_nowait()
+            except queue.Empty:
+                return
+            self._run_job(job)
+
+    def _run_job(self, job):
+        try:
+            job()
+        except Exception:
+            logger.exception("Could not generate profile image variants")
+        finally:
+            connection.close()
+
+    def _submit_job(self, jobs, profile_id, source):
+        try:
+            future = self.submit(source)
+        except RuntimeError:
+            # The pool refuses new work once the interpreter starts exiting,
+            # before atexit runs shutdown(); finish the job here instead.
+            self.store(profile_id, source, self.render(source))
+            return
+        # Runs in the pool's management thread: only hand the result over.
+        future.add_done_callback(
+            lambda future: jobs.put(
+                partial(self._store_result, profile_id, source, future)
+            )
+        )
+
+    def _store_result(self, profile_id, source, future):
+        try:
+            self.store(profile_id, source, future.result())
+        except Exception:
+            logger.exception("Could not generate variants of %s", source)
+
+
+def needs_variants(profile):
+    return bool(profile.profile_image) and (
+        profile.image_variants.get("source") != profile.profile_image.name
+    )
+
+
+pipeline = ThumbnailPipeline()
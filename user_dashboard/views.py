@@ -1,3 +1,5 @@
+from django.contrib.auth.models import User
+from django.db import transaction
 from django.shortcuts import render
 from rest_framework import generics, permissions
 
@@ -10,4 +12,13 @@ class DashboardView(generics.RetrieveUpdateAPIView):
     serializer_class = DashboardSerializer
 
     def get_object(self):
-        return self.request.user
+        user = User.objects.select_related("profile").get(pk=self.request.user.pk)
+        if not hasattr(user, "profile"):
+            user.profile, _ = UserProfile.objects.get_or_create(user=user)
+        return user
+
+    def update(self, request, *args, **kwargs):
+        # Provision the profile and apply the changes in one transaction, so
+        # a failed update does not leave a half-initialised dashboard behind.
+        with transaction.atomic():
+            return super().update(request, *args, **kwargs)